@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Line Index Microbenchmark
+
+Times building the offset -> line table for the largest wireframe SVGs:
+the old per-character Python loop (validate.py before LineIndex) against
+the bulk scans considered for svg_document.LineIndex. Every variant is
+checked to produce identical offsets before it is timed (the byte-offset
+variant only where the file is ASCII).
+
+Usage:
+    python bench-line-index.py                 # 5 largest SVGs under the project
+    python bench-line-index.py --top 10        # 10 largest
+    python bench-line-index.py path/to/a.svg   # Specific files
+"""
+
+import re
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, List
+
+from svg_document import LineIndex
+
+_NEWLINE_RE = re.compile('\n')
+
+
+def per_character_loop(text: str) -> List[int]:
+    """The original WireframeValidator._build_line_offsets."""
+    offsets = [0]
+    for i, char in enumerate(text):
+        if char == '\n':
+            offsets.append(i + 1)
+    return offsets
+
+
+def str_find_loop(text: str) -> List[int]:
+    offsets = [0]
+    find = text.find
+    pos = find('\n')
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = find('\n', pos + 1)
+    return offsets
+
+
+def bytes_find_loop(text: str) -> List[int]:
+    """Same loop over the UTF-8 bytes (offsets are byte offsets).
+
+    Includes the encode, since callers hold str. Only equal to character
+    offsets for ASCII files; shown for comparison.
+    """
+    data = text.encode()
+    offsets = [0]
+    find = data.find
+    pos = find(b'\n')
+    while pos != -1:
+        offsets.append(pos + 1)
+        pos = find(b'\n', pos + 1)
+    return offsets
+
+
+def regex_finditer(text: str) -> List[int]:
+    return [0, *(m.end() for m in _NEWLINE_RE.finditer(text))]
+
+
+def line_index(text: str) -> List[int]:
+    """What the validator and inspector use now."""
+    return LineIndex(text).offsets
+
+
+VARIANTS: List[Callable[[str], List[int]]] = [
+    per_character_loop,
+    str_find_loop,
+    bytes_find_loop,
+    regex_finditer,
+    line_index,
+]
+
+
+def _find_project_root(start: Path) -> Path:
+    for candidate in (start, *start.parents):
+        if (candidate / 'package.json').is_file() and (candidate / 'features').is_dir():
+            return candidate
+    return start
+
+
+def largest_svgs(root: Path, top: int) -> List[Path]:
+    svgs = [p for p in root.glob('**/*.svg')
+            if 'node_modules' not in p.parts and 'includes' not in p.parts]
+    return sorted(svgs, key=lambda p: p.stat().st_size, reverse=True)[:top]
+
+
+def main():
+    args = sys.argv[1:]
+    top = 5
+    if '--top' in args:
+        i = args.index('--top')
+        try:
+            top = int(args[i + 1])
+        except (IndexError, ValueError):
+            print("ERROR: --top requires a number")
+            sys.exit(1)
+        del args[i:i + 2]
+
+    if args:
+        files = [Path(a) for a in args]
+    else:
+        root = _find_project_root(Path(__file__).resolve().parent)
+        files = largest_svgs(root / 'features', top) + largest_svgs(root / 'docs', top)
+        files = sorted(files, key=lambda p: p.stat().st_size, reverse=True)[:top]
+
+    if not files:
+        print("No SVG files found.")
+        sys.exit(1)
+
+    print(f"{'file':<48} {'KB':>7} {'lines':>6}  " + "  ".join(f"{v.__name__:>18}" for v in VARIANTS))
+    totals = {v.__name__: 0.0 for v in VARIANTS}
+    for path in files:
+        text = path.read_text()
+        expected = per_character_loop(text)
+        cells = []
+        for variant in VARIANTS:
+            result = variant(text)
+            if result != expected and not (variant is bytes_find_loop and not text.isascii()):
+                print(f"ERROR: {variant.__name__} disagrees on {path}")
+                sys.exit(1)
+            runs = max(1, int(200_000 / max(len(text), 1)))
+            best = min(timeit.repeat(lambda variant=variant, text=text: variant(text), number=runs, repeat=5)) / runs
+            totals[variant.__name__] += best
+            cells.append(f"{best * 1e6:>15.1f} us")
+        name = path.name if len(path.name) <= 48 else path.name[:45] + "..."
+        print(f"{name:<48} {len(text) / 1024:>7.1f} {len(expected):>6}  " + "  ".join(cells))
+
+    baseline = totals[per_character_loop.__name__]
+    print()
+    for variant in VARIANTS:
+        total = totals[variant.__name__]
+        print(f"  {variant.__name__:<20} {total * 1000:>8.3f} ms total   {baseline / total:>6.1f}x vs per-character loop")
+
+
+if __name__ == '__main__':
+    main()
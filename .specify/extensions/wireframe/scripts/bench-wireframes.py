@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+Wireframe Toolchain Benchmark
+
+Generates synthetic wireframe corpora and times the toolchain on them, so a
+slow new _check_* rule (or any other regression) shows up as a number
+instead of going unnoticed.
+
+Corpora are built from the standards the tools themselves encode: mockup,
+panel and viewBox geometry from svg-autofix.py's STANDARDS, colors, include
+hrefs, annotation columns and the mobile safe area from validate.py. The
+title sits at y=28 like the inspector expects (STANDARDS still says 32).
+A seeded fraction of files gets one typical defect so failure paths run too.
+
+Each tool is timed end to end (its CLI in a subprocess, best of --repeat)
+and per phase (in-process, one pass):
+- validate.py            (parse) plus every rule, via RuleProfile
+- inspect-wireframes.py  extract / check_patterns / find_oddballs
+- svg-autofix.py         read / check / fix (in-process only: its CLI is
+                         hardwired to docs/design/wireframes)
+- generate-manifest.py   discover / build / serialize
+
+Usage:
+    python bench-wireframes.py                            # 100-SVG corpus
+    python bench-wireframes.py --sizes 100,1000,10000     # Several sizes
+    python bench-wireframes.py --callouts 12 --annotations 8 --elements 40
+    python bench-wireframes.py --save-baseline bench.json # Record a baseline
+    python bench-wireframes.py --compare bench.json       # Fail on regressions
+    python bench-wireframes.py --generate-only /tmp/wf --sizes 1000
+
+Corpora are cached under <project>/.cache/wireframe-bench/ and reused while
+the generator parameters (and this file) are unchanged.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, List
+
+import validate
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+
+def _find_project_root(start: Path) -> Path:
+    for candidate in (start, *start.parents):
+        if (candidate / 'package.json').is_file() and (candidate / 'features').is_dir():
+            return candidate
+    return start
+
+
+PROJECT_ROOT = _find_project_root(SCRIPT_DIR)
+CACHE_DIR = PROJECT_ROOT / '.cache' / 'wireframe-bench'
+
+TOOLS = ['validate', 'inspect', 'autofix', 'manifest']
+
+FILES_PER_FEATURE = 6
+CATEGORIES = ['foundation', 'core-features', 'auth-oauth', 'enhancements',
+              'integrations', 'polish', 'code-quality', 'admin']
+SCREENS = ['sign-in', 'dashboard', 'settings', 'profile', 'landing', 'checkout',
+           'messages', 'search', 'docs', 'features', 'account', 'onboarding']
+
+
+def _load_script(path: Path, name: str) -> ModuleType:
+    """Import a hyphenated script (svg-autofix.py etc.) as a module."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+autofix = _load_script(PROJECT_ROOT / 'scripts' / 'svg-autofix.py', 'svg_autofix')
+inspector = _load_script(SCRIPT_DIR / 'inspect-wireframes.py', 'inspect_wireframes')
+manifest = _load_script(SCRIPT_DIR / 'generate-manifest.py', 'generate_manifest')
+
+
+# ============================================================
+# CORPUS GENERATION
+# ============================================================
+
+STANDARDS = autofix.STANDARDS
+COLORS = validate.ALLOWED_COLORS
+INCLUDES = validate.REQUIRED_INCLUDES
+FONT = 'font-family="system-ui, sans-serif"'
+
+INCLUDE_FILES = {
+    'header-desktop.svg': '<g id="desktop-header"><path d="M 8 0 L 1272 0 A 8 8 0 0 1 1280 8 L 1280 50 L 0 50 L 0 8 A 8 8 0 0 1 8 0 Z" fill="{panel}"/></g>',
+    'footer-desktop.svg': '<g id="site-footer"><path d="M 0 0 L 1280 0 L 1280 72 A 8 8 0 0 1 1272 80 L 8 80 A 8 8 0 0 1 0 72 Z" fill="{panel}"/></g>',
+    'header-mobile.svg': '<g id="mobile-header-group"><path d="M 24 0 L 336 0 A 24 24 0 0 1 360 24 L 360 78 L 0 78 L 0 24 A 24 24 0 0 1 24 0 Z" fill="{panel}"/></g>',
+    'footer-mobile.svg': '<g id="mobile-bottom-nav"><path d="M 0 0 L 360 0 L 360 32 A 24 24 0 0 1 336 56 L 24 56 A 24 24 0 0 1 0 32 Z" fill="{panel}"/></g>',
+}
+
+
+def _callout(number: int, cx: int, cy: int, r: int = 14) -> str:
+    return (f'<g class="callout"><circle cx="{cx}" cy="{cy}" r="{r}" fill="{COLORS["badge_p0"]}"/>'
+            f'<text x="{cx}" y="{cy + 5}" text-anchor="middle" fill="{COLORS["text_light"]}" '
+            f'font-size="14" font-weight="bold">{number}</text></g>')
+
+
+def _annotation(number: int, x: int, y: int, rng: random.Random) -> List[str]:
+    badge = f'US-{number:03d}'
+    words = ' '.join(rng.choice(SCREENS) for _ in range(6))
+    return [
+        f'    <g transform="translate({x}, {y})">',
+        f'      <circle cx="14" cy="14" r="12" fill="{COLORS["badge_p0"]}"/>',
+        f'      <text x="14" y="19" text-anchor="middle" fill="{COLORS["text_light"]}" font-size="14" font-weight="bold">{number}</text>',
+        f'      <text x="38" y="19" {FONT} font-size="14" font-weight="700" fill="{COLORS["text_dark"]}">Callout {number}</text>',
+        f'      <a href="#{badge.lower()}" transform="translate(150, 5)"><rect width="56" height="22" rx="11" fill="{COLORS["badge_us"]}"/>'
+        f'<text x="28" y="17" text-anchor="middle" fill="{COLORS["input_bg"]}" font-size="14" font-weight="700">{badge}</text></a>',
+        f'      <text x="38" y="44" {FONT} font-size="14" fill="{COLORS["text_dark"]}">{words}</text>',
+        '    </g>',
+    ]
+
+
+# One typical mistake per defective file: (name, old, new), applied once
+DEFECTS = [
+    ('small-font', 'font-size="14" fill=', 'font-size="12" fill='),
+    ('white-panel', f'fill="{COLORS["panel_bg"]}"', 'fill="#ffffff"'),
+    ('title-offset', f'x="{STANDARDS["title_x"]}" y="28"', 'x="900" y="28"'),
+    ('signature-not-bold', f'y="1060" fill="{COLORS["text_dark"]}" {FONT} font-size="18" font-weight="bold"',
+     f'y="1060" fill="{COLORS["text_dark"]}" {FONT} font-size="18"'),
+    ('missing-footer', f'<use href="{INCLUDES["desktop"][1]}"', '<use href="includes/missing.svg#x"'),
+]
+
+
+def generate_svg(feature_num: int, screen_num: int, title: str, rng: random.Random,
+                 elements: int, callouts: int, annotations: int) -> str:
+    """One wireframe in the v5 layout: desktop + mobile mockups, annotation panel, signature."""
+    dx, dy = STANDARDS['desktop_x'], STANDARDS['desktop_y']
+    dw, dh = STANDARDS['desktop_width'], STANDARDS['desktop_height']
+    mx, my = STANDARDS['mobile_x'], STANDARDS['mobile_y']
+    mw, mh = STANDARDS['mobile_width'], STANDARDS['mobile_height']
+    panel = STANDARDS['panel_color']
+    canvas_w, canvas_h = validate.CANVAS_WIDTH, validate.CANVAS_HEIGHT
+
+    out = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{STANDARDS["viewbox"]}" width="{canvas_w}" height="{canvas_h}">',
+        '  <defs>',
+        '    <linearGradient id="bg" x1="0%" y1="0%" x2="0%" y2="100%">',
+        '      <stop offset="0%" stop-color="#c7ddf5"/>',
+        '      <stop offset="100%" stop-color="#b8d4f0"/>',
+        '    </linearGradient>',
+        '  </defs>',
+        f'  <rect width="{canvas_w}" height="{canvas_h}" fill="url(#bg)"/>',
+        f'  <text x="{STANDARDS["title_x"]}" y="28" text-anchor="middle" {FONT} font-size="18" font-weight="700" fill="{COLORS["text_muted"]}">{title.upper()}</text>',
+        f'  <text x="{dx}" y="52" fill="{COLORS["button_primary"]}" {FONT} font-size="18" font-weight="bold">DESKTOP (16:9)</text>',
+        f'  <text x="{mx + 140}" y="52" fill="#d946ef" {FONT} font-size="15" font-weight="bold">MOBILE</text>',
+        '',
+        f'  <g id="desktop" transform="translate({dx}, {dy})">',
+        f'    <rect width="{dw}" height="{dh}" rx="8" fill="{panel}" stroke="{COLORS["border_light"]}"/>',
+        f'    <use href="{INCLUDES["desktop"][0]}" x="0" y="0"/>',
+    ]
+
+    # Content rows between the header (50) and the footer (640), two columns
+    rows = max(1, (elements + 1) // 2)
+    pitch = max(24, 560 // rows)
+    targets = []
+    for i in range(elements):
+        x = 60 if i % 2 == 0 else 680
+        y = 80 + (i // 2) * pitch % 540
+        width = rng.randrange(200, 540, 20)
+        out.append(f'    <rect x="{x}" y="{y}" width="{width}" height="{min(pitch - 4, 44)}" rx="4" '
+                   f'fill="{COLORS["input_bg"]}" stroke="{COLORS["border_light"]}"/>')
+        out.append(f'    <text x="{x + 12}" y="{y + 20}" {FONT} font-size="14" fill="{COLORS["text_dark"]}">Row {i + 1}</text>')
+        targets.append((x + width, y))
+    out.append(f'    <use href="{INCLUDES["desktop"][1]}" x="0" y="640"/>')
+    for n in range(1, callouts + 1):
+        x, y = targets[(n - 1) % len(targets)] if targets else (600, 300)
+        out.append('    ' + _callout(n, min(x + 20, dw - 20), y + 14))
+    out.append('  </g>')
+    out.append('')
+
+    out.append(f'  <g id="mobile" transform="translate({mx}, {my})">')
+    out.append(f'    <rect width="{mw}" height="{mh}" rx="24" fill="{panel}" stroke="{COLORS["border_light"]}"/>')
+    out.append(f'    <use href="{INCLUDES["mobile"][0]}" x="0" y="0"/>')
+    mobile_rows = max(1, min(elements // 2, 10))
+    for i in range(mobile_rows):
+        y = validate.MOBILE_CONTENT_MIN_Y + 16 + i * 56
+        out.append(f'    <rect x="16" y="{y}" width="{mw - 32}" height="48" rx="4" fill="{COLORS["input_bg"]}" stroke="{COLORS["border_light"]}"/>')
+        out.append(f'    <text x="28" y="{y + 28}" {FONT} font-size="14" fill="{COLORS["text_dark"]}">Item {i + 1}</text>')
+    out.append(f'    <use href="{INCLUDES["mobile"][1]}" x="0" y="{validate.MOBILE_FOOTER_Y}"/>')
+    if callouts:
+        out.append('    ' + _callout(1, mw - 30, validate.MOBILE_CONTENT_MIN_Y + 40, r=11))
+    out.append('  </g>')
+    out.append('')
+
+    out.append(f'  <g id="annotations" transform="translate({dx}, 800)">')
+    out.append(f'    <rect width="1840" height="220" rx="8" fill="{COLORS["panel_secondary"]}" stroke="{COLORS["border_light"]}"/>')
+    columns = validate.ANNOTATION_COLUMNS
+    for n in range(1, annotations + 1):
+        column_x = columns[(n - 1) % len(columns)][0]
+        out.extend(_annotation(n, column_x, 16 + ((n - 1) // len(columns)) * 90, rng))
+    out.append('  </g>')
+    out.append(f'  <text x="{dx}" y="940" {FONT} font-size="14" font-weight="bold" fill="{COLORS["text_dark"]}">Key Concepts:</text>')
+    out.append(f'  <text x="{dx + 100}" y="940" {FONT} font-size="14" fill="{COLORS["text_dark"]}">{title} | {screen_num:02d}</text>')
+    out.append(f'  <text x="{dx}" y="1060" fill="{COLORS["text_dark"]}" {FONT} font-size="18" font-weight="bold">'
+               f'{feature_num:03d}:{screen_num:02d} | {title} | ScriptHammer</text>')
+    out.append('</svg>')
+    return '\n'.join(out) + '\n'
+
+
+def generate_corpus(out_dir: Path, count: int, elements: int, callouts: int,
+                    annotations: int, defect_rate: float, seed: int) -> List[Path]:
+    """Write `count` SVGs as features/<category>/<NNN-name>/wireframes/NN-screen.svg.
+
+    Every feature gets an includes/ directory and a spec.md whose UI Mockup
+    block signs off its first wireframe, so the manifest sees every status.
+    """
+    rng = random.Random(seed)
+    features_root = out_dir / 'features'
+    svg_paths = []
+    for index in range(count):
+        feature_num, screen_num = divmod(index, FILES_PER_FEATURE)
+        category = CATEGORIES[feature_num % len(CATEGORIES)]
+        feature_name = f"{feature_num:03d}-{SCREENS[feature_num % len(SCREENS)]}-{feature_num}"
+        wireframes_dir = features_root / category / feature_name / 'wireframes'
+        screen = SCREENS[(feature_num + screen_num) % len(SCREENS)]
+        svg_name = f"{screen_num + 1:02d}-{screen}.svg"
+
+        if screen_num == 0:
+            (wireframes_dir / 'includes').mkdir(parents=True, exist_ok=True)
+            for name, body in INCLUDE_FILES.items():
+                (wireframes_dir / 'includes' / name).write_text(
+                    f'<svg xmlns="http://www.w3.org/2000/svg">\n{body.format(panel=STANDARDS["panel_color"])}\n</svg>\n')
+            (wireframes_dir.parent / 'spec.md').write_text(
+                f"# Feature {feature_num:03d}\n\n## UI Mockup\n\n- {svg_name}\n")
+
+        title = f"{screen.replace('-', ' ').title()} {feature_num}"
+        content = generate_svg(feature_num, screen_num + 1, title, rng,
+                               elements, callouts, annotations)
+        if rng.random() < defect_rate:
+            _, old, new = rng.choice(DEFECTS)
+            content = content.replace(old, new, 1)
+        svg_path = wireframes_dir / svg_name
+        svg_path.write_text(content)
+        svg_paths.append(svg_path)
+    return svg_paths
+
+
+def corpus_for(size: int, args: argparse.Namespace) -> Path:
+    """Cached corpus directory for these parameters, generated on first use."""
+    params = {'size': size, 'elements': args.elements, 'callouts': args.callouts,
+              'annotations': args.annotations, 'defect_rate': args.defect_rate,
+              'seed': args.seed}
+    key = hashlib.sha256(json.dumps(params, sort_keys=True).encode()
+                         + Path(__file__).read_bytes()).hexdigest()[:12]
+    corpus_dir = CACHE_DIR / f"{size}-{key}"
+    if not (corpus_dir / '.complete').exists():
+        shutil.rmtree(corpus_dir, ignore_errors=True)
+        started = time.perf_counter()
+        generate_corpus(corpus_dir, size, args.elements, args.callouts,
+                        args.annotations, args.defect_rate, args.seed)
+        (corpus_dir / '.complete').write_text(json.dumps(params) + '\n')
+        print(f"  generated {size} SVGs in {time.perf_counter() - started:.1f}s -> {corpus_dir}",
+              file=sys.stderr)
+    return corpus_dir
+
+
+# ============================================================
+# TIMING
+# ============================================================
+
+def _best_wall(command: List[str], repeat: int) -> float:
+    """Best wall time of `repeat` runs of a CLI. Exit status is ignored (failures are expected)."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _timed(phases: Dict[str, float], name: str, fn: Callable, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    phases[name] = phases.get(name, 0.0) + time.perf_counter() - started
+    return result
+
+
+def phases_validate(svg_files: List[Path]) -> Dict[str, float]:
+    profile = validate.RuleProfile()
+    for svg_path in svg_files:
+        _, file_profile = validate._validate_file(svg_path, profile=True)
+        profile.merge(file_profile)
+    return dict(sorted(profile.seconds.items(), key=lambda item: -item[1]))
+
+
+def phases_inspect(svg_files: List[Path]) -> Dict[str, float]:
+    phases: Dict[str, float] = {}
+    structures = [_timed(phases, 'extract_structure', inspector.extract_structure, p) for p in svg_files]
+    _timed(phases, 'check_patterns', inspector.check_patterns, structures)
+    _timed(phases, 'find_oddballs', inspector.find_oddballs, structures)
+    return phases
+
+
+def phases_autofix(svg_files: List[Path]) -> Dict[str, float]:
+    phases: Dict[str, float] = {}
+    for svg_path in svg_files:
+        content = _timed(phases, 'read', svg_path.read_text)
+        _timed(phases, 'check_svg', autofix.check_svg, content)
+        _timed(phases, 'fix_svg', autofix.fix_svg, content)
+    return phases
+
+
+def phases_manifest(features_root: Path, state_dir: Path) -> Dict[str, float]:
+    """Same work as the timed `--full` CLI run: a full build that also fingerprints every source."""
+    phases: Dict[str, float] = {}
+    _timed(phases, 'find_feature_dirs', manifest.find_feature_dirs, features_root)
+    state = manifest.ManifestState(state_dir / 'bench-state.json')  # Never saved
+    result = _timed(phases, 'build_manifest', manifest.build_manifest, features_root, '/wireframes', state)
+    _timed(phases, 'serialize', lambda: json.dumps(result, indent=2))
+    return phases
+
+
+def bench_corpus(corpus_dir: Path, tools: List[str], repeat: int, jobs: int) -> Dict:
+    features_root = corpus_dir / 'features'
+    svg_files = validate.discover_svgs([features_root])
+    python = sys.executable
+    manifest_out = corpus_dir / 'wireframes-manifest.json'
+    commands = {
+        'validate': [python, str(SCRIPT_DIR / 'validate.py'), '--all', '--summary', '--no-cache',
+                     '--jobs', str(jobs), '--root', str(features_root)],
+        'inspect': [python, str(SCRIPT_DIR / 'inspect-wireframes.py'), '--report', '--no-cache',
+                    '--root', str(features_root)],
+        # --full: otherwise every run after the first reuses the saved
+        # source state and times the no-op incremental path
+        'manifest': [python, str(SCRIPT_DIR / 'generate-manifest.py'), '--root', str(features_root),
+                     '--output', str(manifest_out), '--path-prefix', '/wireframes', '--full'],
+    }
+
+    results: Dict[str, Dict] = {}
+    for tool in tools:
+        if tool == 'autofix':
+            # In-process end to end: read + check every file, what `all` does
+            best = float('inf')
+            for _ in range(repeat):
+                started = time.perf_counter()
+                for svg_path in svg_files:
+                    autofix.check_svg(svg_path.read_text())
+                best = min(best, time.perf_counter() - started)
+            wall = best
+        else:
+            wall = _best_wall(commands[tool], repeat)
+
+        if tool == 'validate':
+            phases = phases_validate(svg_files)
+        elif tool == 'inspect':
+            phases = phases_inspect(svg_files)
+        elif tool == 'autofix':
+            phases = phases_autofix(svg_files)
+        else:
+            phases = phases_manifest(features_root, corpus_dir)
+        results[tool] = {'wall': wall, 'phases': phases}
+        print(f"  {tool:<10} {wall * 1000:>10.1f} ms  ({wall / len(svg_files) * 1e6:.0f} us/file)",
+              file=sys.stderr)
+    return {
+        'files': len(svg_files),
+        'bytes': sum(p.stat().st_size for p in svg_files),
+        'tools': results,
+    }
+
+
+# ============================================================
+# BASELINES
+# ============================================================
+
+def compare(baseline: Dict, current: Dict, threshold: float, top: int) -> int:
+    """Print per-tool and per-phase deltas; returns how many walls regressed past `threshold`."""
+    regressions = 0
+    for size, corpus in current['corpora'].items():
+        base_corpus = baseline.get('corpora', {}).get(size)
+        if base_corpus is None:
+            print(f"\n{size} SVGs: not in baseline")
+            continue
+        print(f"\n{size} SVGs")
+        print(f"  {'tool / phase':<40} {'baseline ms':>12} {'current ms':>12} {'change':>9}")
+        for tool, result in corpus['tools'].items():
+            base = base_corpus['tools'].get(tool)
+            if base is None:
+                continue
+            change = (result['wall'] - base['wall']) / base['wall'] if base['wall'] else 0.0
+            flag = ''
+            if change > threshold:
+                regressions += 1
+                flag = '  REGRESSION'
+            print(f"  {tool:<40} {base['wall'] * 1000:>12.1f} {result['wall'] * 1000:>12.1f} {change:>+8.0%}{flag}")
+            # Phases that moved the most, so a slow new rule is named
+            deltas = sorted(
+                ((phase, base['phases'].get(phase, 0.0), seconds)
+                 for phase, seconds in result['phases'].items()),
+                key=lambda item: -(item[2] - item[1]))
+            for phase, before, after in deltas[:top]:
+                note = ' (new)' if phase not in base['phases'] else ''
+                print(f"    {phase + note:<38} {before * 1000:>12.1f} {after * 1000:>12.1f}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='100', help='Comma-separated corpus sizes (default: 100)')
+    parser.add_argument('--elements', type=int, default=16, help='Content rows per desktop mockup (default: 16)')
+    parser.add_argument('--callouts', type=int, default=4, help='Callouts per wireframe (default: 4)')
+    parser.add_argument('--annotations', type=int, default=4, help='Annotation groups per panel (default: 4)')
+    parser.add_argument('--defect-rate', type=float, default=0.1, help='Fraction of files given one defect (default: 0.1)')
+    parser.add_argument('--seed', type=int, default=1, help='Generator seed (default: 1)')
+    parser.add_argument('--tools', default=','.join(TOOLS), help=f"Tools to time (default: {','.join(TOOLS)})")
+    parser.add_argument('--repeat', type=int, default=3, help='End-to-end runs per tool; the best counts (default: 3)')
+    parser.add_argument('--jobs', type=int, default=1, help='validate.py --jobs (default: 1, for stable numbers)')
+    parser.add_argument('--save-baseline', metavar='FILE', help='Write the results as a baseline JSON')
+    parser.add_argument('--compare', metavar='FILE', help='Compare against a baseline; exit 1 on regressions')
+    parser.add_argument('--threshold', type=float, default=0.15, help='Regression threshold for --compare (default: 0.15)')
+    parser.add_argument('--top', type=int, default=3, help='Phases shown per tool in --compare (default: 3)')
+    parser.add_argument('--generate-only', metavar='DIR', help='Write the corpora under DIR and exit')
+    args = parser.parse_args()
+
+    try:
+        sizes = [int(s) for s in args.sizes.split(',') if s]
+    except ValueError:
+        print(f"ERROR: --sizes expects comma-separated integers, got '{args.sizes}'")
+        sys.exit(1)
+    tools = [t for t in args.tools.split(',') if t]
+    unknown = [t for t in tools if t not in TOOLS]
+    if unknown:
+        print(f"ERROR: unknown tool(s): {', '.join(unknown)} (choose from {', '.join(TOOLS)})")
+        sys.exit(1)
+
+    if args.generate_only:
+        for size in sizes:
+            out_dir = Path(args.generate_only) / str(size)
+            generate_corpus(out_dir, size, args.elements, args.callouts,
+                            args.annotations, args.defect_rate, args.seed)
+            print(f"Wrote {size} SVGs to {out_dir}")
+        sys.exit(0)
+
+    baseline = None
+    if args.compare:
+        try:
+            baseline = json.loads(Path(args.compare).read_text())
+        except (OSError, ValueError) as e:
+            print(f"ERROR: cannot read baseline {args.compare}: {e}")
+            sys.exit(1)
+
+    current = {
+        'meta': {
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'validator_version': validate.VALIDATOR_VERSION,
+            'params': {'elements': args.elements, 'callouts': args.callouts,
+                       'annotations': args.annotations, 'defect_rate': args.defect_rate,
+                       'seed': args.seed, 'repeat': args.repeat, 'jobs': args.jobs},
+        },
+        'corpora': {},
+    }
+    for size in sizes:
+        print(f"{size} SVGs", file=sys.stderr)
+        current['corpora'][str(size)] = bench_corpus(corpus_for(size, args), tools, args.repeat, args.jobs)
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(current, indent=2) + '\n')
+        print(f"Baseline written to {args.save_baseline}", file=sys.stderr)
+
+    if baseline is not None:
+        if baseline.get('meta', {}).get('params') != current['meta']['params']:
+            print("WARNING: baseline was recorded with different generator parameters", file=sys.stderr)
+        regressions = compare(baseline, current, args.threshold, args.top)
+        print(f"\n{regressions} regression(s) over {args.threshold:.0%}")
+        sys.exit(1 if regressions else 0)
+
+    if not args.save_baseline:
+        print(json.dumps(current, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,8 @@ Generate wireframes-manifest.json for the viewer.
 Scans a feature tree for `wireframes/*.svg` and emits a JSON manifest the
 viewer can fetch. Supports both flat layouts (SpecKit default) and the
 ScriptHammer two-level layout (`features/<category>/<feature>/wireframes/`).
-Also reads any *.issues.md files to surface review status in the manifest.
+Also reads any *.issues.md files to surface review status in the manifest,
+and sums the statuses up in its `status_index` (see wireframe_status.py).
 
 Usage:
   # Flat SpecKit layout (specs/<feature>/wireframes/…)
@@ -17,25 +18,79 @@ Usage:
       --output public/wireframes/wireframes-manifest.json \\
       --path-prefix /wireframes
 
+  # Small index plus one content-hashed shard per category, for the viewer
+  # to fetch in parallel and cache long-term
+  python3 scripts/generate-manifest.py --root features --shards category \\
+      --output public/wireframes/wireframes-manifest.json
+
 Writes to .specify/extensions/wireframe/viewer/wireframes-manifest.json by default.
+With --shards, that file is the index and the shards go in a sibling
+<output stem>.shards/ directory.
+
+Rebuilds are incremental: the mtime, size and content hash of every SVG,
+.issues.md and spec.md behind the last manifest are kept under
+<project>/.cache/wireframe-manifest/, and only entries whose sources
+changed are re-derived (deleted SVGs drop out). `--full` rebuilds every
+entry.
 """
 import argparse
+import hashlib
+import io
 import json
+import os
 import re
 import sys
+import time
 from pathlib import Path
 
+from svg_document import write_if_changed
+from wireframe_status import detect_status, read_mockup_block, status_index
+
+# The title (v5 convention: centered text at y="28") and the background the
+# theme sniff looks for both sit at the top of a wireframe, so only the head
+# of each SVG is read: THEME_SNIFF_CHARS, then more until the title turns up
+# or SVG_HEAD_BUDGET characters have been read.
+THEME_SNIFF_CHARS = 1000
+SVG_HEAD_BUDGET = 16 * 1024
+_HEAD_CHUNK = 4096
+_TITLE_RE = re.compile(r'<text[^>]*y=["\']28["\'][^>]*>([^<]+)</text>')
+
+
+def _decode(data: bytes) -> io.TextIOWrapper:
+    """A text stream over bytes already read, decoded like read_text(errors="ignore")."""
+    return io.TextIOWrapper(io.BytesIO(data), errors="ignore")
+
 
-def extract_title(svg_path: Path) -> str:
-    """Read the first <title>-like text from the SVG, fall back to filename."""
+def read_svg_head(svg_path: Path, budget: int = SVG_HEAD_BUDGET, data: bytes | None = None) -> str:
+    """The start of an SVG, enough for extract_title() and detect_theme().
+
+    Decoded like read_text(errors="ignore"); "" if the file can't be read.
+    Taken from `data` instead when the caller already read the file.
+    """
     try:
-        content = svg_path.read_text(errors="ignore")
-        # Look for the centered title text element (v5 convention: y="28")
-        m = re.search(r'<text[^>]*y=["\']28["\'][^>]*>([^<]+)</text>', content)
-        if m:
-            return m.group(1).strip()
-    except Exception:
-        pass
+        with (_decode(data) if data is not None else open(svg_path, errors="ignore")) as f:
+            head = f.read(max(THEME_SNIFF_CHARS, min(_HEAD_CHUNK, budget)))
+            while len(head) < budget and not _TITLE_RE.search(head):
+                chunk = f.read(min(_HEAD_CHUNK, budget - len(head)))
+                if not chunk:
+                    break
+                head += chunk
+    except OSError:
+        return ""
+    return head
+
+
+def extract_title(svg_path: Path, head: str | None = None) -> str:
+    """Read the first <title>-like text from the SVG, fall back to filename.
+
+    `head` is the SVG's read_svg_head(), when the caller already has it.
+    """
+    if head is None:
+        head = read_svg_head(svg_path)
+    # Look for the centered title text element (v5 convention: y="28")
+    m = _TITLE_RE.search(head)
+    if m:
+        return m.group(1).strip()
     # Fall back to filename: "01-sign-in.svg" → "Sign In"
     stem = svg_path.stem
     parts = stem.split("-", 1)
@@ -43,75 +98,6 @@ def extract_title(svg_path: Path) -> str:
     return title.replace("-", " ").title()
 
 
-def detect_status(svg_path: Path, feature_dir: Path | None = None) -> str:
-    """Derive review status from spec.md sign-off + sibling .issues.md file.
-
-    Returns one of:
-      approved     - feature's spec.md ## UI Mockup block lists this SVG
-      needs-regen  - .issues.md has at least one REGENERATE classification
-      needs-patch  - .issues.md has only PATCH-class issues (cosmetic)
-      clean        - .issues.md exists, says zero open issues (validator clean)
-      draft        - never validated/reviewed (no .issues.md, no sign-off)
-    """
-    # 1. Spec sign-off — strongest signal. Searches for `## UI Mockup` block
-    #    in the feature's spec.md and checks whether the SVG basename appears.
-    if feature_dir is not None:
-        spec = feature_dir / "spec.md"
-        if spec.exists():
-            try:
-                spec_content = spec.read_text(errors="ignore")
-                # Capture the ## UI Mockup section up to the next ## heading.
-                mockup_match = re.search(
-                    r'(?ms)^##\s+UI\s+Mockup\s*\n(.*?)(?=^##\s|\Z)',
-                    spec_content,
-                )
-                if mockup_match and svg_path.name in mockup_match.group(1):
-                    return "approved"
-            except Exception:
-                pass
-
-    # 2. Sibling .issues.md — historical review record.
-    issues = svg_path.with_suffix(".issues.md")
-    if not issues.exists():
-        return "draft"
-    try:
-        content = issues.read_text(errors="ignore")
-    except Exception:
-        return "draft"
-
-    # Two formats coexist:
-    #
-    # New (extension): single `**Status:** PASS|PATCH|REGENERATE` header line.
-    new_fmt = re.search(r'^\*\*Status:\*\*\s*(\w+)', content, re.MULTILINE)
-    if new_fmt:
-        status = new_fmt.group(1).upper()
-        return {
-            "PASS": "clean",
-            "PATCH": "needs-patch",
-            "REGENERATE": "needs-regen",
-            "REGEN": "needs-regen",
-        }.get(status, "draft")
-
-    # Legacy (homegrown): markdown table with a Classification column whose
-    # values are PATCH / REGENERATE per row. Plus an Open count summary.
-    classifications = re.findall(
-        r'\|\s*(PATCH|REGEN(?:ERATE)?)\s*\|',
-        content,
-    )
-    if classifications:
-        if any("REGEN" in c for c in classifications):
-            return "needs-regen"
-        return "needs-patch"
-
-    # No classification rows. Look for explicit open-count signal.
-    open_match = re.search(r'\|\s*Open\s*\|\s*(\d+)\s*\|', content)
-    if open_match and open_match.group(1) == "0":
-        return "clean"
-
-    # File exists but format unrecognized — treat as draft (not yet reviewed).
-    return "draft"
-
-
 def detect_shipping(svg_path: Path) -> bool:
     """True if the wireframe mirrors a shipping route, false if forward-looking.
 
@@ -122,12 +108,11 @@ def detect_shipping(svg_path: Path) -> bool:
     return svg_path.name.startswith("as-is-")
 
 
-def detect_theme(svg_path: Path) -> str:
-    """Guess theme by peeking at the background fill."""
-    try:
-        content = svg_path.read_text(errors="ignore")[:1000]
-    except Exception:
-        return "unknown"
+def detect_theme(svg_path: Path, head: str | None = None) -> str:
+    """Guess theme by peeking at the background fill (`head` as in extract_title)."""
+    if head is None:
+        head = read_svg_head(svg_path)
+    content = head[:THEME_SNIFF_CHARS]
     if "bg-dark" in content or "#0f172a" in content or "#1a1a2e" in content:
         return "dark"
     if "#c7ddf5" in content or "#e8d4b8" in content:
@@ -144,6 +129,10 @@ def feature_label(feature_dir: str) -> str:
     return f"{num} - {slug.replace('-', ' ').title()}"
 
 
+# Never searched for features: dependencies, VCS data, shared SVG includes.
+SKIP_DIRS = frozenset({"node_modules", ".git", "includes"})
+
+
 def find_feature_dirs(root: Path) -> list[Path]:
     """Discover every dir under `root` that contains a `wireframes/` child.
 
@@ -151,31 +140,174 @@ def find_feature_dirs(root: Path) -> list[Path]:
     layouts (`features/cat/NNN-name/wireframes/`). Returns feature dirs in
     sorted order; duplicates (same basename in multiple categories) are
     disambiguated by their relative path.
+
+    The walk is pruned: nothing below a feature dir is searched, SKIP_DIRS
+    are never entered, and symlinked dirs aren't followed (a symlinked
+    `wireframes/` still marks its parent as a feature).
     """
     if not root.exists():
         return []
-    features: list[Path] = []
-    # Recursive: the wireframes/ dir is always the immediate parent of the
-    # SVGs, and its parent is the "feature dir" we want.
-    for wf_dir in sorted(root.glob("**/wireframes")):
-        if not wf_dir.is_dir():
-            continue
-        feature = wf_dir.parent
-        if feature in features:
+    features: set[Path] = set()
+    pending = [str(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
             continue
-        features.append(feature)
-    return features
+        subdirs = []
+        for entry in entries:
+            # The wireframes/ dir is always the immediate parent of the SVGs,
+            # and its parent is the "feature dir" we want.
+            if entry.name == "wireframes" and entry.is_dir():
+                features.add(Path(directory))
+                break
+            if entry.name not in SKIP_DIRS and entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+        else:
+            pending.extend(subdirs)
+    return sorted(features)
+
+
+def wireframe_entry(svg: Path, head: str, mockup_block: str) -> dict:
+    """One wireframe's entry in its feature (`head` and `mockup_block` as read above)."""
+    return {
+        "path": svg.name,  # Just the basename; viewer joins with feature_id
+        "title": extract_title(svg, head),
+        "status": detect_status(svg, mockup_block=mockup_block),
+        "theme": detect_theme(svg, head),
+        "shipping": detect_shipping(svg),
+        "svg_file": svg.name,
+    }
+
+
+# ============================================================
+# INCREMENTAL REBUILDS - What the last manifest was built from
+# ============================================================
+
+def _signature(path: Path, known: list | None) -> tuple[list | None, bytes | None]:
+    """`path`'s [mtime_ns, size, sha256] (None if missing) and its bytes if they were read.
+
+    The content is only read and hashed when mtime or size moved since
+    `known`; a file that was touched but not changed keeps its hash.
+    """
+    try:
+        st = path.stat()
+        if known and known[0] == st.st_mtime_ns and known[1] == st.st_size:
+            return known, None
+        data = path.read_bytes()
+    except OSError:
+        return None, None
+    return [st.st_mtime_ns, st.st_size, hashlib.sha256(data).hexdigest()], data
+
+
+def _same_content(signature: list | None, known: list | None) -> bool:
+    if signature is None or known is None:
+        return signature is known
+    return signature[2] == known[2]
+
+
+def _find_project_root(start: Path) -> Path:
+    for candidate in (start, *start.parents):
+        if (candidate / "package.json").is_file() and (candidate / "features").is_dir():
+            return candidate
+    return start
+
+
+class ManifestState:
+    """Source signatures behind a written manifest, for incremental rebuilds.
+
+    One file per (root, output) pair in <project>/.cache/wireframe-manifest/.
+    Maps each feature's source_path to the signature of its spec.md and,
+    per SVG, of the SVG and its .issues.md (see _signature). It also
+    records the hash of the manifest it describes: if that file was
+    replaced or edited since, nothing in it is trusted.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.features: dict[str, dict] = {}
+        self.manifest_sha256: str | None = None
+        self.rederived = 0  # Entries build_manifest() derived afresh this run
 
+    @classmethod
+    def for_output(cls, root: Path, output: Path) -> "ManifestState":
+        key = hashlib.sha256(f"{root.resolve()}\0{output.resolve()}".encode()).hexdigest()[:12]
+        cache_dir = _find_project_root(Path(__file__).resolve().parent) / ".cache" / "wireframe-manifest"
+        state = cls(cache_dir / f"state-{key}.json")
+        try:
+            data = json.loads(state.path.read_text())
+        except (OSError, ValueError):
+            return state
+        if isinstance(data, dict) and data.get("version") == cls.VERSION:
+            state.features = data.get("features", {})
+            state.manifest_sha256 = data.get("manifest_sha256")
+        return state
+
+    def previous_manifest(self, output: Path) -> dict | None:
+        """The manifest at `output`, if it is the one this state describes."""
+        try:
+            text = output.read_text()
+        except OSError:
+            return None
+        if hashlib.sha256(text.encode()).hexdigest() != self.manifest_sha256:
+            return None
+        try:
+            manifest = json.loads(text)
+        except ValueError:
+            return None
+        if "shards" in manifest:
+            return read_sharded_manifest(output.parent, manifest)
+        return manifest
+
+    def save(self, manifest_text: str) -> None:
+        self.manifest_sha256 = hashlib.sha256(manifest_text.encode()).hexdigest()
+        payload = {"version": self.VERSION, "manifest_sha256": self.manifest_sha256,
+                   "features": self.features}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"Warning: could not save manifest state ({e}); next run rebuilds in full",
+                  file=sys.stderr)
 
-def build_manifest(root: Path, path_prefix: str) -> dict:
+
+def build_manifest(root: Path, path_prefix: str, state: ManifestState | None = None,
+                   previous: dict | None = None, timings: dict[str, float] | None = None) -> dict:
     """Build the manifest by walking `root` and emitting path_prefix-prefixed paths.
 
     `path_prefix` is prepended to each wireframe's URL in the flat list,
     so e.g. `--path-prefix /wireframes` yields `/wireframes/<feature>/<svg>`.
+
+    With a `state`, the signature of every source is recorded in it. With
+    `previous` too (the manifest that state describes), entries whose SVG,
+    .issues.md and spec.md are unchanged are copied from it rather than
+    derived again; SVGs that are gone are simply not found.
+
+    With `timings`, the seconds spent discovering feature dirs and deriving
+    their entries are stored in it under "discover" and "build".
     """
     features: list[dict] = []
-
-    for feature_dir in find_feature_dirs(root):
+    reusable: dict[tuple, dict] = {}
+    if state is not None and previous is not None:
+        reusable = {(f.get("source_path"), wf.get("svg_file")): wf
+                    for f in previous.get("features", [])
+                    for wf in f.get("wireframes", [])}
+    known_features = state.features if state is not None else {}
+    seen_features: dict[str, dict] = {}
+
+    started = time.perf_counter()
+    feature_dirs = find_feature_dirs(root)
+    if timings is not None:
+        timings["discover"] = time.perf_counter() - started
+        started = time.perf_counter()
+
+    for feature_dir in feature_dirs:
         wireframes_dir = feature_dir / "wireframes"
         svgs = sorted(wireframes_dir.glob("*.svg"))
         if not svgs:
@@ -191,16 +323,37 @@ def build_manifest(root: Path, path_prefix: str) -> dict:
         feature_id = str(rel).replace("/", "-")  # e.g. "foundation-001-wcag-aa-compliance"
         category = rel.parent.name if rel.parent != Path(".") else ""
 
+        # One read of spec.md per feature (only if some entry needs it), one
+        # head read per SVG (none for entries carried over)
+        mockup_block: str | None = None
+        known: dict = {}
+        spec_unchanged = False
+        if state is not None:
+            known = known_features.get(str(rel), {})
+            spec_signature, spec_data = _signature(feature_dir / "spec.md", known.get("spec"))
+            spec_unchanged = "spec" in known and _same_content(spec_signature, known["spec"])
+            if spec_data is not None:
+                mockup_block = read_mockup_block(feature_dir, spec_data)
+            feature_state = seen_features[str(rel)] = {"spec": spec_signature, "svgs": {}}
+
         feature_entries = []
         for svg in svgs:
-            feature_entries.append({
-                "path": svg.name,  # Just the basename; viewer joins with feature_id
-                "title": extract_title(svg),
-                "status": detect_status(svg, feature_dir),
-                "theme": detect_theme(svg),
-                "shipping": detect_shipping(svg),
-                "svg_file": svg.name,
-            })
+            svg_data = None
+            if state is not None:
+                known_svg = known.get("svgs", {}).get(svg.name, {})
+                svg_signature, svg_data = _signature(svg, known_svg.get("svg"))
+                issues_signature, _ = _signature(svg.with_suffix(".issues.md"), known_svg.get("issues"))
+                feature_state["svgs"][svg.name] = {"svg": svg_signature, "issues": issues_signature}
+                carried = reusable.get((str(rel), svg.name))
+                if (carried is not None and spec_unchanged and "svg" in known_svg
+                        and _same_content(svg_signature, known_svg["svg"])
+                        and _same_content(issues_signature, known_svg.get("issues"))):
+                    feature_entries.append(dict(carried))
+                    continue
+                state.rederived += 1
+            if mockup_block is None:
+                mockup_block = read_mockup_block(feature_dir)
+            feature_entries.append(wireframe_entry(svg, read_svg_head(svg, data=svg_data), mockup_block))
         features.append({
             "id": feature_id,
             "label": feature_label(feature_dir.name),
@@ -209,6 +362,12 @@ def build_manifest(root: Path, path_prefix: str) -> dict:
             "wireframes": feature_entries,
         })
 
+    if state is not None:
+        state.features = seen_features  # Features that are gone drop out
+
+    if timings is not None:
+        timings["build"] = time.perf_counter() - started
+
     # Flat list is what the viewer iterates for nav + prev/next.
     # Each entry's `path` is what the viewer fetches. An empty `path_prefix`
     # produces relative paths (sibling of viewer.html); a non-empty prefix
@@ -240,7 +399,86 @@ def build_manifest(root: Path, path_prefix: str) -> dict:
         "features": features,
         "wireframes": flat,
         "total": len(flat),
+        "status_index": status_index(features),
+    }
+
+
+# ============================================================
+# SHARDING - Small index plus content-hashed shards
+# ============================================================
+
+SHARD_MODES = ("feature", "category")
+
+
+def _shard_key(feature: dict, by: str) -> str:
+    if by == "feature":
+        return feature["id"]
+    return feature.get("category") or "uncategorized"
+
+
+def shard_manifest(manifest: dict, by: str, path_prefix: str,
+                   shard_dir_name: str) -> tuple[dict, dict[str, str]]:
+    """Split a manifest into an index and one shard per feature or category.
+
+    Returns (index, {shard file name: shard JSON}). Each shard holds the
+    full `features` entries of its group and is named `<key>.<sha12>.json`
+    after its content, so it can be cached forever and only changes name
+    when it changes. The index lists the shard files (relative to itself),
+    the feature order, and the flat wireframe list as [feature id,
+    svg_file] references instead of a second copy of every entry.
+    """
+    groups: dict[str, list[dict]] = {}
+    for feature in manifest["features"]:
+        groups.setdefault(_shard_key(feature, by), []).append(feature)
+
+    shards: dict[str, str] = {}
+    for key, features in groups.items():
+        text = json.dumps({"features": features}, separators=(",", ":")) + "\n"
+        digest = hashlib.sha256(text.encode()).hexdigest()[:12]
+        shards[f"{key}.{digest}.json"] = text
+
+    index = {
+        "schema_version": "2.0",
+        "sharded_by": by,
+        "path_prefix": path_prefix.rstrip("/"),
+        "shards": [f"{shard_dir_name}/{name}" for name in shards],
+        "features": [f["id"] for f in manifest["features"]],
+        "wireframes": [[w["feature"], w["svg_file"]] for w in manifest["wireframes"]],
+        "total": manifest["total"],
+        "status_index": manifest["status_index"],
     }
+    return index, shards
+
+
+def read_sharded_manifest(base_dir: Path, index: dict) -> dict | None:
+    """Reassemble the `features` of a sharded manifest (None if a shard is missing or altered)."""
+    by_id: dict[str, dict] = {}
+    for shard_path in index.get("shards", []):
+        try:
+            text = (base_dir / shard_path).read_text()
+            features = json.loads(text)["features"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not shard_path.endswith(f".{hashlib.sha256(text.encode()).hexdigest()[:12]}.json"):
+            return None
+        by_id.update((f["id"], f) for f in features)
+    try:
+        return {"features": [by_id[feature_id] for feature_id in index.get("features", [])]}
+    except KeyError:
+        return None
+
+
+def write_shards(shard_dir: Path, shards: dict[str, str]) -> int:
+    """Write the shards that aren't on disk yet; returns how many were written."""
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    return sum(write_if_changed(shard_dir / name, text) for name, text in shards.items())
+
+
+def prune_shards(shard_dir: Path, shards: dict[str, str]) -> None:
+    """Delete shards the new index no longer names (only once that index is in place)."""
+    for stale in shard_dir.glob("*.json"):
+        if stale.name not in shards:
+            stale.unlink(missing_ok=True)
 
 
 def main() -> int:
@@ -261,18 +499,60 @@ def main() -> int:
         default="/specs",
         help="URL prefix for each wireframe's path (default: /specs)",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Re-derive every entry instead of only those whose sources changed",
+    )
+    parser.add_argument(
+        "--shards",
+        choices=SHARD_MODES,
+        help="Write a small index to --output plus one content-hashed shard per "
+             "feature or category in <output stem>.shards/",
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report time spent discovering features, deriving entries and writing (stderr)",
+    )
     args = parser.parse_args()
 
     root = Path(args.root)
-    manifest = build_manifest(root, args.path_prefix)
-
     output = Path(args.output)
-    output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(json.dumps(manifest, indent=2) + "\n")
+    state = ManifestState.for_output(root, output)
+    previous = None if args.full else state.previous_manifest(output)
+    timings: dict[str, float] = {}
+    manifest = build_manifest(root, args.path_prefix, state, previous, timings)
 
-    print(f"Wrote manifest: {output}")
+    started = time.perf_counter()
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if args.shards:
+        # Shards go in before the index that names them and old ones come
+        # out after it, so a reader never sees an index with missing shards
+        shard_dir_name = f"{output.stem}.shards"
+        index, shards = shard_manifest(manifest, args.shards, args.path_prefix, shard_dir_name)
+        shards_written = write_shards(output.parent / shard_dir_name, shards)
+        manifest_text = json.dumps(index, separators=(",", ":")) + "\n"
+    else:
+        manifest_text = json.dumps(manifest, indent=2) + "\n"
+    written = write_if_changed(output, manifest_text)
+    if args.shards:
+        prune_shards(output.parent / shard_dir_name, shards)
+    state.save(manifest_text)
+    timings["write"] = time.perf_counter() - started
+
+    print(f"{'Wrote manifest' if written else 'Manifest unchanged'}: {output}")
     print(f"  Features: {len(manifest['features'])}")
     print(f"  Wireframes: {manifest['total']}")
+    if args.shards:
+        print(f"  Shards: {len(shards)} by {args.shards} ({shards_written} rewritten)")
+    if previous is not None:
+        print(f"  Re-derived: {state.rederived} (sources changed or new)")
+    if args.timings:
+        print(f"TIMINGS: {sum(timings.values()) * 1000:.1f} ms", file=sys.stderr)
+        for phase in ("discover", "build", "write"):
+            print(f"  {phase:<8} {timings[phase] * 1000:>10.1f} ms", file=sys.stderr)
     return 0
 
 
@@ -1,10 +1,16 @@
 #!/usr/bin/env python3
 """
-SVG Wireframe Inspector v1.5
+SVG Wireframe Inspector v2.1
 
 Cross-SVG consistency checker for ScriptHammer wireframes.
 Runs AFTER validate-wireframe.py passes to check patterns across all SVGs.
 
+NEW in v2.1: Majority checks run on typed per-check columns (vectorized with NumPy when installed).
+NEW in v2.0: --all/--report keep a structure store; only changed SVGs are re-extracted.
+NEW in v1.9: --jobs N extracts structure in a process pool (default: CPU count); output order unchanged.
+NEW in v1.8: --timings reports read/landmark/extract/check time per SVG and per phase (slowest files first).
+NEW in v1.7: Landmarks come from the shared svg_document model, cached per content hash (--no-cache).
+NEW in v1.6: Landmark positions are located with the shared LineIndex in svg_document.py.
 NEW in v1.5: G-047 key_concepts_position - expects y=940 (inside annotation panel, below user stories).
              CONFIRMED by Architect (2026-01-16): y=730 was outside panel boundary.
 NEW in v1.4: Fixed G-044 to recognize <use> include files (footer/nav have proper corners via <path>).
@@ -33,15 +39,32 @@ Usage:
     python inspect-wireframes.py --all           # Inspect all SVGs
     python inspect-wireframes.py --report        # JSON report only
     python inspect-wireframes.py 002-cookie-consent/01-consent-modal.svg
+    python inspect-wireframes.py --all --no-cache  # Ignore the model cache and structure store
+    python inspect-wireframes.py --all --timings   # Where the time goes; 10 slowest SVGs (--timings=N)
+    python inspect-wireframes.py --all --jobs 4    # Extract with 4 worker processes
 """
 
+import hashlib
 import json
+import os
+import pickle
 import re
 import sys
-from dataclasses import dataclass, field
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass, field, fields
 from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, TextIO, Tuple
+
+import svg_document
+from svg_document import DocumentCache, StructuralElement, SVGDocument, write_if_changed
+
+try:
+    import numpy as np
+except ImportError:  # Optional: StructureColumns falls back to plain Python
+    np = None
 
 # ============================================================
 # EXPECTED PATTERNS (from wireframe standards)
@@ -78,20 +101,6 @@ POSITION_TOLERANCE = 5
 # DATA CLASSES
 # ============================================================
 
-@dataclass
-class StructuralElement:
-    """Extracted structural element from an SVG."""
-    element_type: str
-    x: Optional[float] = None
-    y: Optional[float] = None
-    width: Optional[float] = None
-    height: Optional[float] = None
-    text_anchor: Optional[str] = None
-    bold: bool = False
-    href: Optional[str] = None
-    text: Optional[str] = None  # Text content (for signature format validation)
-
-
 @dataclass
 class SVGStructure:
     """Structural analysis of a single SVG."""
@@ -133,13 +142,97 @@ class PatternViolation:
     severity: str = "PATTERN_VIOLATION"
 
 
+# ============================================================
+# TIMINGS - Where an inspection run spends its time (--timings)
+# ============================================================
+
+# Per-SVG steps, in the order they run
+FILE_STEPS = ('read', 'landmarks', 'extract', 'check')
+
+
+class PhaseTimings:
+    """Wall time per SVG and per phase over one run (--timings).
+
+    Per SVG: `read` (the file itself), `landmarks` (shared cache lookup or
+    extraction of landmarks and conventions), `extract` (what the inspector
+    still derives itself) and `check` (its check_patterns pass). Phases
+    add the cross-file steps: find_oddballs and log_violations (writing
+    .issues.md files).
+    """
+
+    def __init__(self):
+        self.files: Dict[Path, Dict[str, float]] = {}
+        self.phases: Dict[str, float] = {}
+
+    def record(self, step: str, seconds: float, svg_path: Optional[Path] = None) -> None:
+        self.phases[step] = self.phases.get(step, 0.0) + seconds
+        if svg_path is not None:
+            steps = self.files.setdefault(svg_path, {})
+            steps[step] = steps.get(step, 0.0) + seconds
+
+    def merge(self, svg_path: Path, steps: Dict[str, float]) -> None:
+        """Add one file's steps as timed in a worker process."""
+        for step, seconds in steps.items():
+            self.record(step, seconds, svg_path)
+
+    def slowest(self, top: int) -> List[Path]:
+        return sorted(self.files, key=lambda p: sum(self.files[p].values()), reverse=True)[:top]
+
+    def to_json(self, display: Callable[[Path], str], top: int) -> Dict:
+        """The `timings` section of --report (milliseconds)."""
+        return {
+            'phases_ms': {step: round(seconds * 1000, 3) for step, seconds in self.phases.items()},
+            'total_ms': round(sum(self.phases.values()) * 1000, 3),
+            'slowest_svgs': [
+                {'svg': display(p),
+                 'total_ms': round(sum(self.files[p].values()) * 1000, 3),
+                 **{f'{step}_ms': round(self.files[p].get(step, 0.0) * 1000, 3) for step in FILE_STEPS}}
+                for p in self.slowest(top)
+            ],
+        }
+
+    def report(self, display: Callable[[Path], str], top: int, out: TextIO = sys.stderr) -> None:
+        """Print phases and the slowest SVGs. Goes to stderr so --report stays parseable."""
+        total = sum(self.phases.values())
+        print(f"\n{'='*60}", file=out)
+        print(f"TIMINGS: {len(self.files)} SVGs, {total * 1000:.1f} ms", file=out)
+        print('='*60, file=out)
+        print(f"  {'phase':<16} {'time (ms)':>10} {'share':>7}", file=out)
+        for step, seconds in sorted(self.phases.items(), key=lambda kv: kv[1], reverse=True):
+            share = seconds / total * 100 if total else 0.0
+            print(f"  {step:<16} {seconds * 1000:>10.1f} {share:>6.1f}%", file=out)
+
+        slowest = self.slowest(top)
+        if not slowest:
+            return
+        print(f"\n  Slowest {len(slowest)} SVGs (ms):", file=out)
+        print(f"  {'total':>8} " + " ".join(f"{step:>9}" for step in FILE_STEPS) + "  svg", file=out)
+        for p in slowest:
+            steps = self.files[p]
+            print(f"  {sum(steps.values()) * 1000:>8.2f} "
+                  + " ".join(f"{steps.get(step, 0.0) * 1000:>9.2f}" for step in FILE_STEPS)
+                  + f"  {display(p)}", file=out)
+
+
 # ============================================================
 # STRUCTURAL EXTRACTION
 # ============================================================
 
-def extract_structure(svg_path: Path) -> SVGStructure:
-    """Extract structural elements from an SVG file."""
-    content = svg_path.read_text()
+def extract_structure(svg_path: Path, cache: Optional[DocumentCache] = None,
+                      timings: Optional[PhaseTimings] = None) -> SVGStructure:
+    """Extract structural elements from an SVG file.
+
+    The layout landmarks (title, signature, includes, mockups, annotation
+    panel) and the G-044..G-047 convention facts come from
+    svg_document.extract_landmarks and extract_conventions - via the shared
+    cache when one is given, so a file validate.py just saw is not re-scanned.
+    With `timings`, the read, landmark and extraction steps are recorded.
+    """
+    started = time.perf_counter()
+    document = SVGDocument.read(svg_path)
+    if timings is not None:
+        timings.record('read', time.perf_counter() - started, svg_path)
+        started = time.perf_counter()
     feature = svg_path.parent.name
     svg_name = svg_path.name
 
@@ -149,117 +242,19 @@ def extract_structure(svg_path: Path) -> SVGStructure:
         svg_name=svg_name
     )
 
-    # Extract title (y < 50, text-anchor="middle")
-    # Find ALL centered text elements and filter to those with y < 50
-    # This handles multiline elements and varying attribute order
-    text_elements = re.findall(
-        r'<text([^>]*)>([\s\S]*?)</text>',
-        content[:5000]
-    )
-
-    for attrs, text_content in text_elements:
-        # Check for text-anchor="middle"
-        if 'text-anchor="middle"' not in attrs and "text-anchor='middle'" not in attrs:
-            continue
-
-        # Extract y position
-        y_match = re.search(r'y=["\']?(\d+)', attrs)
-        if not y_match:
-            continue
-        y = int(y_match.group(1))
-
-        # Only consider elements with y < 50 (title area)
-        if y >= 50:
-            continue
-
-        # Extract x position
-        x_match = re.search(r'x=["\']?(\d+)', attrs)
-        x = int(x_match.group(1)) if x_match else None
-
-        structure.title = StructuralElement(
-            element_type='title',
-            x=x,
-            y=y,
-            text_anchor='middle'
-        )
-        break  # Found the title, stop searching
-
-    # Extract signature (y > 1040) - capture both element attributes and text content
-    sig_pattern = r'<text([^>]*y=["\']?(10[4-9]\d|1[1-9]\d\d)["\']?[^>]*)>([\s\S]*?)</text>'
-    sig_match = re.search(sig_pattern, content)
-    if sig_match:
-        sig_attrs = sig_match.group(1)
-        sig_text = sig_match.group(3).strip()
-        # Clean up text content (remove extra whitespace, newlines)
-        sig_text = ' '.join(sig_text.split())
-
-        y_match = re.search(r'y=["\']?(\d+)', sig_attrs)
-        x_match = re.search(r'x=["\']?(\d+)', sig_attrs)
-        bold = 'font-weight="bold"' in sig_attrs or 'font-weight:bold' in sig_attrs or 'font-weight="700"' in sig_attrs
-        # Check for text-anchor (centered signatures use text-anchor="middle")
-        anchor_match = re.search(r'text-anchor=["\']([^"\']+)["\']', sig_attrs)
-        text_anchor = anchor_match.group(1) if anchor_match else None
-        structure.signature = StructuralElement(
-            element_type='signature',
-            x=int(x_match.group(1)) if x_match else None,
-            y=int(y_match.group(1)) if y_match else None,
-            text_anchor=text_anchor,
-            bold=bold,
-            text=sig_text
-        )
-
-    # Extract header/footer includes
-    header_patterns = [
-        ('desktop_header', r'href=["\']includes/header-desktop\.svg#([^"\']+)["\']'),
-        ('desktop_footer', r'href=["\']includes/footer-desktop\.svg#([^"\']+)["\']'),
-        ('mobile_header', r'href=["\']includes/header-mobile\.svg#([^"\']+)["\']'),
-        ('mobile_footer', r'href=["\']includes/footer-mobile\.svg#([^"\']+)["\']'),
-    ]
-
-    for name, pattern in header_patterns:
-        match = re.search(pattern, content)
-        if match:
-            setattr(structure, name, StructuralElement(
-                element_type=name,
-                href=f"includes/{name.replace('_', '-')}.svg#{match.group(1)}"
-            ))
-
-    # Extract mockup positions from transform groups
-    desktop_match = re.search(
-        r'<g[^>]*id=["\']desktop["\'][^>]*transform=["\']translate\(\s*(\d+)\s*,\s*(\d+)\s*\)',
-        content
-    )
-    if desktop_match:
-        structure.desktop_mockup = StructuralElement(
-            element_type='desktop_mockup',
-            x=int(desktop_match.group(1)),
-            y=int(desktop_match.group(2))
-        )
-
-    mobile_match = re.search(
-        r'<g[^>]*id=["\']mobile["\'][^>]*transform=["\']translate\(\s*(\d+)\s*,\s*(\d+)\s*\)',
-        content
-    )
-    if mobile_match:
-        structure.mobile_mockup = StructuralElement(
-            element_type='mobile_mockup',
-            x=int(mobile_match.group(1)),
-            y=int(mobile_match.group(2))
-        )
-
-    # Extract annotation panel position
-    ann_match = re.search(
-        r'<g[^>]*id=["\']annotations["\'][^>]*transform=["\']translate\(\s*(\d+)\s*,\s*(\d+)\s*\)',
-        content
-    )
-    if ann_match:
-        structure.annotation_panel = StructuralElement(
-            element_type='annotation_panel',
-            x=int(ann_match.group(1)),
-            y=int(ann_match.group(2))
-        )
-
-    # Detect nav active page from content
+    if cache is not None:
+        landmarks, conventions = cache.landmarks(document), cache.conventions(document)
+    else:
+        landmarks, conventions = document.landmarks, document.conventions
+    for name, element in landmarks.items():
+        setattr(structure, name, element)
+    for name, value in conventions.items():
+        setattr(structure, name, value)
+    if timings is not None:
+        timings.record('landmarks', time.perf_counter() - started, svg_path)
+        started = time.perf_counter()
+
+    # Detect nav active page from the file name
     nav_indicators = {
         'Home': ['landing', 'home', 'index'],
         'Features': ['features', 'feature'],
@@ -273,123 +268,83 @@ def extract_structure(svg_path: Path) -> SVGStructure:
             structure.nav_active_page = page
             break
 
-    # G-044: Check for rounded corners on footer/nav
-    # Include files (footer-desktop.svg, footer-mobile.svg) already have proper corners via <path>
-    # So if using includes, the check passes. Only check inline rects if no include used.
-
-    # Check for desktop footer include
-    if re.search(r'<use[^>]*href=["\']includes/footer-desktop\.svg', content):
-        structure.desktop_footer_uses_include = True
-
-    # Check for mobile nav include
-    if re.search(r'<use[^>]*href=["\']includes/footer-mobile\.svg', content):
-        structure.mobile_nav_uses_include = True
-
-    # Fallback: check inline rects only if not using includes
-    if not structure.desktop_footer_uses_include:
-        # Desktop footer: rect with large width (1000+) in footer area (y ~640-780)
-        desktop_footer_pattern = r'<rect[^>]*\by=["\']?(6[4-9]\d|7[0-7]\d)["\']?[^>]*width=["\']?(1[0-2]\d\d)["\']?[^>]*'
-        for match in re.finditer(desktop_footer_pattern, content):
-            if 'rx=' in match.group(0):
-                structure.desktop_footer_has_rx = True
-                break
-
-    if not structure.mobile_nav_uses_include:
-        # Mobile nav: rect with width ~360 at bottom (y ~664-720)
-        mobile_nav_pattern = r'<rect[^>]*\by=["\']?(66[4-9]|6[7-9]\d|7[0-1]\d)["\']?[^>]*width=["\']?(3[4-6]\d)["\']?[^>]*'
-        for match in re.finditer(mobile_nav_pattern, content):
-            if 'rx=' in match.group(0):
-                structure.mobile_nav_has_rx = True
-                break
-
-    # G-044: Check mobile active state overlays for rx attribute
-    # Look for active state rects in mobile nav area (y=664) with purple fill (#8b5cf6)
-    # Direct rect pattern: <rect x="X" y="664" width="90" height="56" fill="#8b5cf6">
-    # where X is 0, 90, 180, or 270 for the four tabs
-    direct_active_pattern = r'<rect[^>]*x=["\']?(\d+)["\']?[^>]*y=["\']?664["\']?[^>]*fill=["\']#8b5cf6["\']?'
-    for match in re.finditer(direct_active_pattern, content):
-        rect_element = match.group(0)
-        x_pos = int(match.group(1))
-
-        # Found a direct active overlay - mark as detected
-        structure.mobile_active_detected = True
-
-        # Check for rx attribute on middle tabs (x=90 or x=180)
-        # Corner tabs (x=0 or x=270) should use <path>, not <rect>
-        if x_pos in [90, 180]:
-            if 'rx=' not in rect_element:
-                structure.mobile_active_overlay_has_rx = False
-        elif x_pos in [0, 270]:
-            # Corner tab using direct rect - this is a G-046 violation (should use path)
-            structure.mobile_active_corner_uses_path = False
-
-    # G-045 & G-046: Check mobile active state overlay
-    # Look for active state overlays in mobile section (translate near y=664 for bottom nav)
-    # Pattern: <g transform="translate(X, 664)"> where X is 0, 90, 180, or 270
-    mobile_active_pattern = r'<g[^>]*transform=["\']translate\(\s*(\d+)\s*,\s*664\s*\)["\'][^>]*>([\s\S]*?)</g>'
-    mobile_active_matches = list(re.finditer(mobile_active_pattern, content))
-
-    for match in mobile_active_matches:
-        x_pos = int(match.group(1))
-        overlay_content = match.group(2)
-
-        # Check if this looks like an active state (has fill="#8b5cf6" purple)
-        if 'fill="#8b5cf6"' not in overlay_content:
-            continue
+    if timings is not None:
+        timings.record('extract', time.perf_counter() - started, svg_path)
+    return structure
 
-        structure.mobile_active_detected = True
-
-        # G-045: Check for icon path in overlay (white-filled path)
-        # Icon paths have fill="#fff" or fill="#ffffff" or fill="white"
-        icon_pattern = r'<path[^>]*fill=["\']#fff(?:fff)?["\']'
-        if re.search(icon_pattern, overlay_content):
-            structure.mobile_active_has_icon = True
-
-        # G-046: Check corner tabs (x=0 for Home, x=270 for Account)
-        # Corner tabs should use <path> element, not <rect>
-        is_corner_tab = x_pos in [0, 270]
-        if is_corner_tab:
-            # Check if using rect instead of path for the background
-            uses_rect = '<rect' in overlay_content and 'width="90"' in overlay_content
-            uses_path = '<path' in overlay_content and ('M 0 0 L 90' in overlay_content or 'M0 0L90' in overlay_content)
-
-            if uses_rect and not uses_path:
-                structure.mobile_active_corner_uses_path = False
-
-    # G-047: Check for Key Concepts row
-    # Per G-047: Key Concepts should be at y=940 (inside annotation panel at y=800, +140 offset)
-    # Formats: <g transform="translate(40, 940)">...Key Concepts... OR <text y="940">Key Concepts:...
-
-    # Simple presence check - look for "Key Concepts" text anywhere
-    if re.search(r'[Kk]ey\s*[Cc]oncepts\s*:', content):
-        structure.has_key_concepts = True
-
-        # Find the immediate parent group transform for Key Concepts
-        # Pattern: <g transform="translate(X, Y)">...Key Concepts (within ~500 chars)
-        # The Y value IS the absolute position (not nested inside annotation panel)
-        kc_parent_pattern = r'<g[^>]*transform=["\']translate\(\s*\d+\s*,\s*(\d+)\s*\)["\'][^>]*>\s*(?:<[^>]+>\s*){0,5}[^<]*[Kk]ey\s*[Cc]oncepts'
-        kc_parent_match = re.search(kc_parent_pattern, content)
-        if kc_parent_match:
-            # The transform y IS the absolute position
-            structure.key_concepts_y = int(kc_parent_match.group(1))
-
-        # Also check for direct y attribute on text element (less common)
-        if not structure.key_concepts_y:
-            direct_pattern = r'<text[^>]*y=["\']?(\d+)["\']?[^>]*>[^<]*[Kk]ey\s*[Cc]oncepts'
-            direct_match = re.search(direct_pattern, content)
-            if direct_match:
-                structure.key_concepts_y = int(direct_match.group(1))
-
-    # G-047: Check for wrong label - "Additional Requirements" should be "Key Concepts"
-    if re.search(r'[Aa]dditional\s*[Rr]equirements\s*:', content):
-        structure.has_wrong_label = True
-        # If they have "Additional Requirements" but not "Key Concepts", still mark as missing Key Concepts
-        if not structure.has_key_concepts:
-            # The wrong label exists, so there IS a bottom row, just with wrong text
-            # We'll report both issues: wrong label AND missing Key Concepts
-            pass
 
-    return structure
+# Fields of SVGStructure holding a StructuralElement (the landmarks)
+_ELEMENT_FIELDS = frozenset(f.name for f in fields(SVGStructure) if f.type == Optional[StructuralElement])
+
+
+def pack_structure(structure: SVGStructure) -> Tuple:
+    """SVGStructure as a tuple of plain values, in field order.
+
+    What worker processes send back: pickling dataclasses repeats the
+    class and every field name per object, plain tuples don't.
+    """
+    row = []
+    for f in fields(SVGStructure):
+        value = getattr(structure, f.name)
+        if f.name == 'path':
+            value = str(value)
+        elif f.name in _ELEMENT_FIELDS and value is not None:
+            value = astuple(value)
+        row.append(value)
+    return tuple(row)
+
+
+def unpack_structure(row: Tuple) -> SVGStructure:
+    """Inverse of pack_structure."""
+    values = {}
+    for f, value in zip(fields(SVGStructure), row, strict=True):
+        if f.name == 'path':
+            value = Path(value)
+        elif f.name in _ELEMENT_FIELDS and value is not None:
+            value = StructuralElement(*value)
+        values[f.name] = value
+    return SVGStructure(**values)
+
+
+def _extract_packed(svg_path: Path, cache: Optional[DocumentCache] = None,
+                    timed: bool = False) -> Tuple[Optional[Tuple], Optional[str], Dict[str, float]]:
+    """extract_structure() in a worker: (packed structure or None, error, step timings)."""
+    timings = PhaseTimings() if timed else None
+    try:
+        structure = extract_structure(svg_path, cache, timings)
+    except Exception as e:
+        return None, str(e), {}
+    return pack_structure(structure), None, timings.files.get(svg_path, {}) if timings else {}
+
+
+def extract_structures(svg_files: List[Path], cache: Optional[DocumentCache] = None,
+                       timings: Optional[PhaseTimings] = None,
+                       jobs: int = 1) -> Iterator[Tuple[Path, Optional[SVGStructure], Optional[str]]]:
+    """Yield (svg_path, structure, error) for every file, in input order.
+
+    Extraction is independent per file, so with jobs > 1 it runs in a
+    process pool; Executor.map() hands results back in submission order,
+    so everything downstream (the cross-SVG checks, the output) sees the
+    files exactly as in a serial run. `error` is set, and `structure` is
+    None, when a file could not be read or parsed.
+    """
+    if jobs <= 1 or len(svg_files) <= 1:
+        for svg_path in svg_files:
+            try:
+                yield svg_path, extract_structure(svg_path, cache, timings), None
+            except Exception as e:
+                yield svg_path, None, str(e)
+        return
+
+    workers = min(jobs, len(svg_files))
+    chunksize = max(1, len(svg_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_extract_packed, svg_files, [cache] * len(svg_files),
+                               [timings is not None] * len(svg_files), chunksize=chunksize)
+        for svg_path, (row, error, steps) in zip(svg_files, results, strict=True):
+            if timings is not None:
+                timings.merge(svg_path, steps)
+            yield svg_path, unpack_structure(row) if row is not None else None, error
 
 
 # ============================================================
@@ -644,81 +599,313 @@ def check_patterns(structures: List[SVGStructure]) -> List[PatternViolation]:
     return violations
 
 
+# (check, value getter) for the majority-pattern checks, in report order.
+# A structure only votes when the value is present and non-zero.
+ODDBALL_CHECKS: List[Tuple[str, Callable[[SVGStructure], Optional[float]]]] = [
+    ('title_y', lambda s: s.title.y if s.title else None),
+    ('title_x', lambda s: s.title.x if s.title else None),
+    ('signature_y', lambda s: s.signature.y if s.signature else None),
+    ('desktop_x', lambda s: s.desktop_mockup.x if s.desktop_mockup else None),
+    ('mobile_x', lambda s: s.mobile_mockup.x if s.mobile_mockup else None),
+    ('annotation_y', lambda s: s.annotation_panel.y if s.annotation_panel else None),
+]
+
+
+def column_row(structure: SVGStructure) -> Tuple[int, ...]:
+    """One SVG's value for each of ODDBALL_CHECKS, 0 where it doesn't vote."""
+    row = []
+    for _, value_of in ODDBALL_CHECKS:
+        value = value_of(structure)
+        row.append(int(value) if value else 0)
+    return tuple(row)
+
+
+class StructureColumns:
+    """The majority-check metrics of a corpus, one typed column per check.
+
+    Row i belongs to `paths[i]`, in the order SVGs were added. Each column
+    is an array('q') of coordinates, 0 where the SVG doesn't vote (no such
+    landmark, or a zero value - the rule find_oddballs always applied).
+    Landmark coordinates are parsed from digit runs
+    (svg_document.extract_landmarks), so 64-bit integers hold them exactly.
+
+    That is 8 bytes per SVG per check plus the path, where the inspector
+    used to keep every SVGStructure (and its StructuralElements) alive
+    until the cross-SVG pass. With NumPy installed the mode and outlier
+    search is vectorized over the columns; without it the same search
+    runs over the arrays in Python.
+    """
+
+    TOLERANCE = 10  # Values within this many pixels count as the same
+
+    def __init__(self):
+        self.paths: List[Path] = []
+        self.columns: Dict[str, array] = {name: array('q') for name, _ in ODDBALL_CHECKS}
+
+    @classmethod
+    def from_structures(cls, structures: List[SVGStructure]) -> 'StructureColumns':
+        columns = cls()
+        for structure in structures:
+            columns.append(structure)
+        return columns
+
+    def append(self, structure: SVGStructure) -> None:
+        self.append_row(structure.path, column_row(structure))
+
+    def append_row(self, svg_path: Path, row: Tuple[int, ...]) -> None:
+        """Add one SVG's column_row(), e.g. as kept in the StructureStore."""
+        self.paths.append(svg_path)
+        for (name, _), value in zip(ODDBALL_CHECKS, row, strict=True):
+            self.columns[name].append(value)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def oddballs(self) -> List[PatternViolation]:
+        """Rows off the majority value of each check, check by check, in row order."""
+        violations = []
+        for name, _ in ODDBALL_CHECKS:
+            column = self.columns[name]
+            found = self._outliers_numpy(column) if np is not None else self._outliers(column)
+            if found is None:
+                continue
+            mode, rows = found
+            violations.extend(PatternViolation(
+                svg_path=self.paths[row],
+                check=f'{name}_oddball',
+                expected=f'majority pattern: {mode}',
+                actual=f'this SVG: {column[row]}'
+            ) for row in rows)
+        return violations
+
+    def _outliers(self, column: array) -> Optional[Tuple[int, List[int]]]:
+        """(mode, rows that differ from it), or None without a clear (> 50%) majority."""
+        voters = [(row, value) for row, value in enumerate(column) if value]
+        if len(voters) < 3:
+            return None
+        rounded = [round(value / self.TOLERANCE) * self.TOLERANCE for _, value in voters]
+        counts: Dict[int, int] = {}
+        for value in rounded:
+            counts[value] = counts.get(value, 0) + 1
+        mode = max(counts, key=counts.get)  # First seen wins a tie
+        if counts[mode] < len(voters) / 2:
+            return None
+        return mode, [row for (row, _), value in zip(voters, rounded, strict=True) if value != mode]
+
+    def _outliers_numpy(self, column: array) -> Optional[Tuple[int, List[int]]]:
+        """_outliers() on NumPy: same rounding (half to even), same tie-break."""
+        values = np.frombuffer(column, dtype=np.int64)
+        rows = np.flatnonzero(values)
+        if len(rows) < 3:
+            return None
+        rounded = (np.round(values[rows] / self.TOLERANCE) * self.TOLERANCE).astype(np.int64)
+        uniques, first_seen, counts = np.unique(rounded, return_index=True, return_counts=True)
+        mode_count = counts.max()
+        if mode_count < len(rows) / 2:
+            return None
+        tied = np.flatnonzero(counts == mode_count)
+        mode = int(uniques[tied[np.argmin(first_seen[tied])]])
+        return mode, rows[rounded != mode].tolist()
+
+
 def find_oddballs(structures: List[SVGStructure]) -> List[PatternViolation]:
     """Find SVGs that deviate from the majority pattern (oddballs)."""
-    violations = []
+    return StructureColumns.from_structures(structures).oddballs()
 
-    # Collect actual values for each check
-    title_y_values = []
-    title_x_values = []
-    signature_y_values = []
-    desktop_x_values = []
-    mobile_x_values = []
-    annotation_y_values = []
-
-    for s in structures:
-        if s.title and s.title.y:
-            title_y_values.append((s.path, s.title.y))
-        if s.title and s.title.x:
-            title_x_values.append((s.path, s.title.x))
-        if s.signature and s.signature.y:
-            signature_y_values.append((s.path, s.signature.y))
-        if s.desktop_mockup and s.desktop_mockup.x:
-            desktop_x_values.append((s.path, s.desktop_mockup.x))
-        if s.mobile_mockup and s.mobile_mockup.x:
-            mobile_x_values.append((s.path, s.mobile_mockup.x))
-        if s.annotation_panel and s.annotation_panel.y:
-            annotation_y_values.append((s.path, s.annotation_panel.y))
-
-    def find_outliers(values: List, check_name: str, tolerance: int = 10):
-        """Find values that differ significantly from the majority."""
-        if len(values) < 3:
-            return []
-
-        # Find most common value (mode)
-        value_counts = {}
-        for path, val in values:
-            rounded = round(val / tolerance) * tolerance
-            value_counts[rounded] = value_counts.get(rounded, 0) + 1
-
-        if not value_counts:
-            return []
-
-        mode = max(value_counts, key=value_counts.get)
-        mode_count = value_counts[mode]
-
-        # Only flag if there's a clear majority (> 50%)
-        if mode_count < len(values) / 2:
-            return []
-
-        outliers = []
-        for path, val in values:
-            rounded = round(val / tolerance) * tolerance
-            if rounded != mode:
-                outliers.append(PatternViolation(
-                    svg_path=path,
-                    check=f'{check_name}_oddball',
-                    expected=f'majority pattern: {mode}',
-                    actual=f'this SVG: {val}'
-                ))
-        return outliers
 
-    violations.extend(find_outliers(title_y_values, 'title_y'))
-    violations.extend(find_outliers(title_x_values, 'title_x'))
-    violations.extend(find_outliers(signature_y_values, 'signature_y'))
-    violations.extend(find_outliers(desktop_x_values, 'desktop_x'))
-    violations.extend(find_outliers(mobile_x_values, 'mobile_x'))
-    violations.extend(find_outliers(annotation_y_values, 'annotation_y'))
+def inspect_structures(extracted: Iterable[Tuple[Path, Optional[SVGStructure], Optional[str]]],
+                       timings: Optional[PhaseTimings] = None
+                       ) -> Iterator[Tuple[Path, Optional[Tuple[int, ...]], List[PatternViolation], Optional[str]]]:
+    """Per-SVG results for extract_structures() output: (svg_path, column row, violations, error).
 
-    return violations
+    Each structure is pattern-checked as it arrives and only its column
+    row is kept, so no more than one SVGStructure is alive at a time.
+    """
+    for svg_path, structure, error in extracted:
+        if error is not None:
+            yield svg_path, None, [], error
+            continue
+        started = time.perf_counter()
+        violations = check_patterns([structure])
+        if timings is not None:
+            timings.record('check', time.perf_counter() - started, svg_path)
+        yield svg_path, column_row(structure), violations, None
+
+
+# ============================================================
+# STRUCTURE STORE - Re-extract only what changed between runs
+# ============================================================
+
+class StructureStore:
+    """Every SVG's inspection results, kept across runs.
+
+    Entries are keyed by path and hold the stat signature and content hash
+    they were computed from, the SVG's column_row() and its own
+    check_patterns() violations. A run stats every file, hashes only those
+    whose size or mtime moved and re-extracts and re-checks only those
+    whose content changed; everything else comes straight from the entry,
+    so after a one-file edit the per-file work is O(changed) and the
+    cross-SVG pass only reassembles the columns from the stored rows. One
+    store per set of roots (like validate.py's escalation index); the
+    whole store is dropped when this script or svg_document.py changes,
+    which covers the checks as well as the extraction.
+    """
+
+    VERSION = 4
+    PREFIX = "structures"
+
+    def __init__(self, cache_dir: Path, roots: List[Path]):
+        key = hashlib.sha256("\0".join(sorted(str(r) for r in roots)).encode()).hexdigest()[:12]
+        self.store_path = cache_dir / f"{self.PREFIX}-{key}.pickle"
+        # str(path) -> ((mtime_ns, size), sha256, column row, violations as
+        # (check, expected, actual, severity) tuples). Plain string
+        # keys: unpickling thousands of Path objects is most of a load.
+        self.entries: Dict[str, Tuple[Tuple[int, int], str, Tuple[int, ...], Tuple[Tuple, ...]]] = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.store_path, 'rb') as f:
+                version, fingerprint, entries = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            return
+        if version != self.VERSION or fingerprint != _extractor_fingerprint():
+            self.dirty = True
+            return
+        self.entries = entries
+
+    def _forget(self, key: str) -> None:
+        if self.entries.pop(key, None) is not None:
+            self.dirty = True
+
+    def update(self, svg_files: List[Path], cache: Optional[DocumentCache] = None,
+               timings: Optional[PhaseTimings] = None,
+               jobs: int = 1
+               ) -> Iterator[Tuple[Path, Optional[Tuple[int, ...]], List[PatternViolation], Optional[str]]]:
+        """Bring the store in line with `svg_files`; yields like inspect_structures().
+
+        Files no longer in the list are dropped. Files that fail to extract
+        have no entry, so they are retried (and reported) on every run.
+        """
+        started = time.perf_counter()
+        current = {str(p) for p in svg_files}
+        for key in [k for k in self.entries if k not in current]:
+            self._forget(key)
+
+        stale: List[Path] = []
+        signatures: Dict[Path, Tuple[Tuple[int, int], Optional[str]]] = {}
+        for svg_path in svg_files:
+            entry = self.entries.get(str(svg_path))
+            try:
+                st = svg_path.stat()
+            except OSError:
+                stale.append(svg_path)  # extract_structure reports it
+                continue
+            signature = (st.st_mtime_ns, st.st_size)
+            if entry is not None and entry[0] == signature:
+                continue
+            try:
+                digest = hashlib.sha256(svg_path.read_bytes()).hexdigest()
+            except OSError:
+                stale.append(svg_path)
+                continue
+            if entry is not None and entry[1] == digest:
+                self.entries[str(svg_path)] = (signature, digest, *entry[2:])  # Touched, not changed
+                self.dirty = True
+                continue
+            signatures[svg_path] = (signature, digest)
+            stale.append(svg_path)
+        if timings is not None:
+            timings.record('store', time.perf_counter() - started)
+
+        fresh: Dict[Path, List[PatternViolation]] = {}
+        errors: Dict[Path, str] = {}
+        for svg_path, row, violations, error in inspect_structures(
+                extract_structures(stale, cache, timings, jobs), timings):
+            self._forget(str(svg_path))
+            if error is not None or svg_path not in signatures:
+                errors[svg_path] = error or "file vanished during the run"
+                continue
+            signature, digest = signatures[svg_path]
+            packed = tuple((v.check, v.expected, v.actual, v.severity) for v in violations)
+            self.entries[str(svg_path)] = (signature, digest, row, packed)
+            self.dirty = True
+            fresh[svg_path] = violations
+
+        for svg_path in svg_files:
+            if svg_path in errors:
+                yield svg_path, None, [], errors[svg_path]
+                continue
+            entry = self.entries[str(svg_path)]
+            if svg_path in fresh:
+                yield svg_path, entry[2], fresh[svg_path], None
+            else:
+                yield svg_path, entry[2], [PatternViolation(svg_path, *v) for v in entry[3]], None
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        try:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.store_path.with_name(f"{self.store_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((self.VERSION, _extractor_fingerprint(), self.entries), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.store_path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: Could not write structure store: {e}", file=sys.stderr)
+
+
+_fingerprint: Optional[str] = None
+
+
+def _extractor_fingerprint() -> str:
+    """Hash of the extraction code (this script and svg_document.py)."""
+    global _fingerprint
+    if _fingerprint is None:
+        h = hashlib.sha256()
+        for source in (__file__, svg_document.__file__):
+            h.update(Path(source).resolve().read_bytes())
+        _fingerprint = h.hexdigest()
+    return _fingerprint
 
 
 # ============================================================
 # ISSUE LOGGING
 # ============================================================
 
-def log_violations(violations: List[PatternViolation], wireframes_dir: Path):
-    """Log violations to per-SVG .issues.md files."""
+_INSPECTOR_SECTION_RE = re.compile(r'## Inspector Issues \([^)]+\).*?(?=\n## |\Z)', re.DOTALL)
+
+
+def clear_inspector_section(issues_file: Path) -> bool:
+    """Drop the Inspector Issues section from an .issues.md file, if it has one.
+
+    validate.py carries the section over when it rewrites the file, so
+    this is what removes it once the SVG is fixed. Returns whether the
+    file was written.
+    """
+    try:
+        existing = issues_file.read_text()
+    except OSError:
+        return False
+    section = _INSPECTOR_SECTION_RE.search(existing)
+    if not section:
+        return False
+    before = existing[:section.start()].rstrip()
+    after = existing[section.end():].lstrip("\n")
+    content = f"{before}\n\n{after}" if after else f"{before}\n"
+    return write_if_changed(issues_file, content)
+
+
+def log_violations(violations: List[PatternViolation], wireframes_dir: Path) -> int:
+    """Log violations to per-SVG .issues.md files.
+
+    Files whose inspector section would come out the same (apart from its
+    date) are left untouched; returns how many files were written.
+    """
+    written = 0
     # Group violations by SVG
     by_svg: Dict[Path, List[PatternViolation]] = {}
     for v in violations:
@@ -754,8 +941,14 @@ def log_violations(violations: List[PatternViolation], wireframes_dir: Path):
         # Append to existing file or create new
         if existing_content and "## Inspector Issues" in existing_content:
             # Replace existing inspector section
-            pattern = r'## Inspector Issues \([^)]+\).*?(?=\n## |\Z)'
-            new_content = re.sub(pattern, "\n".join(lines[1:]), existing_content, flags=re.DOTALL)
+            new_content = _INSPECTOR_SECTION_RE.sub("\n".join(lines[1:]), existing_content)
+            # Same violations as last time: keep that section's date
+            previous = re.search(r'## Inspector Issues \(([^)]+)\)', existing_content)
+            if previous:
+                as_before = new_content.replace(f"## Inspector Issues ({today})",
+                                                f"## Inspector Issues ({previous.group(1)})")
+                if as_before == existing_content:
+                    new_content = as_before
         elif existing_content:
             # Append to existing file
             new_content = existing_content.rstrip() + "\n" + "\n".join(lines)
@@ -772,13 +965,42 @@ def log_violations(violations: List[PatternViolation], wireframes_dir: Path):
             ]
             new_content = "\n".join(header + lines)
 
-        issues_file.write_text(new_content)
+        if not write_if_changed(issues_file, new_content):
+            continue
+        written += 1
         try:
             display = issues_file.relative_to(wireframes_dir)
         except ValueError:
             display = issues_file
         print(f"  Issues logged to: {display}")
 
+    return written
+
+
+def clear_fixed(inspected: List[Path], violations: List[PatternViolation], wireframes_dir: Path) -> int:
+    """Clear the inspector section of every inspected SVG with no violations left.
+
+    Only meaningful after an --all run: a single-file inspect skips the
+    oddball checks, so a clean result there doesn't mean the SVG is fixed.
+
+    Returns how many .issues.md files were written.
+    """
+    flagged = {v.svg_path for v in violations}
+    cleared = 0
+    for svg_path in inspected:
+        if svg_path in flagged:
+            continue
+        issues_file = svg_path.parent / f"{svg_path.stem}.issues.md"
+        if not clear_inspector_section(issues_file):
+            continue
+        cleared += 1
+        try:
+            display = issues_file.relative_to(wireframes_dir)
+        except ValueError:
+            display = issues_file
+        print(f"  Inspector issues cleared from: {display}")
+    return cleared
+
 
 # ============================================================
 # MAIN
@@ -789,10 +1011,17 @@ def main():
         print("Usage: python inspect-wireframes.py --all [--root PATH]...")
         print("       python inspect-wireframes.py --report [--root PATH]...")
         print("       python inspect-wireframes.py <svg-path>")
+        print("Options: --no-cache  Don't use the shared SVG model cache or the structure store")
+        print("         --timings[=N]  Time each phase and list the N slowest SVGs (default 10)")
+        print("         --jobs N       Extract structure in N worker processes (default: CPU count)")
         sys.exit(1)
 
     # Collect --root overrides (repeatable)
     explicit_roots: List[Path] = []
+    use_cache = True
+    timings: Optional[PhaseTimings] = None
+    slowest_top = 10
+    jobs = os.cpu_count() or 1
     raw_argv = sys.argv[1:]
     filtered: List[str] = []
     i = 0
@@ -809,6 +1038,39 @@ def main():
             explicit_roots.append(Path(a.split('=', 1)[1]).resolve())
             i += 1
             continue
+        if a == '--no-cache':
+            use_cache = False
+            i += 1
+            continue
+        if a == '--jobs' or a.startswith('--jobs='):
+            if '=' in a:
+                value = a.split('=', 1)[1]
+                i += 1
+            elif i + 1 < len(raw_argv):
+                value = raw_argv[i + 1]
+                i += 2
+            else:
+                print("ERROR: --jobs requires a value")
+                sys.exit(1)
+            try:
+                jobs = int(value)
+            except ValueError:
+                print(f"ERROR: --jobs expects an integer, got '{value}'")
+                sys.exit(1)
+            if jobs < 1:
+                print("ERROR: --jobs must be at least 1")
+                sys.exit(1)
+            continue
+        if a == '--timings' or a.startswith('--timings='):
+            timings = PhaseTimings()
+            if '=' in a:
+                try:
+                    slowest_top = int(a.split('=', 1)[1])
+                except ValueError:
+                    print(f"ERROR: --timings expects a number of SVGs, got '{a.split('=', 1)[1]}'")
+                    sys.exit(1)
+            i += 1
+            continue
         filtered.append(a)
         i += 1
 
@@ -880,20 +1142,42 @@ def main():
     print(f"INSPECTING {len(svg_files)} SVG FILES")
     print('='*60)
 
-    # Extract structure from all SVGs
-    structures = []
-    for svg_file in svg_files:
-        try:
-            structure = extract_structure(svg_file)
-            structures.append(structure)
-        except Exception as e:
-            print(f"  ERROR parsing {svg_file.name}: {e}")
+    # Landmarks validate.py already extracted are shared through <project>/.cache/
+    cache = DocumentCache(project_root / '.cache' / 'svg-model') if use_cache else None
+
+    # Whole-corpus runs keep every structure between runs and only
+    # re-extract the SVGs that changed
+    store = None
+    if use_cache and filtered[0] in ('--all', '--report'):
+        store = StructureStore(project_root / '.cache' / 'inspect', [wireframes_dir, *extra_roots])
+
+    # Extract structure from all SVGs (in parallel) and check each one;
+    # with the store, only the SVGs that changed. Only the per-file
+    # violations and majority-check metrics are kept.
+    if store is not None:
+        inspected = store.update(svg_files, cache, timings, jobs)
+    else:
+        inspected = inspect_structures(extract_structures(svg_files, cache, timings, jobs), timings)
+    columns = StructureColumns()
+    violations = []
+    for svg_file, row, file_violations, error in inspected:
+        if error is not None:
+            print(f"  ERROR parsing {svg_file.name}: {error}")
+            continue
+        violations.extend(file_violations)
+        columns.append_row(svg_file, row)
+    if store is not None:
+        store.save()
 
-    # Run pattern checks
-    violations = check_patterns(structures)
+    # Only a whole-corpus run evaluates every check (a single SVG has no
+    # majority to deviate from), so only it may clear logged sections
+    full_run = filtered[0] == '--all'
 
     # Find oddballs (deviations from majority)
-    oddball_violations = find_oddballs(structures)
+    started = time.perf_counter()
+    oddball_violations = columns.oddballs()
+    if timings is not None:
+        timings.record('oddballs', time.perf_counter() - started)
     violations.extend(oddball_violations)
 
     def _display_path(p: Path) -> str:
@@ -907,7 +1191,7 @@ def main():
     # Report mode - JSON output
     if filtered[0] == '--report':
         report = {
-            'total_svgs': len(structures),
+            'total_svgs': len(columns),
             'total_violations': len(violations),
             'violations_by_svg': {},
             'violations_by_check': {},
@@ -927,6 +1211,9 @@ def main():
                 report['violations_by_check'][v.check] = []
             report['violations_by_check'][v.check].append(svg_key)
 
+        if timings is not None:
+            report['timings'] = timings.to_json(_display_path, slowest_top)
+            timings.report(_display_path, slowest_top)
         print(json.dumps(report, indent=2))
         sys.exit(0)
 
@@ -949,12 +1236,26 @@ def main():
             print()
 
         # Log to issues files
-        log_violations(violations, wireframes_dir)
+        started = time.perf_counter()
+        written = log_violations(violations, wireframes_dir)
+        cleared = clear_fixed(columns.paths, violations, wireframes_dir) if full_run else 0
+        if timings is not None:
+            timings.record('log_violations', time.perf_counter() - started)
+            timings.report(_display_path, slowest_top)
+        print(f"\nIssues files: {written} written, {len(by_svg) - written} already up to date"
+              + (f", {cleared} cleared" if cleared else ""))
 
         print(f"\n{'='*60}")
         print(f"STATUS: {len(violations)} PATTERN VIOLATIONS")
         sys.exit(1)
     else:
+        # Fixed SVGs still carry the section an earlier run logged
+        started = time.perf_counter()
+        if full_run:
+            clear_fixed(columns.paths, violations, wireframes_dir)
+        if timings is not None:
+            timings.record('log_violations', time.perf_counter() - started)
+            timings.report(_display_path, slowest_top)
         print("\nAll SVGs follow consistent patterns.")
         print(f"\n{'='*60}")
         print("STATUS: PASS")
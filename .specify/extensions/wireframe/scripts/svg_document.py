@@ -0,0 +1,455 @@
+"""
+Shared SVG text helpers for the wireframe scripts.
+
+validate.py, inspect-wireframes.py and friends are run as scripts (their
+hyphenated names can't be imported), so anything they share lives here and
+is imported from the script directory.
+
+LineIndex: offset -> line number lookups, built with one bulk newline scan.
+SVGDocument: one read per SVG, shared by the hash, the text and the XML parse.
+extract_landmarks / DocumentCache: the title, signature, include, mockup and
+    annotation-panel positions both tools look at, cached per content hash.
+extract_conventions: the inspector's footer/nav and Key Concepts checks,
+    cached alongside the landmarks.
+write_if_changed: atomic compare-before-write for the .issues.md logs.
+"""
+
+import bisect
+import hashlib
+import io
+import os
+import pickle
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+_NEWLINE_RE = re.compile('\n')
+
+
+class LineIndex:
+    """Start offset of every line in a text, for O(log n) line lookups.
+
+    Built with one C-level `re.finditer('\\n')` pass instead of a Python loop
+    over every character (see bench-line-index.py for the numbers).
+    """
+
+    __slots__ = ('offsets',)
+
+    def __init__(self, text: str):
+        self.offsets: List[int] = [0]
+        self.offsets.extend(m.end() for m in _NEWLINE_RE.finditer(text))
+
+    def line_of(self, pos: int) -> int:
+        """1-based line number of the character at offset `pos`."""
+        return bisect.bisect_right(self.offsets, pos)
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+
+# ============================================================
+# DOCUMENT MODEL - One read per SVG, shared by every tool
+# ============================================================
+
+class SVGDocument:
+    """One SVG file, read from disk exactly once.
+
+    The raw bytes are kept so the same read serves the content hash (cache
+    keys), the decoded text (regex checks) and the XML parse, instead of
+    each consumer opening the file again. Everything derived is computed on
+    first use.
+    """
+
+    __slots__ = ('path', 'data', '_sha256', '_text', '_lines', '_landmarks', '_conventions')
+
+    def __init__(self, path: Path, data: bytes):
+        self.path = path
+        self.data = data
+        self._sha256: Optional[str] = None
+        self._text: Optional[str] = None
+        self._lines: Optional[LineIndex] = None
+        self._landmarks: Optional[Dict[str, StructuralElement]] = None
+        self._conventions: Optional[Dict[str, object]] = None
+
+    @classmethod
+    def read(cls, path: Path) -> 'SVGDocument':
+        return cls(path, path.read_bytes())
+
+    @property
+    def sha256(self) -> str:
+        if self._sha256 is None:
+            self._sha256 = hashlib.sha256(self.data).hexdigest()
+        return self._sha256
+
+    @property
+    def text(self) -> str:
+        """Decoded exactly like Path.read_text() (locale encoding, universal newlines)."""
+        if self._text is None:
+            self._text = io.TextIOWrapper(io.BytesIO(self.data)).read()
+        return self._text
+
+    @property
+    def lines(self) -> LineIndex:
+        if self._lines is None:
+            self._lines = LineIndex(self.text)
+        return self._lines
+
+    @property
+    def landmarks(self) -> Dict[str, 'StructuralElement']:
+        """Title, signature, includes, mockups and annotation panel (see extract_landmarks)."""
+        if self._landmarks is None:
+            self._landmarks = extract_landmarks(self.text, self.lines)
+        return self._landmarks
+
+    @property
+    def conventions(self) -> Dict[str, object]:
+        """Footer/nav and annotation convention facts (see extract_conventions)."""
+        if self._conventions is None:
+            self._conventions = extract_conventions(self.text)
+        return self._conventions
+
+    def parse(self) -> ET.ElementTree:
+        """Parse the bytes already in memory; same result (and errors) as ET.parse(path)."""
+        return ET.parse(io.BytesIO(self.data))
+
+
+@dataclass
+class StructuralElement:
+    """Extracted structural element from an SVG."""
+    element_type: str
+    x: Optional[float] = None
+    y: Optional[float] = None
+    width: Optional[float] = None
+    height: Optional[float] = None
+    text_anchor: Optional[str] = None
+    bold: bool = False
+    href: Optional[str] = None
+    text: Optional[str] = None  # Text content (for signature format validation)
+    line: Optional[int] = None  # Source line where the element starts
+
+
+_TEXT_ELEMENT_RE = re.compile(r'<text([^>]*)>([\s\S]*?)</text>')
+_Y_DIGITS_RE = re.compile(r'y=["\']?(\d+)')
+_X_DIGITS_RE = re.compile(r'x=["\']?(\d+)')
+_SIGNATURE_RE = re.compile(r'<text([^>]*y=["\']?(10[4-9]\d|1[1-9]\d\d)["\']?[^>]*)>([\s\S]*?)</text>')
+_TEXT_ANCHOR_RE = re.compile(r'text-anchor=["\']([^"\']+)["\']')
+_INCLUDE_RES = [
+    ('desktop_header', re.compile(r'href=["\']includes/header-desktop\.svg#([^"\']+)["\']')),
+    ('desktop_footer', re.compile(r'href=["\']includes/footer-desktop\.svg#([^"\']+)["\']')),
+    ('mobile_header', re.compile(r'href=["\']includes/header-mobile\.svg#([^"\']+)["\']')),
+    ('mobile_footer', re.compile(r'href=["\']includes/footer-mobile\.svg#([^"\']+)["\']')),
+]
+_PLACEMENT_RES = [
+    (name, re.compile(rf'<g[^>]*id=["\']{group_id}["\'][^>]*transform=["\']translate\(\s*(\d+)\s*,\s*(\d+)\s*\)'))
+    for name, group_id in (('desktop_mockup', 'desktop'),
+                           ('mobile_mockup', 'mobile'),
+                           ('annotation_panel', 'annotations'))
+]
+
+
+def extract_landmarks(content: str, lines: LineIndex) -> Dict[str, StructuralElement]:
+    """Locate the layout landmarks every wireframe is expected to have.
+
+    Returns the ones found, keyed by the SVGStructure field they fill in
+    inspect-wireframes.py: title, signature, desktop/mobile header and
+    footer includes, desktop/mobile mockups and the annotation panel.
+    """
+    landmarks: Dict[str, StructuralElement] = {}
+
+    # Title (y < 50, text-anchor="middle")
+    # Find ALL centered text elements and filter to those with y < 50
+    # This handles multiline elements and varying attribute order
+    for text_match in _TEXT_ELEMENT_RE.finditer(content[:5000]):
+        attrs = text_match.group(1)
+        if 'text-anchor="middle"' not in attrs and "text-anchor='middle'" not in attrs:
+            continue
+
+        y_match = _Y_DIGITS_RE.search(attrs)
+        if not y_match:
+            continue
+        y = int(y_match.group(1))
+
+        # Only consider elements with y < 50 (title area)
+        if y >= 50:
+            continue
+
+        x_match = _X_DIGITS_RE.search(attrs)
+        landmarks['title'] = StructuralElement(
+            element_type='title',
+            x=int(x_match.group(1)) if x_match else None,
+            y=y,
+            text_anchor='middle',
+            line=lines.line_of(text_match.start())
+        )
+        break  # Found the title, stop searching
+
+    # Signature (y > 1040) - capture both element attributes and text content
+    sig_match = _SIGNATURE_RE.search(content)
+    if sig_match:
+        sig_attrs = sig_match.group(1)
+        # Clean up text content (remove extra whitespace, newlines)
+        sig_text = ' '.join(sig_match.group(3).strip().split())
+
+        y_match = _Y_DIGITS_RE.search(sig_attrs)
+        x_match = _X_DIGITS_RE.search(sig_attrs)
+        bold = 'font-weight="bold"' in sig_attrs or 'font-weight:bold' in sig_attrs or 'font-weight="700"' in sig_attrs
+        # Check for text-anchor (centered signatures use text-anchor="middle")
+        anchor_match = _TEXT_ANCHOR_RE.search(sig_attrs)
+        landmarks['signature'] = StructuralElement(
+            element_type='signature',
+            x=int(x_match.group(1)) if x_match else None,
+            y=int(y_match.group(1)) if y_match else None,
+            text_anchor=anchor_match.group(1) if anchor_match else None,
+            bold=bold,
+            text=sig_text,
+            line=lines.line_of(sig_match.start())
+        )
+
+    # Header/footer includes
+    for name, pattern in _INCLUDE_RES:
+        match = pattern.search(content)
+        if match:
+            landmarks[name] = StructuralElement(
+                element_type=name,
+                href=f"includes/{name.replace('_', '-')}.svg#{match.group(1)}",
+                line=lines.line_of(match.start())
+            )
+
+    # Mockup and annotation panel positions from their transform groups
+    for name, pattern in _PLACEMENT_RES:
+        match = pattern.search(content)
+        if match:
+            landmarks[name] = StructuralElement(
+                element_type=name,
+                x=int(match.group(1)),
+                y=int(match.group(2)),
+                line=lines.line_of(match.start())
+            )
+
+    return landmarks
+
+
+_FOOTER_INCLUDE_RE = re.compile(r'<use[^>]*href=["\']includes/footer-desktop\.svg')
+_MOBILE_NAV_INCLUDE_RE = re.compile(r'<use[^>]*href=["\']includes/footer-mobile\.svg')
+# Desktop footer: rect with large width (1000+) in footer area (y ~640-780)
+_DESKTOP_FOOTER_RECT_RE = re.compile(r'<rect[^>]*\by=["\']?(6[4-9]\d|7[0-7]\d)["\']?[^>]*width=["\']?(1[0-2]\d\d)["\']?[^>]*')
+# Mobile nav: rect with width ~360 at bottom (y ~664-720)
+_MOBILE_NAV_RECT_RE = re.compile(r'<rect[^>]*\by=["\']?(66[4-9]|6[7-9]\d|7[0-1]\d)["\']?[^>]*width=["\']?(3[4-6]\d)["\']?[^>]*')
+# Direct active tab rect: <rect x="X" y="664" width="90" height="56" fill="#8b5cf6">
+_ACTIVE_RECT_RE = re.compile(r'<rect[^>]*x=["\']?(\d+)["\']?[^>]*y=["\']?664["\']?[^>]*fill=["\']#8b5cf6["\']?')
+# Active tab overlay group: <g transform="translate(X, 664)">
+_ACTIVE_GROUP_RE = re.compile(r'<g[^>]*transform=["\']translate\(\s*(\d+)\s*,\s*664\s*\)["\'][^>]*>([\s\S]*?)</g>')
+_ICON_PATH_RE = re.compile(r'<path[^>]*fill=["\']#fff(?:fff)?["\']')
+_KEY_CONCEPTS_RE = re.compile(r'[Kk]ey\s*[Cc]oncepts\s*:')
+_KEY_CONCEPTS_GROUP_RE = re.compile(r'<g[^>]*transform=["\']translate\(\s*\d+\s*,\s*(\d+)\s*\)["\'][^>]*>\s*(?:<[^>]+>\s*){0,5}[^<]*[Kk]ey\s*[Cc]oncepts')
+_KEY_CONCEPTS_TEXT_RE = re.compile(r'<text[^>]*y=["\']?(\d+)["\']?[^>]*>[^<]*[Kk]ey\s*[Cc]oncepts')
+_WRONG_LABEL_RE = re.compile(r'[Aa]dditional\s*[Rr]equirements\s*:')
+
+
+def extract_conventions(content: str) -> Dict[str, object]:
+    """Check the footer/nav and annotation conventions (G-044 to G-047).
+
+    Returns every fact, keyed by the SVGStructure field it fills in
+    inspect-wireframes.py: footer and mobile nav includes or rounded
+    inline rects, the mobile active tab overlay, and the Key Concepts row.
+    """
+    conventions: Dict[str, object] = {
+        'desktop_footer_uses_include': False,
+        'desktop_footer_has_rx': False,
+        'mobile_nav_uses_include': False,
+        'mobile_nav_has_rx': False,
+        'mobile_active_overlay_has_rx': True,
+        'mobile_active_has_icon': False,
+        'mobile_active_corner_uses_path': True,
+        'mobile_active_detected': False,
+        'has_key_concepts': False,
+        'has_wrong_label': False,
+        'key_concepts_y': None,
+    }
+
+    # G-044: Rounded corners on footer/nav. The include files already have
+    # proper corners via <path>, so inline rects are only checked without them.
+    if _FOOTER_INCLUDE_RE.search(content):
+        conventions['desktop_footer_uses_include'] = True
+    if _MOBILE_NAV_INCLUDE_RE.search(content):
+        conventions['mobile_nav_uses_include'] = True
+
+    if not conventions['desktop_footer_uses_include']:
+        for match in _DESKTOP_FOOTER_RECT_RE.finditer(content):
+            if 'rx=' in match.group(0):
+                conventions['desktop_footer_has_rx'] = True
+                break
+
+    if not conventions['mobile_nav_uses_include']:
+        for match in _MOBILE_NAV_RECT_RE.finditer(content):
+            if 'rx=' in match.group(0):
+                conventions['mobile_nav_has_rx'] = True
+                break
+
+    # G-044: Active tab rects in the mobile nav (x is 0, 90, 180 or 270).
+    # Middle tabs need rx; corner tabs should be a <path>, not a <rect>.
+    for match in _ACTIVE_RECT_RE.finditer(content):
+        x_pos = int(match.group(1))
+        conventions['mobile_active_detected'] = True
+        if x_pos in [90, 180]:
+            if 'rx=' not in match.group(0):
+                conventions['mobile_active_overlay_has_rx'] = False
+        elif x_pos in [0, 270]:
+            conventions['mobile_active_corner_uses_path'] = False
+
+    # G-045 & G-046: Active tab overlay groups (purple fill)
+    for match in _ACTIVE_GROUP_RE.finditer(content):
+        x_pos = int(match.group(1))
+        overlay_content = match.group(2)
+        if 'fill="#8b5cf6"' not in overlay_content:
+            continue
+
+        conventions['mobile_active_detected'] = True
+
+        # G-045: White icon path in the overlay
+        if _ICON_PATH_RE.search(overlay_content):
+            conventions['mobile_active_has_icon'] = True
+
+        # G-046: Corner tabs (Home, Account) use a <path> background
+        if x_pos in [0, 270]:
+            uses_rect = '<rect' in overlay_content and 'width="90"' in overlay_content
+            uses_path = '<path' in overlay_content and ('M 0 0 L 90' in overlay_content or 'M0 0L90' in overlay_content)
+            if uses_rect and not uses_path:
+                conventions['mobile_active_corner_uses_path'] = False
+
+    # G-047: Key Concepts row, positioned by its parent group's translate
+    # (the absolute y) or, less commonly, the text's own y
+    if _KEY_CONCEPTS_RE.search(content):
+        conventions['has_key_concepts'] = True
+        kc_parent_match = _KEY_CONCEPTS_GROUP_RE.search(content)
+        if kc_parent_match:
+            conventions['key_concepts_y'] = int(kc_parent_match.group(1))
+        if not conventions['key_concepts_y']:
+            direct_match = _KEY_CONCEPTS_TEXT_RE.search(content)
+            if direct_match:
+                conventions['key_concepts_y'] = int(direct_match.group(1))
+
+    # G-047: "Additional Requirements" is the wrong label for that row
+    if _WRONG_LABEL_RE.search(content):
+        conventions['has_wrong_label'] = True
+
+    return conventions
+
+
+class DocumentCache:
+    """On-disk cache of extracted landmarks and conventions, one pickle per content hash.
+
+    validate.py fills it as it validates, so an inspect-wireframes.py pass
+    straight afterwards only unpickles what it needs instead of re-running
+    any of its per-SVG regexes. Keyed by content alone (a renamed or copied SVG
+    still hits); each entry records the fingerprint of this module and is
+    ignored once the extraction code changes.
+
+    The parsed ElementTree is deliberately not cached: unpickling a tree
+    measured slower than letting expat parse the bytes again.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def landmarks(self, document: SVGDocument) -> Dict[str, StructuralElement]:
+        """The document's landmarks, from the cache when present (else computed and stored)."""
+        self.load(document)
+        return document.landmarks
+
+    def conventions(self, document: SVGDocument) -> Dict[str, object]:
+        """The document's conventions, from the cache when present (else computed and stored)."""
+        self.load(document)
+        return document.conventions
+
+    def load(self, document: SVGDocument) -> None:
+        """Fill in the document's landmarks and conventions from its entry, or store them."""
+        if document._landmarks is not None and document._conventions is not None:
+            return
+        entry_path = self.cache_dir / f"{document.sha256}.pickle"
+        try:
+            with open(entry_path, 'rb') as f:
+                fingerprint, landmarks, conventions = pickle.load(f)
+            if fingerprint == _model_fingerprint():
+                document._landmarks = landmarks
+                document._conventions = conventions
+                return
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            pass
+
+        entry = (_model_fingerprint(), document.landmarks, document.conventions)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            pass  # Caching is best-effort
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """Delete entries whose content hash isn't in `keep`; returns how many.
+
+        Every edited revision of an SVG leaves an entry behind, so a run
+        that has seen the whole corpus passes the hashes still current.
+        """
+        keep_hashes = set(keep)
+        count = 0
+        if self.cache_dir.is_dir():
+            for entry_path in self.cache_dir.glob('*.pickle'):
+                if entry_path.stem not in keep_hashes:
+                    entry_path.unlink(missing_ok=True)
+                    count += 1
+        return count
+
+    def clear(self) -> int:
+        """Delete every entry; returns how many there were."""
+        count = 0
+        if self.cache_dir.is_dir():
+            for entry_path in self.cache_dir.glob('*.pickle'):
+                entry_path.unlink(missing_ok=True)
+                count += 1
+        return count
+
+
+_fingerprint: Optional[str] = None
+
+
+def _model_fingerprint() -> str:
+    """Hash of this module's source; cached landmarks from other code are stale."""
+    global _fingerprint
+    if _fingerprint is None:
+        _fingerprint = hashlib.sha256(Path(__file__).resolve().read_bytes()).hexdigest()
+    return _fingerprint
+
+
+# ============================================================
+# WRITING - Leave unchanged files (and their mtimes) alone
+# ============================================================
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write `content` to `path` unless the file already holds exactly that.
+
+    Unchanged files keep their mtime, so mtime-keyed caches and "last
+    touched" ages downstream stay meaningful. Changed files are replaced
+    atomically (temp file in the same directory, then os.replace), so a
+    reader never sees a half-written file. Returns whether it wrote.
+    """
+    try:
+        if path.read_text() == content:
+            return False
+        mode = path.stat().st_mode & 0o7777
+    except (OSError, UnicodeDecodeError):
+        mode = None
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(content)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return True
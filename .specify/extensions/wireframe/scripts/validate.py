@@ -1,10 +1,21 @@
 #!/usr/bin/env python3
 """
-SVG Wireframe Validator v5.4
+SVG Wireframe Validator v5.15
 
 Programmatically checks wireframe SVGs against ScriptHammer standards.
 All checks are errors - either it passes or it fails. No ambiguous warnings.
 
+NEW in v5.15: --analyze-themes --all classifies every spec in one run (process pool, one JSON report).
+NEW in v5.14: --serve runs a warm validator daemon on a Unix socket; --client asks it (paths or SVG on stdin).
+NEW in v5.13: --stream checks element geometry in one iterparse pass without building the tree (automatic for big files).
+NEW in v5.12: The escalation index maps code -> features and answers --check-escalation without a walk (--rebuild-index).
+NEW in v5.11: Each SVG is read once (svg_document.SVGDocument) and its landmarks are cached for inspect-wireframes.py.
+NEW in v5.10: --jsonl streams one record per issue and per file as each file finishes.
+NEW in v5.9: --watch keeps a warm process and revalidates SVGs on save (inotify, else polling).
+NEW in v5.8: --changed-since REF validates only what git reports changed (plus users of changed includes).
+NEW in v5.7: Checks are a registry of rules; --rules/--skip-rules select them, --profile times them.
+NEW in v5.6: Results are cached per SVG content hash (--no-cache, --clear-cache).
+NEW in v5.5: --jobs N validates files in a process pool (default: CPU count).
 NEW in v5.4: Added G-044 (footer/nav rounded corners) check.
 NEW in v5.3: Added --json and --summary output modes for CI integration (RFC-004).
 NEW in v5.2: Added G-036 (badge containment) and G-037 (annotation text readability) checks.
@@ -21,18 +32,49 @@ Usage:
     python validate-wireframe.py --all              # Validate all SVGs
     python validate-wireframe.py --all --json       # JSON output for CI
     python validate-wireframe.py --all --summary    # One-line summary for PR comments
+    python validate-wireframe.py --all --jsonl      # Streaming JSON lines for CI tools
+    python validate-wireframe.py --all --jobs 4     # Validate with 4 worker processes
+    python validate-wireframe.py --all --no-cache   # Ignore cached results
+    python validate-wireframe.py --clear-cache      # Drop the result cache
+    python validate-wireframe.py --all --profile    # Per-rule time and hit counts
+    python validate-wireframe.py --all --stream     # Streaming XML backend (low memory)
+    python validate-wireframe.py --all --rules G-036,G-037  # Run only some rules
+    python validate-wireframe.py --changed-since origin/main  # Only what this branch touched
+    python validate-wireframe.py --watch            # Revalidate on save, JSON lines out
+    python validate-wireframe.py --serve            # Warm daemon on .cache/wireframe-validate/daemon.sock
+    python validate-wireframe.py --client a.svg b.svg  # Validate through the daemon (JSON out)
+    cat a.svg | python validate-wireframe.py --client -  # Validate SVG bytes through the daemon
     python validate-wireframe.py --check-escalation # Check for patterns to escalate
+    python validate-wireframe.py --analyze-themes --all  # Theme report for every spec.md
+    python validate-wireframe.py --rebuild-index    # Re-scan .issues.md into the escalation index
 """
 
+import base64
 import bisect
+import hashlib
+import io
 import json
+import os
 import re
+import select
+import socket
+import struct
+import subprocess
 import sys
+import time
+import traceback
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import date
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import svg_document
+from svg_document import DocumentCache, LineIndex, SVGDocument, write_if_changed
+
+VALIDATOR_VERSION = "5.15"
 
 # ============================================================
 # COLOR STANDARDS
@@ -120,6 +162,17 @@ UX_KEYWORDS = [
     'display', 'show', 'see', 'click', 'tap',
 ]
 
+# In the body, these mean visible UI exists: the story is light whatever else it says
+STRONG_UX_KEYWORDS = [
+    'modal', 'toggle', 'warning', 'indicator', 'strength', 'meter',
+    'feedback', 'i see', 'then i see', 'is warned', 'remember me',
+]
+
+# In the title (and with no strong UX in the body), these make the story dark
+STRONG_BACKEND_KEYWORDS = [
+    'rls', 'isolation', 'csrf', 'oauth', 'pre-commit', 'secret detection', 'injection', 'sanitiz',
+]
+
 # ============================================================
 # LAYOUT STANDARDS
 # ============================================================
@@ -185,20 +238,418 @@ class BoundingBox:
         return max(h_gap, v_gap)
 
 
+class SpatialGrid:
+    """Uniform grid of bounding boxes for near-constant-time point lookups.
+
+    Each box is filed under every cell it touches, so a query only tests the
+    boxes sharing the point's cell instead of every box on the screen. Cell
+    lists keep insertion order, which makes `containing` return the same box
+    a front-to-back linear scan would.
+    """
+
+    CELL_SIZE = 64  # px; about one button height, a third of a button width
+
+    def __init__(self, boxes: List[BoundingBox], cell_size: int = CELL_SIZE):
+        self.boxes = boxes
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        for index, box in enumerate(boxes):
+            for gx in range(int(box.x // cell_size), int(box.right // cell_size) + 1):
+                for gy in range(int(box.y // cell_size), int(box.bottom // cell_size) + 1):
+                    self.cells.setdefault((gx, gy), []).append(index)
+
+    def containing(self, x: float, y: float) -> Optional[BoundingBox]:
+        """First box (in insertion order) containing the point, edges included."""
+        for index in self.cells.get((int(x // self.cell_size), int(y // self.cell_size)), ()):
+            box = self.boxes[index]
+            if box.x <= x <= box.right and box.y <= y <= box.bottom:
+                return box
+        return None
+
+
+# ============================================================
+# ELEMENT TABLE - One tokenizing pass shared by every check
+# ============================================================
+
+_TAG_START_RE = re.compile(r'<([A-Za-z_][\w:.-]*)')
+_ATTR_RE = re.compile(r'([\w:.-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+_NUMBER_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)')
+_IGNORECASE = int(re.IGNORECASE)  # plain int: RegexFlag.__and__ is slow in hot loops
+
+# Integer extractors for attribute values, matching the historical per-check
+# regexes exactly (e.g. `width=` also hits `stroke-width=`, `x=` needs a word
+# boundary so it skips `cx=`) so moving to the table doesn't shift results.
+_LEGACY_INT_RES: Dict[str, re.Pattern] = {
+    'x': re.compile(r'\bx=["\']?(\d+)'),
+    'y': re.compile(r'\by=["\']?(\d+)'),
+    'r': re.compile(r'\br=["\']?(\d+)'),
+    **{name: re.compile(rf'{name}=["\']?(\d+)')
+       for name in ('cx', 'cy', 'rx', 'width', 'height', 'font-size')},
+}
+
+# Tag-anchored check patterns. Each starts with a literal `<tag` so it can be
+# tried only at offsets the element table reports (see _tag_matches).
+_FORBIDDEN_PANEL_RES = [
+    (color, re.compile(rf'<rect[^>]*fill=["\']?{re.escape(color)}', re.IGNORECASE))
+    for color in FORBIDDEN_PANEL_COLORS
+]
+_TOGGLE_RE = re.compile(r'<rect[^>]*width=["\']?(?:4[0-9]|5[0-5])["\']?[^>]*height=["\']?(?:2[0-9])["\']?[^>]*>')
+_FRAME_RE = re.compile(r'<rect[^>]*rx=["\']?(?:2[0-9]|[3-9][0-9])["\']?[^>]*>')
+_FILL_VALUE_RE = re.compile(r'fill=["\']?([^"\'\s>]+)')
+_BADGE_TEXT_RE = re.compile(r'<text[^>]*>([FSU][RCS]-\d+)</text>')
+_CALLOUT_TAG_RE = re.compile(r'<circle[^>]*fill=["\']?#dc2626["\']?[^>]*>')
+_CALLOUT_RE = re.compile(r'<circle[^>]*fill=["\']?#dc2626')
+_TITLE_TEXT_RE = re.compile(r'<text[^>]*y=["\']?(\d+)["\']?[^>]*>([^<]+)</text>')
+_BUTTON_RE = re.compile(r'<rect[^>]*width=["\']?(\d+)["\']?[^>]*height=["\']?(\d+)["\']?[^>]*fill=["\']?([^"\'>\s]+)')
+_BUTTON_ALT_RE = re.compile(r'<rect[^>]*fill=["\']?([^"\'>\s]+)["\']?[^>]*width=["\']?(\d+)["\']?[^>]*height=["\']?(\d+)')
+_SIGNATURE_RE = re.compile(r'<text[^>]*y=["\']?(10[4-9]\d|1[1-9]\d\d)["\']?[^>]*')
+_SIGNATURE_TEXT_RE = re.compile(r'<text[^>]*y=["\']?(10[4-9]\d|1[1-9]\d\d)["\']?[^>]*>([^<]+)</text>')
+_SIGNATURE_EXISTS_RE = re.compile(r'<text[^>]*y=["\']?(10[4-9]\d|1[1-9]\d\d)["\']?')
+_DARK_RECT_RE = re.compile(r'<rect[^>]*fill=["\']?#000(?:000)?["\']?[^>]*opacity=["\']?0\.[3-6]', re.IGNORECASE)
+_DARK_RECT_ALT_RE = re.compile(r'<rect[^>]*opacity=["\']?0\.[3-6]["\']?[^>]*fill=["\']?#000', re.IGNORECASE)
+_RECT_TAG_RE = re.compile(r'<rect[^>]*>')
+_BUTTON_RX_RE = re.compile(r'rx=["\']?([4-8])["\']?')
+_ANNOTATION_TEXT_X_RE = re.compile(r'<text[^>]*x=["\']?(\d+)["\']?[^>]*>([^<]*)</text>')
+_GROUP_CIRCLE_RE = re.compile(r'<circle[^>]*cy=["\']?(\d+)["\']?[^>]*fill=["\']?#dc2626')
+_GROUP_CIRCLE_ALT_RE = re.compile(r'<circle[^>]*fill=["\']?#dc2626["\']?[^>]*cy=["\']?(\d+)')
+_FOOTER_USE_RE = re.compile(r'<use[^>]*footer-desktop\.svg')
+_OVERLAY_RECT_RE = re.compile(r'<rect[^>]*opacity=["\']?0\.[3-6]')
+_TITLE_ANCHOR_RE = re.compile(r'<text[^>]*text-anchor=["\']middle["\'][^>]*y=["\']?(\d+)["\']?')
+_TITLE_ANCHOR_ALT_RE = re.compile(r'<text[^>]*y=["\']?(\d+)["\']?[^>]*text-anchor=["\']middle["\']')
+_MOBILE_GROUP_RE = re.compile(r'<g[^>]*id=["\']mobile["\'][^>]*>')
+_MOBILE_HEADER_USE_RE = re.compile(r'<use[^>]*header-mobile\.svg[^>]*/>')
+_FIRST_CONTENT_RE = re.compile(r'<(rect|text|g)[^>]*\sy=["\']?(\d+)')
+_BADGE_RECT_RE = re.compile(r'<rect[^>]*rx=["\']?4["\']?[^>]*>')
+_CIRCLED_TITLE_RE = re.compile(r'<text[^>]*>([①②③④⑤⑥⑦⑧⑨⑩][^<]*)</text>')
+_TEXT_FILL_RE = re.compile(r'<text[^>]*fill=["\']?([^"\'>\s]+)["\']?[^>]*>([^<]+)</text>')
+_DESKTOP_FOOTER_RECT_RE = re.compile(r'<rect[^>]*\by=["\']?(6[4-9]\d|7[0-7]\d)["\']?[^>]*width=["\']?(1[0-2]\d\d)["\']?[^>]*')
+_MOBILE_NAV_RECT_RE = re.compile(r'<rect[^>]*\by=["\']?(66[4-9]|6[7-9]\d|7[0-1]\d)["\']?[^>]*width=["\']?(3[4-6]\d)["\']?[^>]*')
+
+# Whole-text patterns for the checks that aren't tag-shaped.
+_UNESCAPED_AMP_RE = re.compile(r'&(?!(?:amp|lt|gt|quot|apos|#\d+|#x[0-9a-fA-F]+);)')
+_BARE_LT_RE = re.compile(r'<(?![a-zA-Z/?!])')
+_UNQUOTED_ATTR_RE = re.compile(r'\s(\w+)=([^"\'\s>][^\s>]*)\s')
+# `=` opening a value that holds the other quote before its own closing quote.
+# Every XML-003 hit sits on one of these (see _mismatched_quote_starts).
+_MISMATCHED_QUOTE_CANDIDATE_RE = re.compile(r'=(?:"[^"\']*\'|\'[^\'"]*")')
+_DESKTOP_LABEL_RES = (re.compile(r'DESKTOP.*?y=["\']?5[0-9]', re.DOTALL),
+                      re.compile(r'y=["\']?5[0-9]["\']?.*?>.*?DESKTOP', re.DOTALL))
+_MOBILE_LABEL_RES = (re.compile(r'MOBILE.*?y=["\']?5[0-9]', re.DOTALL),
+                     re.compile(r'y=["\']?5[0-9]["\']?.*?>.*?MOBILE', re.DOTALL))
+_SIGNATURE_FORMAT_RE = re.compile(r'^\d{3}:\d{2}\s*\|\s*.+\s*\|\s*ScriptHammer$')
+_ANNOTATION_TRANSLATE_RE = re.compile(r'id="annotations"[^>]*transform="translate\(\s*\d+\s*,\s*(\d+)')
+_RECT_HEIGHT_RE = re.compile(r'<rect[^>]*height=["\']?(\d+)')
+_US_BADGE_RE = re.compile(r'US-\d{3}')
+_DARK_OVERLAY_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'fill=["\']?rgba\s*\(\s*0\s*,\s*0\s*,\s*0',  # rgba(0,0,0,...)
+    r'fill=["\']?#000["\']?',  # #000
+    r'fill=["\']?#000000["\']?',  # #000000
+    r'fill=["\']?black["\']?',  # black
+    r'opacity=["\']?0\.[3-6]["\']?[^>]*fill=["\']?#000',  # opacity before fill
+)]
+# Parchment colors: #e8d4b8, #dcc8a8, #f5f0e6 - all start with d, e, or f
+_LIGHT_OVERLAY_RE = re.compile(r'fill=["\']?#[d-fD-F][0-9a-fA-F]{5}["\']?[^>]*opacity=["\']?0\.[3-9]', re.IGNORECASE)
+_X_ATTR_RE = re.compile(r'x=["\']?(\d+)["\']?')
+_Y_ATTR_RE = re.compile(r'y=["\']?(\d+)["\']?')
+_SECTION_INDICATOR_RES = {
+    indicator: re.compile(rf'{re.escape(indicator)}[^<]*</text>|<text[^>]*>.*?{re.escape(indicator)}')
+    for indicator in ('UI Elements', 'Summary', 'Notes')
+}
+
+
+def _is_word_char(char: str) -> bool:
+    """Same test as the regex word class (backslash-w) for str patterns."""
+    return char.isalnum() or char == '_'
+
+
+def _mismatched_quote_starts(content: str) -> Iterator[int]:
+    r"""Start offsets of `(\w+)="[^"]*'|(\w+)='[^']*"` matches, as finditer finds them.
+
+    Run as a regex that pattern has no literal prefix, so it is attempted at
+    every character and backtracks through every attribute value - by far
+    the most expensive check. Hits are rare, so jump between the few `=`
+    that can start one and rebuild each match by hand: the word run before
+    the `=`, then (greedy `[^q]*`) the last other-quote before the next q.
+    """
+    pos = 0
+    while True:
+        candidate = _MISMATCHED_QUOTE_CANDIDATE_RE.search(content, pos)
+        if candidate is None:
+            return
+        eq = candidate.start()
+        start = eq
+        while start > 0 and _is_word_char(content[start - 1]):
+            start -= 1
+        if start == eq or start < pos:
+            # No attribute name, or it overlaps the previous match
+            pos = eq + 1
+            continue
+        quote, other = content[eq + 1], candidate.group()[-1]
+        close = content.find(quote, eq + 2)
+        if close == -1:
+            close = len(content)
+        pos = content.rfind(other, eq + 2, close) + 1
+        yield start
+
+
+class SVGElement:
+    """One start tag in the SVG.
+
+    `start`/`end` are offsets of the '<' and closing '>' in the SVG text,
+    `line` is 1-based, and `section` is 'desktop', 'mobile', 'annotations'
+    or '' (canvas chrome such as the title and signature). Everything but
+    the tag name and offset is worked out on first access and cached, so
+    tags no check asks about cost nothing beyond the tokenizer pass.
+    """
+
+    __slots__ = ('tag', 'start', '_table', '_end', '_line', '_section', '_attrs', '_ints')
+
+    def __init__(self, table: 'ElementTable', tag: str, start: int):
+        self._table = table
+        self.tag = tag
+        self.start = start
+        self._end: Optional[int] = None
+        self._line: Optional[int] = None
+        self._section: Optional[str] = None
+        self._attrs: Optional[Dict[str, str]] = None
+        self._ints: Dict[str, Optional[int]] = {}
+
+    @property
+    def end(self) -> int:
+        if self._end is None:
+            content = self._table.content
+            end = content.find('>', self.start + 1 + len(self.tag))
+            self._end = len(content) if end == -1 else end
+        return self._end
+
+    @property
+    def line(self) -> int:
+        if self._line is None:
+            self._line = self._table.lines.line_of(self.start)
+        return self._line
+
+    @property
+    def section(self) -> str:
+        if self._section is None:
+            self._section = self._table.section_at(self.start)
+        return self._section
+
+    @property
+    def raw(self) -> str:
+        return self._table.content[self.start:self.end + 1]
+
+    @property
+    def attrs(self) -> Dict[str, str]:
+        if self._attrs is None:
+            self._attrs = {m.group(1): m.group(2) if m.group(2) is not None else m.group(3)
+                           for m in _ATTR_RE.finditer(self._table.content, self.start, self.end)}
+        return self._attrs
+
+    def num(self, name: str) -> Optional[float]:
+        """Attribute parsed as a number (leading number of the value), or None."""
+        value = self.attrs.get(name)
+        if value is None:
+            return None
+        match = _NUMBER_RE.match(value.strip())
+        return float(match.group()) if match else None
+
+    def legacy_int(self, name: str) -> Optional[int]:
+        """First `name=` integer in the raw tag, as the original regex checks read it."""
+        if name not in self._ints:
+            match = _LEGACY_INT_RES[name].search(self._table.content, self.start, self.end + 1)
+            self._ints[name] = int(match.group(1)) if match else None
+        return self._ints[name]
+
+
+class ElementTable:
+    """Every start tag in an SVG, tokenized once, indexed by tag name and offset.
+
+    Checks used to run dozens of `re.finditer('<rect[^>]*...')` scans over the
+    whole file. Instead they ask the table for the offsets where a given tag
+    starts and anchor their pattern there with `pattern.match(text, pos)`.
+    That is exactly what finditer would have found - a `<rect...` match can
+    only begin at a `<rect` - but costs O(matching tags) instead of O(file).
+
+    The pass itself only records offsets per tag name; SVGElement records are
+    built the first time a check asks for that tag and shared afterwards.
+    """
+
+    def __init__(self, content: str, lines: LineIndex,
+                 sections: List[Tuple[str, int, int]]):
+        self.content = content
+        self.lines = lines
+        self.sections = sections
+        self._offsets: Dict[str, List[int]] = {}
+        self._by_tag: Dict[str, List[SVGElement]] = {}
+        self._prefix_cache: Dict[Tuple[str, bool], Tuple[List[int], List[SVGElement]]] = {}
+
+        offsets = self._offsets
+        for m in _TAG_START_RE.finditer(content):
+            tag = m.group(1)
+            if tag in offsets:
+                offsets[tag].append(m.start())
+            else:
+                offsets[tag] = [m.start()]
+
+    def section_at(self, pos: int) -> str:
+        for name, start, end in self.sections:
+            if start <= pos < end:
+                return name
+        return ''
+
+    def tag(self, tag: str) -> List[SVGElement]:
+        """All `<tag ...>` elements, in document order."""
+        if tag not in self._by_tag:
+            self._by_tag[tag] = [SVGElement(self, tag, start) for start in self._offsets.get(tag, ())]
+        return self._by_tag[tag]
+
+    def with_prefix(self, prefix: str, ignorecase: bool = False) -> Tuple[List[int], List[SVGElement]]:
+        """Start tags whose name begins with `prefix` (what `<prefix` matches), in order."""
+        key = (prefix, ignorecase)
+        if key not in self._prefix_cache:
+            if ignorecase:
+                lowered = prefix.lower()
+                tags = [t for t in self._offsets if t.lower().startswith(lowered)]
+            else:
+                tags = [t for t in self._offsets if t.startswith(prefix)]
+            if len(tags) == 1:
+                found = self.tag(tags[0])
+            else:
+                found = sorted((e for t in tags for e in self.tag(t)), key=lambda e: e.start)
+            self._prefix_cache[key] = ([e.start for e in found], found)
+        return self._prefix_cache[key]
+
+    def between(self, prefix: str, start: int = 0, end: Optional[int] = None,
+                ignorecase: bool = False) -> List[SVGElement]:
+        """Start tags named `prefix*` whose '<' lies in [start, end)."""
+        positions, found = self.with_prefix(prefix, ignorecase)
+        lo = bisect.bisect_left(positions, start)
+        hi = len(positions) if end is None else bisect.bisect_left(positions, end)
+        return found[lo:hi]
+
+
+# ============================================================
+# ELEMENT FACTS - What the tree-walking checks read, DOM or streamed
+# ============================================================
+
+_SVG_NS = '{http://www.w3.org/2000/svg}'
+_SVG_RECT = _SVG_NS + 'rect'
+_SVG_TEXT = _SVG_NS + 'text'
+_SVG_A = _SVG_NS + 'a'
+
+# Files at least this big are validated with the streaming backend even
+# without --stream (inline brand marks and outlined text bloat the tree).
+STREAM_MIN_BYTES = 512 * 1024
+
+
+class TextFact:
+    """One <text>: raw font-size and x (with the checks' defaults), whether
+    its parent is an <a> (badge pill), and the first 30 characters of text."""
+
+    __slots__ = ('font_size', 'x', 'in_link', 'content')
+
+    def __init__(self, font_size: str, x, in_link: bool, content: str = ''):
+        self.font_size = font_size
+        self.x = x
+        self.in_link = in_link
+        self.content = content
+
+
+class ElementFacts:
+    """Everything SVG-001..003, FONT-001, LAYOUT-001 and G-018 need from the XML.
+
+    Those are the only checks that walk the parsed tree, and none needs
+    more than the root's attributes, each <rect>'s geometry and each
+    <text>'s size, position, parent tag and leading text - all in document
+    order. from_tree() reads them off a full ElementTree; stream() gets the
+    same facts from one iterparse pass that clears every element once it
+    is done with it, so neither the tree nor a parent map is ever held.
+    """
+
+    __slots__ = ('root_attrib', 'rects', 'texts')
+
+    def __init__(self):
+        self.root_attrib: Dict[str, str] = {}
+        self.rects: List[Tuple] = []  # (x, y, width, height), raw attribute values, default 0
+        self.texts: List[TextFact] = []
+
+    @staticmethod
+    def _rect(element: ET.Element) -> Tuple:
+        return (element.get('x', 0), element.get('y', 0),
+                element.get('width', 0), element.get('height', 0))
+
+    @classmethod
+    def from_tree(cls, root: ET.Element) -> 'ElementFacts':
+        facts = cls()
+        facts.root_attrib = dict(root.attrib)
+
+        def walk(parent: ET.Element) -> None:
+            for child in parent:
+                if child.tag == _SVG_RECT:
+                    facts.rects.append(cls._rect(child))
+                elif child.tag == _SVG_TEXT:
+                    facts.texts.append(TextFact(child.get('font-size', '14'), child.get('x', 0),
+                                                parent.tag == _SVG_A,
+                                                ''.join(child.itertext())[:30]))
+                walk(child)
+
+        walk(root)
+        return facts
+
+    @classmethod
+    def stream(cls, data: bytes) -> 'ElementFacts':
+        """Facts from one pass over the raw bytes; raises ET.ParseError like ET.parse."""
+        facts = cls()
+        open_tags: List[str] = []
+        open_texts: List[TextFact] = []  # Filled in on </text>, once its children are in
+        for event, element in ET.iterparse(io.BytesIO(data), events=('start', 'end')):
+            tag = element.tag
+            if event == 'start':
+                if not open_tags:
+                    facts.root_attrib = dict(element.attrib)
+                if tag == _SVG_RECT:
+                    facts.rects.append(cls._rect(element))
+                elif tag == _SVG_TEXT:
+                    fact = TextFact(element.get('font-size', '14'), element.get('x', 0),
+                                    bool(open_tags) and open_tags[-1] == _SVG_A)
+                    facts.texts.append(fact)
+                    open_texts.append(fact)
+                open_tags.append(tag)
+                continue
+
+            open_tags.pop()
+            if tag == _SVG_TEXT:
+                open_texts.pop().content = ''.join(element.itertext())[:30]
+            if not open_texts:
+                # Nothing still needs this subtree (inside a <text>, its
+                # tspans' text and tails are needed until </text>)
+                element.clear()
+        return facts
+
+
 class WireframeValidator:
-    def __init__(self, svg_path: Path):
+    def __init__(self, svg_path: Path, rules: Optional[List['Rule']] = None,
+                 document: Optional[SVGDocument] = None, stream: bool = False):
         self.svg_path = svg_path
+        self.rules = RULES if rules is None else rules
+        self.document = document  # Read on validate() unless the caller already has it
+        # Streaming backend: facts from one iterparse pass, no tree (see ElementFacts).
+        # Used anyway for files of STREAM_MIN_BYTES or more.
+        self.stream = stream
         self.issues: List[Issue] = []
         self.tree = None
         self.root = None
         self.svg_content = ""
         self.ns = {'svg': 'http://www.w3.org/2000/svg'}
-        self._line_offsets: List[int] = []  # Cumulative line offsets for O(log n) lookups
+        self._lines: Optional[LineIndex] = None  # Line start offsets for O(log n) lookups
         # Cached sections (computed lazily on first access)
         self._annotation_start: Optional[int] = None
         self._annotation_section: Optional[str] = None
         self._mockup_section: Optional[str] = None
-        self._parent_map: Optional[Dict] = None
+        self._facts: Optional[ElementFacts] = None
+        self._viewport_sections: Optional[List[Tuple[str, int, int]]] = None
+        self._svg_lower: Optional[str] = None
+        self.elements: Optional[ElementTable] = None
 
     @property
     def annotation_start(self) -> int:
@@ -226,109 +677,129 @@ class WireframeValidator:
         return self._mockup_section
 
     @property
-    def parent_map(self) -> Dict:
-        """Cached ElementTree parent map."""
-        if self._parent_map is None:
-            self._parent_map = {child: parent for parent in self.root.iter() for child in parent}
-        return self._parent_map
+    def has_annotations(self) -> bool:
+        return self.annotation_start < len(self.svg_content)
 
-    def _build_line_offsets(self) -> None:
-        """Build cumulative line offset map for O(log n) line number lookups.
+    @property
+    def svg_lower(self) -> str:
+        """Cached lowercase copy of the SVG text for case-insensitive probes."""
+        if self._svg_lower is None:
+            self._svg_lower = self.svg_content.lower()
+        return self._svg_lower
+
+    @property
+    def viewport_sections(self) -> List[Tuple[str, int, int]]:
+        """(name, start, end) offsets of the desktop and mobile mockups.
 
-        Instead of counting newlines via svg_content[:pos].count('\\n') for each
-        issue (O(n) per lookup = O(n²) total), we build this once and use binary search.
+        Desktop runs from `id="desktop"` to `id="mobile"` (or the end of the
+        mockup area if mobile comes first or is absent); mobile runs from
+        `id="mobile"` to the annotation panel.
         """
-        self._line_offsets = [0]
-        for i, char in enumerate(self.svg_content):
-            if char == '\n':
-                self._line_offsets.append(i + 1)
+        if self._viewport_sections is None:
+            mockup_end = self.annotation_start
+            desktop_start = self.mockup_section.find('id="desktop"')
+            mobile_start = self.mockup_section.find('id="mobile"')
+            sections = []
+            if desktop_start != -1:
+                desktop_end = mobile_start if mobile_start > desktop_start else mockup_end
+                sections.append(('desktop', desktop_start, desktop_end))
+            if mobile_start != -1:
+                sections.append(('mobile', mobile_start, mockup_end))
+            self._viewport_sections = sections
+        return self._viewport_sections
+
+    def _tag_matches(self, pattern: re.Pattern, tag: str, start: int = 0,
+                     end: Optional[int] = None) -> Iterator[Tuple[SVGElement, re.Match]]:
+        """Same matches as `pattern.finditer(self.svg_content[start:end])`, absolute offsets.
+
+        `pattern` must begin with the literal `<tag`; it is only tried where
+        the element table says such a tag starts. Candidates swallowed by an
+        earlier match are skipped, as finditer would.
+        """
+        if end is None:
+            end = len(self.svg_content)
+        ignorecase = bool(pattern.flags & _IGNORECASE)
+        last_end = start
+        for element in self.elements.between(tag, start, end, ignorecase):
+            if element.start < last_end:
+                continue
+            match = pattern.match(self.svg_content, element.start, end)
+            if match:
+                last_end = match.end()
+                yield element, match
+
+    def _first_tag_match(self, pattern: re.Pattern, tag: str, start: int = 0,
+                         end: Optional[int] = None) -> Optional[Tuple[SVGElement, re.Match]]:
+        """Same as `pattern.search(self.svg_content[start:end])`, via the element table."""
+        return next(self._tag_matches(pattern, tag, start, end), None)
+
+    def _count_tag_matches(self, pattern: re.Pattern, tag: str, start: int = 0,
+                           end: Optional[int] = None) -> int:
+        return sum(1 for _ in self._tag_matches(pattern, tag, start, end))
+
+    @property
+    def facts(self) -> ElementFacts:
+        """Root attributes, rects and texts (streamed at parse time, else read off the tree)."""
+        if self._facts is None:
+            self._facts = ElementFacts.from_tree(self.root)
+        return self._facts
 
     def _get_line_number(self, pos: int) -> int:
         """Get line number for a character position using binary search. O(log n)."""
-        return bisect.bisect_right(self._line_offsets, pos)
+        return self._lines.line_of(pos)
+
+    def validate(self, profile: Optional['RuleProfile'] = None) -> List[Issue]:
+        """Run the validation rules (all of RULES unless a subset was given).
 
-    def validate(self) -> List[Issue]:
-        """Run all validation checks."""
+        With a profile, wall time and issue count are recorded per rule;
+        reading, parsing and tokenizing the file is recorded as PARSE_STEP.
+        """
+        started = time.perf_counter()
+        if self.document is None:
+            self.document = SVGDocument.read(self.svg_path)
         try:
-            self.svg_content = self.svg_path.read_text()
-            self.tree = ET.parse(self.svg_path)
-            self.root = self.tree.getroot()
+            self.svg_content = self.document.text
+            if self.stream or len(self.document.data) >= STREAM_MIN_BYTES:
+                self._facts = ElementFacts.stream(self.document.data)
+            else:
+                self.tree = self.document.parse()
+                self.root = self.tree.getroot()
         except ET.ParseError as e:
             self.issues.append(Issue(
                 severity="ERROR",
                 code="PARSE",
                 message=f"Failed to parse SVG: {e}"
             ))
+            if profile is not None:
+                profile.record(PARSE_STEP, time.perf_counter() - started, 1)
             return self.issues
 
-        # Build line offset map for O(log n) line lookups (instead of O(n²) repeated counting)
-        self._build_line_offsets()
-
-        # Check for common XML/SVG issues that cause browser errors
-        self._check_xml_syntax()
-
-        # Original checks
-        self._check_svg_root()
-        self._check_colors()
-        self._check_boundaries()
-
-        # New v2 checks
-        self._check_header_templates()
-        self._check_mobile_frame()
-        self._check_font_sizes()
-        self._check_clickable_badges()
-        self._check_layout_usage()
-
-        # v2.1 checks
-        self._check_callout_collisions()
-        self._check_annotation_structure()
-
-        # v3 checks (from plan analysis)
-        self._check_title_format()
-        self._check_section_labels()
-        self._check_clutter()
-        self._check_callout_coverage()
-        self._check_button_fills()
-        self._check_signature()
-        self._check_annotation_spacing()
-
-        # v4 checks (User Story support)
-        self._check_user_story_coverage()
-
-        # v5 checks (Design principle validation - 2026-01-12)
-        self._check_modal_overlay()
-        self._check_callout_positioning()
-        self._check_annotation_columns()
-        self._check_annotation_containment()
-        self._check_section_separation()
-
-        # v6 checks (G-019, G-020, G-021 - 2026-01-12)
-        self._check_annotation_group_spacing()
-        self._check_footer_paint_order()
-
-        # v7 checks (G-022 to G-029 - 2026-01-12)
-        self._check_background_gradient()
-        self._check_title_exists()
-        self._check_signature_exists()
-        self._check_callouts_on_mockups()
-
-        # v8 checks (G-034 - 2026-01-12)
-        self._check_mobile_content_position()
-
-        # v9 checks (G-036, G-037 - 2026-01-12)
-        self._check_badge_containment()
-        self._check_annotation_text_readability()
-
-        # v10 checks (G-044 - 2026-01-15)
-        self._check_footer_nav_corners()
+        # Line offset map for O(log n) line lookups (instead of O(n²) repeated counting)
+        self._lines = self.document.lines
+
+        # Tokenize every tag once; the checks below query this table instead
+        # of rescanning the whole file with their own regexes.
+        sections = [('annotations', self.annotation_start, len(self.svg_content)),
+                    *reversed(self.viewport_sections)]
+        self.elements = ElementTable(self.svg_content, self._lines, sections)
+
+        if profile is None:
+            for rule in self.rules:
+                getattr(self, rule.method)()
+            return self.issues
 
+        profile.record(PARSE_STEP, time.perf_counter() - started, 0)
+        for rule in self.rules:
+            found = len(self.issues)
+            started = time.perf_counter()
+            getattr(self, rule.method)()
+            profile.record(rule.name, time.perf_counter() - started, len(self.issues) - found)
         return self.issues
 
     def _check_xml_syntax(self):
         """XML-001: Check for common XML syntax issues that cause browser parse errors."""
         # Check for unescaped ampersands (not part of entities)
-        amp_pattern = r'&(?!(?:amp|lt|gt|quot|apos|#\d+|#x[0-9a-fA-F]+);)'
-        for match in re.finditer(amp_pattern, self.svg_content):
+        for match in _UNESCAPED_AMP_RE.finditer(self.svg_content):
             line_num = self._get_line_number(match.start())
             self.issues.append(Issue(
                 severity="ERROR",
@@ -339,8 +810,7 @@ class WireframeValidator:
 
         # Check for unescaped < inside attribute values or text
         # Pattern: look for < that's not starting a tag (followed by letter or /)
-        bad_lt_pattern = r'<(?![a-zA-Z/?!])'
-        for match in re.finditer(bad_lt_pattern, self.svg_content):
+        for match in _BARE_LT_RE.finditer(self.svg_content):
             line_num = self._get_line_number(match.start())
             self.issues.append(Issue(
                 severity="ERROR",
@@ -351,9 +821,8 @@ class WireframeValidator:
 
         # Check for mismatched quotes in attributes
         # Look for patterns like attr="value' or attr='value"
-        mismatched_quote_pattern = r'(\w+)="[^"]*\'|(\w+)=\'[^\']*"'
-        for match in re.finditer(mismatched_quote_pattern, self.svg_content):
-            line_num = self._get_line_number(match.start())
+        for start in _mismatched_quote_starts(self.svg_content):
+            line_num = self._get_line_number(start)
             self.issues.append(Issue(
                 severity="ERROR",
                 code="XML-003",
@@ -363,8 +832,7 @@ class WireframeValidator:
 
         # Check for attributes without proper quoting
         # Pattern: attr=value (no quotes around value)
-        unquoted_attr_pattern = r'\s(\w+)=([^"\'\s>][^\s>]*)\s'
-        for match in re.finditer(unquoted_attr_pattern, self.svg_content):
+        for match in _UNQUOTED_ATTR_RE.finditer(self.svg_content):
             attr_name = match.group(1)
             attr_value = match.group(2)
             # Skip if it looks like a gradient reference
@@ -380,7 +848,8 @@ class WireframeValidator:
 
     def _check_svg_root(self):
         """Check SVG root element has required attributes."""
-        viewbox = self.root.get('viewBox')
+        root_attrib = self.facts.root_attrib
+        viewbox = root_attrib.get('viewBox')
         if viewbox != '0 0 1920 1080':
             self.issues.append(Issue(
                 severity="ERROR",
@@ -388,7 +857,7 @@ class WireframeValidator:
                 message=f"viewBox should be '0 0 1920 1080', got '{viewbox}'"
             ))
 
-        width = self.root.get('width')
+        width = root_attrib.get('width')
         if width != '1920':
             self.issues.append(Issue(
                 severity="ERROR",
@@ -396,7 +865,7 @@ class WireframeValidator:
                 message=f"width attribute should be '1920', got '{width}'"
             ))
 
-        height = self.root.get('height')
+        height = root_attrib.get('height')
         if height != '1080':
             self.issues.append(Issue(
                 severity="ERROR",
@@ -406,47 +875,35 @@ class WireframeValidator:
 
     def _check_colors(self):
         """Check for forbidden colors on PANELS (rect elements only, not text)."""
-        for color in FORBIDDEN_PANEL_COLORS:
+        for color, pattern in _FORBIDDEN_PANEL_RES:
             # Only match <rect elements with forbidden fill - text can use #ffffff
-            pattern = rf'<rect[^>]*fill=["\']?{re.escape(color)}'
-            matches = list(re.finditer(pattern, self.svg_content, re.IGNORECASE))
-            for match in matches:
-                line_num = self._get_line_number(match.start())
+            for element, _ in self._tag_matches(pattern, 'rect'):
                 self.issues.append(Issue(
                     severity="ERROR",
                     code="G-001",
                     message=f"Forbidden panel color '{color}' on rect (use #e8d4b8 parchment)",
-                    line=line_num
+                    line=element.line
                 ))
 
-        # Check toggle colors
-        self._check_toggle_colors()
-
     def _check_toggle_colors(self):
         """Check toggle switch colors are correct.
         Toggles have rx>=10 (typically rx=13-14). Badge pills have rx=4.
         """
-        toggle_pattern = r'<rect[^>]*width=["\']?(?:4[0-9]|5[0-5])["\']?[^>]*height=["\']?(?:2[0-9])["\']?[^>]*>'
-        for match in re.finditer(toggle_pattern, self.svg_content):
-            rect_str = match.group()
-
+        for element, match in self._tag_matches(_TOGGLE_RE, 'rect'):
             # Check rx - toggles have rx >= 10, badges have rx=4
-            rx_match = re.search(r'rx=["\']?(\d+)', rect_str)
-            if rx_match:
-                rx = int(rx_match.group(1))
-                if rx < 10:
-                    continue  # Skip badge pills (rx=4)
+            rx = element.legacy_int('rx')
+            if rx is not None and rx < 10:
+                continue  # Skip badge pills (rx=4)
 
-            fill_match = re.search(r'fill=["\']?([^"\'\s>]+)', rect_str)
+            fill_match = _FILL_VALUE_RE.search(match.group())
             if fill_match:
                 fill = fill_match.group(1).lower()
                 if fill not in ['#6b7280', '#22c55e', 'none', 'url(']:
-                    line_num = self._get_line_number(match.start())
                     self.issues.append(Issue(
                         severity="ERROR",
                         code="G-015",
                         message=f"Toggle has wrong color '{fill}' (must be #6b7280 OFF or #22c55e ON)",
-                        line=line_num
+                        line=element.line
                     ))
 
     def _check_header_templates(self):
@@ -485,20 +942,16 @@ class WireframeValidator:
     def _check_mobile_frame(self):
         """MOB-001: Check mobile phone frame isn't using dark colors."""
         # Look for rects with large rx (rounded corners) that could be phone frames
-        frame_pattern = r'<rect[^>]*rx=["\']?(?:2[0-9]|[3-9][0-9])["\']?[^>]*>'
-
-        for match in re.finditer(frame_pattern, self.svg_content):
-            rect_str = match.group()
-            fill_match = re.search(r'fill=["\']?([^"\'\s>]+)', rect_str)
+        for element, match in self._tag_matches(_FRAME_RE, 'rect'):
+            fill_match = _FILL_VALUE_RE.search(match.group())
             if fill_match:
                 fill = fill_match.group(1).lower()
                 if fill in FORBIDDEN_FRAME_COLORS:
-                    line_num = self._get_line_number(match.start())
                     self.issues.append(Issue(
                         severity="ERROR",
                         code="MOB-001",
                         message=f"Mobile frame uses dark color '{fill}' (use light color like #e8d4b8)",
-                        line=line_num
+                        line=element.line
                     ))
 
     def _check_font_sizes(self):
@@ -507,17 +960,15 @@ class WireframeValidator:
         """
         BADGE_MIN_SIZE = 11  # Badge pill text can be smaller
 
-        for text in self.root.iter('{http://www.w3.org/2000/svg}text'):
-            font_size_str = text.get('font-size', '14')
+        for text in self.facts.texts:
             # Remove 'px' suffix if present
-            font_size_str = font_size_str.replace('px', '').strip()
+            font_size_str = text.font_size.replace('px', '').strip()
             try:
                 font_size = float(font_size_str)
-                content = ''.join(text.itertext())[:30]
+                content = text.content
 
                 # Check if inside an <a> tag (badge pill) - use different minimum
-                parent = self.parent_map.get(text)
-                is_badge = parent is not None and parent.tag == '{http://www.w3.org/2000/svg}a'
+                is_badge = text.in_link
 
                 min_size = BADGE_MIN_SIZE if is_badge else MIN_FONT_SIZE
 
@@ -533,9 +984,7 @@ class WireframeValidator:
     def _check_clickable_badges(self):
         """LINK-001: Check FR/SC/US badges are wrapped in <a href>."""
         # Find all badge text patterns
-        badge_pattern = r'<text[^>]*>([FSU][RCS]-\d+)</text>'
-
-        for match in re.finditer(badge_pattern, self.svg_content):
+        for element, match in self._tag_matches(_BADGE_TEXT_RE, 'text'):
             badge_id = match.group(1)
             # Check if this text is inside an <a> element
             # Look backwards for <a and forwards for </a>
@@ -547,12 +996,11 @@ class WireframeValidator:
             has_link_after = '</a>' in search_after
 
             if not (has_link_before and has_link_after):
-                line_num = self._get_line_number(start)
                 self.issues.append(Issue(
                     severity="ERROR",
                     code="LINK-001",
                     message=f"Badge '{badge_id}' is not clickable (wrap in <a href='...'>)",
-                    line=line_num
+                    line=element.line
                 ))
 
     def _check_layout_usage(self):
@@ -560,18 +1008,18 @@ class WireframeValidator:
         rightmost_x = 0
 
         # Find rightmost element
-        for rect in self.root.iter('{http://www.w3.org/2000/svg}rect'):
+        for rect_x, _, rect_width, _ in self.facts.rects:
             try:
-                x = float(rect.get('x', 0))
-                w = float(rect.get('width', 0))
+                x = float(rect_x)
+                w = float(rect_width)
                 rightmost_x = max(rightmost_x, x + w)
             except (ValueError, TypeError):
                 continue
 
         # Also check text elements
-        for text in self.root.iter('{http://www.w3.org/2000/svg}text'):
+        for text in self.facts.texts:
             try:
-                x = float(text.get('x', 0))
+                x = float(text.x)
                 rightmost_x = max(rightmost_x, x + 200)  # Estimate text width
             except (ValueError, TypeError):
                 continue
@@ -594,58 +1042,34 @@ class WireframeValidator:
         DESKTOP_FOOTER_Y = 640
         MOBILE_FOOTER_Y = 664
         FOOTER_MARGIN = 30  # Callouts should stay this far from footer
-
-        # Find mockup section (before annotations)
-        if 'id="annotations"' in self.svg_content:
-            mockup_section = self.mockup_section
-        else:
-            mockup_section = self.svg_content
-
-        # Find desktop and mobile sections
-        desktop_start = mockup_section.find('id="desktop"')
-        mobile_start = mockup_section.find('id="mobile"')
-
-        def check_section_callouts(section_content: str, section_offset: int, footer_y: int, section_name: str):
-            """Check callouts in a viewport section against footer position."""
-            callout_pattern = r'<circle[^>]*fill=["\']?#dc2626["\']?[^>]*>'
-
-            for match in re.finditer(callout_pattern, section_content):
-                callout_str = match.group()
-                # Extract cy from the circle
-                cy_match = re.search(r'cy=["\']?(\d+)', callout_str)
-                r_match = re.search(r'\br=["\']?(\d+)', callout_str)
-                if not cy_match:
+        footer_ys = {'desktop': DESKTOP_FOOTER_Y, 'mobile': MOBILE_FOOTER_Y}
+
+        # Check callouts in each viewport section (desktop, then mobile)
+        # against that viewport's footer position.
+        for section_name, section_start, section_end in self.viewport_sections:
+            footer_y = footer_ys[section_name]
+            for element, _ in self._tag_matches(_CALLOUT_TAG_RE, 'circle', section_start, section_end):
+                cy = element.legacy_int('cy')
+                if cy is None:
                     continue
-
-                cy = int(cy_match.group(1))
-                r = int(r_match.group(1)) if r_match else 14
+                r = element.legacy_int('r')
+                if r is None:
+                    r = 14
 
                 # Check if callout overlaps or is too close to footer
                 callout_bottom = cy + r
                 if callout_bottom >= footer_y - FOOTER_MARGIN:
-                    line_num = self._get_line_number(section_offset + match.start())
                     self.issues.append(Issue(
                         severity="ERROR",
                         code="COLL-001",
                         message=f"Callout at cy={cy} too close to {section_name} footer (y={footer_y}) - move up",
-                        line=line_num
+                        line=element.line
                     ))
 
-        # Check desktop section
-        if desktop_start != -1:
-            desktop_end = mobile_start if mobile_start > desktop_start else len(mockup_section)
-            desktop_section = mockup_section[desktop_start:desktop_end]
-            check_section_callouts(desktop_section, desktop_start, DESKTOP_FOOTER_Y, "desktop")
-
-        # Check mobile section
-        if mobile_start != -1:
-            mobile_section = mockup_section[mobile_start:]
-            check_section_callouts(mobile_section, mobile_start, MOBILE_FOOTER_Y, "mobile")
-
     def _check_annotation_structure(self):
         """ANN-001: Check annotation panel has required structure."""
         # Check for annotation panel
-        if 'id="annotations"' not in self.svg_content:
+        if not self.has_annotations:
             self.issues.append(Issue(
                 severity="ERROR",
                 code="ANN-001",
@@ -655,9 +1079,7 @@ class WireframeValidator:
 
         # Count callout CIRCLES specifically (not P0 badges which are rects)
         # Look for <circle elements with red fill in annotation panel
-        annotation_section = self.annotation_section
-        callout_pattern = r'<circle[^>]*fill=["\']?#dc2626'
-        callout_count = len(re.findall(callout_pattern, annotation_section))
+        callout_count = self._count_tag_matches(_CALLOUT_RE, 'circle', self.annotation_start)
 
         if callout_count < 4:
             self.issues.append(Issue(
@@ -669,12 +1091,12 @@ class WireframeValidator:
 
     def _check_boundaries(self):
         """Check content stays within canvas boundaries."""
-        for rect in self.root.iter('{http://www.w3.org/2000/svg}rect'):
+        for rect_x, rect_y, rect_width, rect_height in self.facts.rects:
             try:
-                x = float(rect.get('x', 0))
-                y = float(rect.get('y', 0))
-                w = float(rect.get('width', 0))
-                h = float(rect.get('height', 0))
+                x = float(rect_x)
+                y = float(rect_y)
+                w = float(rect_width)
+                h = float(rect_height)
 
                 if x + w > CANVAS_WIDTH:
                     self.issues.append(Issue(
@@ -698,8 +1120,7 @@ class WireframeValidator:
     def _check_title_format(self):
         """TITLE-001/002/003: Title must be centered and human-readable."""
         # Find title text (y < 50, large font)
-        title_pattern = r'<text[^>]*y=["\']?(\d+)["\']?[^>]*>([^<]+)</text>'
-        for match in re.finditer(title_pattern, self.svg_content[:2000]):
+        for _, match in self._tag_matches(_TITLE_TEXT_RE, 'text', 0, 2000):
             try:
                 y = int(match.group(1))
                 text_content = match.group(2).strip()
@@ -735,10 +1156,8 @@ class WireframeValidator:
     def _check_section_labels(self):
         """SECTION-001/002: Must have DESKTOP and MOBILE section labels."""
         # Look for section labels at y ~52 (just below title)
-        has_desktop_label = bool(re.search(r'DESKTOP.*?y=["\']?5[0-9]', self.svg_content[:4000], re.DOTALL) or
-                                  re.search(r'y=["\']?5[0-9]["\']?.*?>.*?DESKTOP', self.svg_content[:4000], re.DOTALL))
-        has_mobile_label = bool(re.search(r'MOBILE.*?y=["\']?5[0-9]', self.svg_content, re.DOTALL) or
-                                 re.search(r'y=["\']?5[0-9]["\']?.*?>.*?MOBILE', self.svg_content, re.DOTALL))
+        has_desktop_label = any(p.search(self.svg_content, 0, 4000) for p in _DESKTOP_LABEL_RES)
+        has_mobile_label = any(p.search(self.svg_content) for p in _MOBILE_LABEL_RES)
 
         if not has_desktop_label:
             self.issues.append(Issue(
@@ -776,17 +1195,14 @@ class WireframeValidator:
 
     def _check_callout_coverage(self):
         """CALLOUT-002: Mockup must illustrate ALL annotation concepts."""
-        if 'id="annotations"' not in self.svg_content:
+        if not self.has_annotations:
             return  # No annotation panel to check
 
-        # Count callouts on mockups (before annotations section)
+        # Count callouts on mockups (before annotations section) and in the
+        # annotation panel
         annotation_start = self.annotation_start
-        mockup_section = self.mockup_section
-        mockup_callouts = len(re.findall(r'<circle[^>]*fill=["\']?#dc2626["\']?', mockup_section))
-
-        # Count callouts in annotation panel
-        annotation_section = self.svg_content[annotation_start:]
-        annotation_callouts = len(re.findall(r'<circle[^>]*fill=["\']?#dc2626["\']?', annotation_section))
+        mockup_callouts = self._count_tag_matches(_CALLOUT_RE, 'circle', 0, annotation_start)
+        annotation_callouts = self._count_tag_matches(_CALLOUT_RE, 'circle', annotation_start)
 
         if mockup_callouts < annotation_callouts:
             missing = annotation_callouts - mockup_callouts
@@ -814,13 +1230,10 @@ class WireframeValidator:
         transparent_values = ['none', 'transparent']
 
         # Find button-sized rects (width 80-300, height 35-60)
-        button_pattern = r'<rect[^>]*width=["\']?(\d+)["\']?[^>]*height=["\']?(\d+)["\']?[^>]*fill=["\']?([^"\'>\s]+)'
-        alt_pattern = r'<rect[^>]*fill=["\']?([^"\'>\s]+)["\']?[^>]*width=["\']?(\d+)["\']?[^>]*height=["\']?(\d+)'
-
-        for pattern in [button_pattern, alt_pattern]:
-            for match in re.finditer(pattern, self.svg_content):
+        for pattern in [_BUTTON_RE, _BUTTON_ALT_RE]:
+            for element, match in self._tag_matches(pattern, 'rect'):
                 try:
-                    if pattern == button_pattern:
+                    if pattern is _BUTTON_RE:
                         width = int(match.group(1))
                         height = int(match.group(2))
                         fill = match.group(3).lower()
@@ -832,20 +1245,18 @@ class WireframeValidator:
                     # Check if this looks like a button (reasonable dimensions)
                     if 80 <= width <= 300 and 35 <= height <= 60:
                         if fill in faded_colors:
-                            line_num = self._get_line_number(match.start())
                             self.issues.append(Issue(
                                 severity="ERROR",
                                 code="BTN-001",
                                 message=f"Button uses panel background color ({fill}) - use solid fill for prominence",
-                                line=line_num
+                                line=element.line
                             ))
                         elif fill in transparent_values:
-                            line_num = self._get_line_number(match.start())
                             self.issues.append(Issue(
                                 severity="ERROR",
                                 code="BTN-001",
                                 message=f"Button has transparent fill ({fill}) - buttons must have solid fills",
-                                line=line_num
+                                line=element.line
                             ))
                 except (ValueError, TypeError):
                     continue
@@ -853,14 +1264,13 @@ class WireframeValidator:
     def _check_signature(self):
         """SIGNATURE-001/002/003/004: Signature must be 18px+, bold, left-aligned, correct format."""
         # Find signature (y > 1040)
-        sig_pattern = r'<text[^>]*y=["\']?(10[4-9]\d|1[1-9]\d\d)["\']?[^>]*'
-        match = re.search(sig_pattern, self.svg_content)
-        if match:
+        found = self._first_tag_match(_SIGNATURE_RE, 'text')
+        if found:
+            element, match = found
             sig_element = match.group()
             # Check font size
-            size_match = re.search(r'font-size=["\']?(\d+)', sig_element)
-            if size_match:
-                font_size = int(size_match.group(1))
+            font_size = element.legacy_int('font-size')
+            if font_size is not None:
                 if font_size < 18:
                     self.issues.append(Issue(
                         severity="ERROR",
@@ -875,9 +1285,8 @@ class WireframeValidator:
                     message="Signature must be bold"
                 ))
             # Check for left-alignment (x="40", NOT centered)
-            x_match = re.search(r'\bx=["\']?(\d+)', sig_element)
-            if x_match:
-                x_pos = int(x_match.group(1))
+            x_pos = element.legacy_int('x')
+            if x_pos is not None:
                 if x_pos != 40:
                     self.issues.append(Issue(
                         severity="ERROR",
@@ -892,12 +1301,11 @@ class WireframeValidator:
                 ))
         # Check signature format (SIGNATURE-004)
         # Find the text content of signature element
-        sig_text_pattern = r'<text[^>]*y=["\']?(10[4-9]\d|1[1-9]\d\d)["\']?[^>]*>([^<]+)</text>'
-        text_match = re.search(sig_text_pattern, self.svg_content)
-        if text_match:
-            sig_text = text_match.group(2).strip()
+        found = self._first_tag_match(_SIGNATURE_TEXT_RE, 'text')
+        if found:
+            sig_text = found[1].group(2).strip()
             # Must match format: NNN:NN | Feature Name | ScriptHammer
-            valid_format = re.match(r'^\d{3}:\d{2}\s*\|\s*.+\s*\|\s*ScriptHammer$', sig_text)
+            valid_format = _SIGNATURE_FORMAT_RE.match(sig_text)
             if not valid_format:
                 self.issues.append(Issue(
                     severity="ERROR",
@@ -908,14 +1316,13 @@ class WireframeValidator:
     def _check_annotation_spacing(self):
         """LAYOUT-002: Annotation panel must not clip into signature."""
         # Find annotation panel position
-        ann_pattern = r'id="annotations"[^>]*transform="translate\(\s*\d+\s*,\s*(\d+)'
-        match = re.search(ann_pattern, self.svg_content)
+        match = _ANNOTATION_TRANSLATE_RE.search(self.svg_content)
         if match:
             ann_y = int(match.group(1))
             # Find annotation panel height
             # Look for first rect after id="annotations"
             start_pos = match.end()
-            height_match = re.search(r'<rect[^>]*height=["\']?(\d+)', self.svg_content[start_pos:start_pos+500])
+            height_match = _RECT_HEIGHT_RE.search(self.svg_content[start_pos:start_pos+500])
             if height_match:
                 ann_height = int(height_match.group(1))
                 ann_bottom = ann_y + ann_height
@@ -936,11 +1343,11 @@ class WireframeValidator:
         Each annotation group should be anchored by a User Story (US-XXX).
         User Stories provide the narrative context that makes wireframes meaningful.
         """
-        if 'id="annotations"' not in self.svg_content:
+        if not self.has_annotations:
             return  # No annotation panel to check
 
         annotation_section = self.annotation_section
-        us_badges = re.findall(r'US-\d{3}', annotation_section)
+        us_badges = _US_BADGE_RE.findall(annotation_section)
         unique_us = set(us_badges)
 
         if len(unique_us) == 0:
@@ -973,7 +1380,7 @@ class WireframeValidator:
         # STEP 1: Check if this is a PAGE, not a modal
         # Pages have these indicators in the title or filename
         page_indicators = ['settings', 'dashboard', 'policy', 'page', 'profile', 'account', 'management']
-        svg_lower = self.svg_content.lower()
+        svg_lower = self.svg_lower
         filename_lower = str(self.svg_path).lower() if self.svg_path else ''
 
         # Check title text (first 500 chars typically contains the centered title)
@@ -1006,30 +1413,15 @@ class WireframeValidator:
         if not has_modal_keyword:
             return  # No modal to check
 
-        # Check for DARK overlay: must be a dark color with transparency
-        # More flexible patterns to catch various SVG attribute orderings
-        dark_overlay_patterns = [
-            r'fill=["\']?rgba\s*\(\s*0\s*,\s*0\s*,\s*0',  # rgba(0,0,0,...)
-            r'fill=["\']?#000["\']?',  # #000
-            r'fill=["\']?#000000["\']?',  # #000000
-            r'fill=["\']?black["\']?',  # black
-            r'opacity=["\']?0\.[3-6]["\']?[^>]*fill=["\']?#000',  # opacity before fill
-        ]
-
         # Also check for rect with dark fill AND opacity attribute nearby
-        dark_rect_pattern = r'<rect[^>]*fill=["\']?#000(?:000)?["\']?[^>]*opacity=["\']?0\.[3-6]'
-        dark_rect_alt = r'<rect[^>]*opacity=["\']?0\.[3-6]["\']?[^>]*fill=["\']?#000'
-
         has_dark_overlay = (
-            any(re.search(p, self.svg_content, re.IGNORECASE) for p in dark_overlay_patterns) or
-            re.search(dark_rect_pattern, self.svg_content, re.IGNORECASE) or
-            re.search(dark_rect_alt, self.svg_content, re.IGNORECASE)
+            any(p.search(self.svg_content) for p in _DARK_OVERLAY_RES) or
+            self._first_tag_match(_DARK_RECT_RE, 'rect') or
+            self._first_tag_match(_DARK_RECT_ALT_RE, 'rect')
         )
 
         # Check for light/parchment colors used as "overlay" - this is wrong
-        # Parchment colors: #e8d4b8, #dcc8a8, #f5f0e6 - all start with d, e, or f
-        light_overlay_pattern = r'fill=["\']?#[d-fD-F][0-9a-fA-F]{5}["\']?[^>]*opacity=["\']?0\.[3-9]'
-        has_light_overlay = re.search(light_overlay_pattern, self.svg_content, re.IGNORECASE)
+        has_light_overlay = _LIGHT_OVERLAY_RE.search(self.svg_content)
 
         if has_light_overlay:
             self.issues.append(Issue(
@@ -1053,81 +1445,43 @@ class WireframeValidator:
         NOTE: Coordinates are relative within transform groups (desktop/mobile).
         We only check callouts against buttons in the SAME viewport group.
         """
-        # Find all callout positions in the mockup areas (not annotation panel)
-        if 'id="annotations"' in self.svg_content:
-            mockup_section = self.mockup_section
-        else:
-            mockup_section = self.svg_content
-
-        # Extract desktop and mobile sections separately to handle transforms correctly
-        desktop_start = mockup_section.find('id="desktop"')
-        mobile_start = mockup_section.find('id="mobile"')
-
-        # If no clear sections, skip this check (too complex to analyze)
-        if desktop_start == -1 and mobile_start == -1:
-            return
-
-        def check_viewport_section(section_content: str, section_offset: int):
-            """Check callouts within a single viewport section."""
-            callout_pattern = r'<circle[^>]*fill=["\']?#dc2626["\']?[^>]*>'
-
+        # Desktop and mobile sections are checked separately to handle
+        # transforms correctly. If there are no clear sections, nothing to do.
+        for _, section_start, section_end in self.viewport_sections:
             # Collect actual BUTTONS in this section (not panels/cards)
             # Buttons: small rounded rects (rx=4-8) with typical button dimensions
             # Width 60-200px, height 25-50px (not large panels)
-            buttons = []
-            for match in re.finditer(r'<rect[^>]*>', section_content):
-                rect_str = match.group()
+            buttons: List[BoundingBox] = []
+            for element, match in self._tag_matches(_RECT_TAG_RE, 'rect', section_start, section_end):
                 # Check if this looks like a button (has rx=4-8)
-                rx_match = re.search(r'rx=["\']?([4-8])["\']?', rect_str)
-                if not rx_match:
+                if not _BUTTON_RX_RE.search(match.group()):
                     continue
                 # Extract coordinates
-                x_match = re.search(r'\bx=["\']?(\d+)', rect_str)
-                y_match = re.search(r'\by=["\']?(\d+)', rect_str)
-                w_match = re.search(r'width=["\']?(\d+)', rect_str)
-                h_match = re.search(r'height=["\']?(\d+)', rect_str)
-                if x_match and y_match and w_match and h_match:
-                    w = int(w_match.group(1))
-                    h = int(h_match.group(1))
+                x, y = element.legacy_int('x'), element.legacy_int('y')
+                w, h = element.legacy_int('width'), element.legacy_int('height')
+                if x is not None and y is not None and w is not None and h is not None:
                     # Only consider button-sized elements (not panels/cards)
                     if 60 <= w <= 200 and 25 <= h <= 50:
-                        buttons.append({
-                            'x': int(x_match.group(1)),
-                            'y': int(y_match.group(1)),
-                            'w': w,
-                            'h': h
-                        })
-
-            # Check callouts against buttons in this section only
-            for match in re.finditer(callout_pattern, section_content):
-                callout_str = match.group()
-                cx_match = re.search(r'cx=["\']?(\d+)', callout_str)
-                cy_match = re.search(r'cy=["\']?(\d+)', callout_str)
-                if not cx_match or not cy_match:
-                    continue
-                cx, cy = int(cx_match.group(1)), int(cy_match.group(1))
-
-                for btn in buttons:
-                    if btn['x'] <= cx <= btn['x'] + btn['w'] and btn['y'] <= cy <= btn['y'] + btn['h']:
-                        line_num = self._get_line_number(section_offset + match.start())
-                        self.issues.append(Issue(
-                            severity="ERROR",
-                            code="CALLOUT-003",
-                            message=f"Callout at ({cx},{cy}) overlaps button at ({btn['x']},{btn['y']}) - place after (right/below) instead",
-                            line=line_num
-                        ))
-                        break
+                        buttons.append(BoundingBox(x, y, w, h))
+            if not buttons:
+                continue
 
-        # Check desktop section if present
-        if desktop_start != -1:
-            desktop_end = mobile_start if mobile_start > desktop_start else len(mockup_section)
-            desktop_section = mockup_section[desktop_start:desktop_end]
-            check_viewport_section(desktop_section, desktop_start)
+            # Check callouts against buttons in this section only. The grid
+            # keeps this linear on dense screens (was callouts x buttons).
+            grid = SpatialGrid(buttons)
+            for element, _ in self._tag_matches(_CALLOUT_TAG_RE, 'circle', section_start, section_end):
+                cx, cy = element.legacy_int('cx'), element.legacy_int('cy')
+                if cx is None or cy is None:
+                    continue
 
-        # Check mobile section if present
-        if mobile_start != -1:
-            mobile_section = mockup_section[mobile_start:]
-            check_viewport_section(mobile_section, mobile_start)
+                btn = grid.containing(cx, cy)
+                if btn is not None:
+                    self.issues.append(Issue(
+                        severity="ERROR",
+                        code="CALLOUT-003",
+                        message=f"Callout at ({cx},{cy}) overlaps button at ({btn.x},{btn.y}) - place after (right/below) instead",
+                        line=element.line
+                    ))
 
     def _check_annotation_columns(self):
         """ANN-003: Annotation text must stay within column boundaries.
@@ -1138,16 +1492,11 @@ class WireframeValidator:
         - Column 3: x=920 to x=1370
         - Column 4: x=1370 to x=1820
         """
-        if 'id="annotations"' not in self.svg_content:
+        if not self.has_annotations:
             return
 
-        annotation_start = self.annotation_start
-        annotation_section = self.svg_content[annotation_start:]
-
         # Find text elements with x positions
-        text_pattern = r'<text[^>]*x=["\']?(\d+)["\']?[^>]*>([^<]*)</text>'
-
-        for match in re.finditer(text_pattern, annotation_section):
+        for element, match in self._tag_matches(_ANNOTATION_TEXT_X_RE, 'text', self.annotation_start):
             try:
                 x = int(match.group(1))
                 text_content = match.group(2)[:30]  # First 30 chars
@@ -1168,12 +1517,11 @@ class WireframeValidator:
                     # Check if it's just starting in a valid column
                     in_valid_start = any(col_start <= x < col_end for col_start, col_end in ANNOTATION_COLUMNS)
                     if in_valid_start and text_end > ANNOTATION_COLUMNS[-1][1]:
-                        line_num = self._get_line_number(annotation_start + match.start())
                         self.issues.append(Issue(
                             severity="ERROR",
                             code="ANN-003",
                             message=f"Text overflows column boundary: '{text_content}...' (x={x}, est. end={text_end})",
-                            line=line_num
+                            line=element.line
                         ))
             except (ValueError, TypeError):
                 continue
@@ -1184,11 +1532,11 @@ class WireframeValidator:
         Panel is 1840w × 220h at translate(40, 800).
         Content should not extend beyond x=1840 or y=220 (relative to panel).
         """
-        if 'id="annotations"' not in self.svg_content:
+        if not self.has_annotations:
             return
 
         annotation_start = self.annotation_start
-        annotation_section = self.svg_content[annotation_start:]
+        annotation_section = self.annotation_section
 
         # Find the closing </g> of the annotation group (handle nested groups)
         depth = 1  # We start inside the annotation <g>
@@ -1225,11 +1573,8 @@ class WireframeValidator:
             return
 
         # Check for elements with positions beyond bounds
-        x_pattern = r'x=["\']?(\d+)["\']?'
-        y_pattern = r'y=["\']?(\d+)["\']?'
-
         # Find all x values within annotation group only
-        for match in re.finditer(x_pattern, annotation_group):
+        for match in _X_ATTR_RE.finditer(annotation_group):
             try:
                 x = int(match.group(1))
                 if x > ANNOTATION_PANEL_MAX_X:
@@ -1244,7 +1589,7 @@ class WireframeValidator:
                 continue
 
         # Find all y values within annotation group only
-        for match in re.finditer(y_pattern, annotation_group):
+        for match in _Y_ATTR_RE.finditer(annotation_group):
             try:
                 y = int(match.group(1))
                 if y > ANNOTATION_PANEL_MAX_Y:
@@ -1268,23 +1613,20 @@ class WireframeValidator:
 
         If "UI Elements" is at y < 140, it's too close to the callouts.
         """
-        if 'id="annotations"' not in self.svg_content:
+        if not self.has_annotations:
             return
 
         annotation_start = self.annotation_start
-        annotation_section = self.svg_content[annotation_start:]
+        annotation_section = self.annotation_section
 
         # Check for "UI Elements" or similar sections positioned too high
-        section_indicators = ['UI Elements', 'Summary', 'Notes']
-
-        for indicator in section_indicators:
+        for indicator, pattern in _SECTION_INDICATOR_RES.items():
             if indicator not in annotation_section:
                 continue
 
             # Find the y position of this section
             # Look for pattern: "UI Elements" followed by text element with y attribute
-            pattern = rf'{re.escape(indicator)}[^<]*</text>|<text[^>]*>.*?{re.escape(indicator)}'
-            match = re.search(pattern, annotation_section)
+            match = pattern.search(annotation_section)
 
             if match:
                 # Get context around the match to find y value
@@ -1292,7 +1634,7 @@ class WireframeValidator:
                 end = min(len(annotation_section), match.end() + 50)
                 context = annotation_section[start:end]
 
-                y_match = re.search(r'y=["\']?(\d+)', context)
+                y_match = _Y_ATTR_RE.search(context)
                 if y_match:
                     y = int(y_match.group(1))
                     if y < 140:
@@ -1308,19 +1650,15 @@ class WireframeValidator:
 
     def _check_annotation_group_spacing(self):
         """G-020: Annotation groups need 20px vertical gap between each."""
-        if 'id="annotations"' not in self.svg_content:
+        if not self.has_annotations:
             return
 
         annotation_start = self.annotation_start
-        annotation_section = self.svg_content[annotation_start:]
 
         # Find callout circles in annotation panel (they mark group starts)
-        circle_pattern = r'<circle[^>]*cy=["\']?(\d+)["\']?[^>]*fill=["\']?#dc2626'
-        alt_pattern = r'<circle[^>]*fill=["\']?#dc2626["\']?[^>]*cy=["\']?(\d+)'
-
         y_positions = []
-        for pattern in [circle_pattern, alt_pattern]:
-            for match in re.finditer(pattern, annotation_section[:3000]):
+        for pattern in [_GROUP_CIRCLE_RE, _GROUP_CIRCLE_ALT_RE]:
+            for _, match in self._tag_matches(pattern, 'circle', annotation_start, annotation_start + 3000):
                 try:
                     y = int(match.group(1))
                     if y not in y_positions:
@@ -1345,18 +1683,18 @@ class WireframeValidator:
         """G-021: Footer <use> must come AFTER modal content in SVG order."""
         # Only relevant if there's a modal
         modal_indicators = ['modal', 'dialog', 'consent', 'opacity="0.5"', 'opacity="0.4"']
-        has_modal = any(indicator in self.svg_content.lower() for indicator in modal_indicators)
+        has_modal = any(indicator in self.svg_lower for indicator in modal_indicators)
 
         if not has_modal:
             return
 
         # Find positions of footer reference and modal overlay
-        footer_match = re.search(r'<use[^>]*footer-desktop\.svg', self.svg_content)
-        overlay_match = re.search(r'<rect[^>]*opacity=["\']?0\.[3-6]', self.svg_content)
+        footer_match = self._first_tag_match(_FOOTER_USE_RE, 'use')
+        overlay_match = self._first_tag_match(_OVERLAY_RECT_RE, 'rect')
 
         if footer_match and overlay_match:
-            footer_pos = footer_match.start()
-            overlay_pos = overlay_match.start()
+            footer_pos = footer_match[0].start
+            overlay_pos = overlay_match[0].start
 
             if footer_pos < overlay_pos:
                 self.issues.append(Issue(
@@ -1390,14 +1728,11 @@ class WireframeValidator:
     def _check_title_exists(self):
         """G-024: Must have centered title at y < 40."""
         # Look for text element with y < 40 and text-anchor="middle"
-        title_pattern = r'<text[^>]*text-anchor=["\']middle["\'][^>]*y=["\']?(\d+)["\']?'
-        alt_pattern = r'<text[^>]*y=["\']?(\d+)["\']?[^>]*text-anchor=["\']middle["\']'
-
         found_title = False
-        for pattern in [title_pattern, alt_pattern]:
-            match = re.search(pattern, self.svg_content[:2000])
-            if match:
-                y = int(match.group(1))
+        for pattern in [_TITLE_ANCHOR_RE, _TITLE_ANCHOR_ALT_RE]:
+            found = self._first_tag_match(pattern, 'text', 0, 2000)
+            if found:
+                y = int(found[1].group(1))
                 if y < 40:
                     found_title = True
                     break
@@ -1412,10 +1747,7 @@ class WireframeValidator:
     def _check_signature_exists(self):
         """G-025: Must have signature at y > 1040."""
         # Look for text element with y > 1040
-        sig_pattern = r'<text[^>]*y=["\']?(10[4-9]\d|1[1-9]\d\d)["\']?'
-        match = re.search(sig_pattern, self.svg_content)
-
-        if not match:
+        if not self._first_tag_match(_SIGNATURE_EXISTS_RE, 'text'):
             self.issues.append(Issue(
                 severity="ERROR",
                 code="G-025",
@@ -1424,15 +1756,11 @@ class WireframeValidator:
 
     def _check_callouts_on_mockups(self):
         """G-026: Red numbered callout circles must appear on mockup UI, not just annotation panel."""
-        if 'id="annotations"' not in self.svg_content:
+        if not self.has_annotations:
             return
 
-        annotation_start = self.annotation_start
-        mockup_section = self.mockup_section
-
         # Count red callout circles in mockup area
-        callout_pattern = r'<circle[^>]*fill=["\']?#dc2626["\']?'
-        mockup_callouts = len(re.findall(callout_pattern, mockup_section))
+        mockup_callouts = self._count_tag_matches(_CALLOUT_RE, 'circle', 0, self.annotation_start)
 
         if mockup_callouts < 2:
             self.issues.append(Issue(
@@ -1448,34 +1776,37 @@ class WireframeValidator:
         First content element should be at y >= 78.
         """
         # Find mobile group
-        mobile_match = re.search(
-            r'<g[^>]*id=["\']mobile["\'][^>]*>',
-            self.svg_content
-        )
+        mobile_match = self._first_tag_match(_MOBILE_GROUP_RE, 'g')
         if not mobile_match:
             return  # No mobile mockup
 
         # Find content after header include
-        mobile_start = mobile_match.end()
+        mobile_start = mobile_match[1].end()
         # Look for header include
-        header_pattern = r'<use[^>]*header-mobile\.svg[^>]*/>'
-        header_match = re.search(header_pattern, self.svg_content[mobile_start:])
+        header_match = self._first_tag_match(_MOBILE_HEADER_USE_RE, 'use', mobile_start)
 
         if not header_match:
             return  # No header include found
 
-        content_start = mobile_start + header_match.end()
+        content_start = header_match[1].end()
 
         # Find first content element (rect, text, or nested group with y attribute)
-        first_element = re.search(
-            r'<(rect|text|g)[^>]*\sy=["\']?(\d+)',
-            self.svg_content[content_start:content_start + 2000]
+        content_end = content_start + 2000
+        candidates = sorted(
+            (element for tag in ('rect', 'text', 'g')
+             for element in self.elements.between(tag, content_start, content_end)),
+            key=lambda element: element.start
+        )
+        first_element = next(
+            (match for match in (_FIRST_CONTENT_RE.match(self.svg_content, element.start, content_end)
+                                 for element in candidates) if match),
+            None
         )
 
         if first_element:
             element_y = int(first_element.group(2))
             if element_y < MOBILE_CONTENT_MIN_Y:
-                line_num = self._get_line_number(content_start + first_element.start())
+                line_num = self._get_line_number(first_element.start())
                 self.issues.append(Issue(
                     severity="ERROR",
                     code="MOBILE-001",
@@ -1496,9 +1827,7 @@ class WireframeValidator:
         Annotation panel ends at x=1880 (40 + 1840).
         """
         # Badge pattern: small rounded rect with rx=4
-        badge_pattern = r'<rect[^>]*rx=["\']?4["\']?[^>]*>'
-
-        for match in re.finditer(badge_pattern, self.svg_content):
+        for element, match in self._tag_matches(_BADGE_RECT_RE, 'rect'):
             rect_str = match.group()
 
             # Skip if this looks like a toggle (toggles have rx >= 10, not 4)
@@ -1506,15 +1835,13 @@ class WireframeValidator:
                 continue  # Too narrow to be a badge
 
             # Extract x and width
-            x_match = re.search(r'\bx=["\']?(\d+)', rect_str)
-            w_match = re.search(r'width=["\']?(\d+)', rect_str)
+            x = element.legacy_int('x')
+            w = element.legacy_int('width')
 
-            if not x_match or not w_match:
+            if x is None or w is None:
                 continue
 
             try:
-                x = int(x_match.group(1))
-                w = int(w_match.group(1))
                 right = x + w
 
                 # Determine which container this badge is in
@@ -1522,35 +1849,31 @@ class WireframeValidator:
                     if x < 40:  # Outside canvas
                         continue
                     # Check if in annotation panel (y > 800) vs mockup
-                    y_match = re.search(r'\by=["\']?(\d+)', rect_str)
-                    if y_match:
-                        y = int(y_match.group(1))
+                    y = element.legacy_int('y')
+                    if y is not None:
                         if y > 800:  # Annotation panel
                             if right > ANNOTATION_PANEL_RIGHT:
-                                line_num = self._get_line_number(match.start())
                                 self.issues.append(Issue(
                                     severity="ERROR",
                                     code="G-036",
                                     message=f"Badge at x={x} overflows annotation panel (right edge {right} > {ANNOTATION_PANEL_RIGHT})",
-                                    line=line_num
+                                    line=element.line
                                 ))
                         else:  # Desktop mockup
                             if right > DESKTOP_MOCKUP_RIGHT:
-                                line_num = self._get_line_number(match.start())
                                 self.issues.append(Issue(
                                     severity="ERROR",
                                     code="G-036",
                                     message=f"Badge at x={x} overflows desktop mockup (right edge {right} > {DESKTOP_MOCKUP_RIGHT})",
-                                    line=line_num
+                                    line=element.line
                                 ))
                 else:  # Mobile mockup area (x >= 1360)
                     if right > MOBILE_MOCKUP_RIGHT:
-                        line_num = self._get_line_number(match.start())
                         self.issues.append(Issue(
                             severity="ERROR",
                             code="G-036",
                             message=f"Badge at x={x} overflows mobile mockup (right edge {right} > {MOBILE_MOCKUP_RIGHT})",
-                            line=line_num
+                            line=element.line
                         ))
             except (ValueError, TypeError):
                 continue
@@ -1561,47 +1884,39 @@ class WireframeValidator:
         Annotation panel titles (numbered ①②③④) must be bold for visual hierarchy.
         All annotation text should use dark colors (#1f2937, #374151) not light grey.
         """
-        if 'id="annotations"' not in self.svg_content:
+        if not self.has_annotations:
             return
 
         annotation_start = self.annotation_start
-        annotation_section = self.svg_content[annotation_start:]
 
         # Find numbered annotation titles (①②③④⑤⑥⑦⑧⑨⑩)
         # These should have font-weight="bold"
-        circled_nums = '[①②③④⑤⑥⑦⑧⑨⑩]'
-        title_pattern = rf'<text[^>]*>({circled_nums}[^<]*)</text>'
-
-        for match in re.finditer(title_pattern, annotation_section):
+        for element, match in self._tag_matches(_CIRCLED_TITLE_RE, 'text', annotation_start):
             text_content = match.group(1)
             text_element = match.group(0)
 
             # Check for bold
             if 'font-weight="bold"' not in text_element and 'font-weight:bold' not in text_element:
-                line_num = self._get_line_number(annotation_start + match.start())
                 self.issues.append(Issue(
                     severity="ERROR",
                     code="G-037",
                     message=f"Annotation title not bold: '{text_content[:30]}...' - add font-weight=\"bold\"",
-                    line=line_num
+                    line=element.line
                 ))
 
         # Check for light/faded text colors in annotation panel
         # Light colors that are hard to read: #9ca3af, #d1d5db, #e5e7eb
         light_colors = ['#9ca3af', '#d1d5db', '#e5e7eb', '#6b7280']
-        text_color_pattern = r'<text[^>]*fill=["\']?([^"\'>\s]+)["\']?[^>]*>([^<]+)</text>'
-
-        for match in re.finditer(text_color_pattern, annotation_section):
+        for element, match in self._tag_matches(_TEXT_FILL_RE, 'text', annotation_start):
             fill = match.group(1).lower()
             text_content = match.group(2)[:20]
 
             if fill in light_colors:
-                line_num = self._get_line_number(annotation_start + match.start())
                 self.issues.append(Issue(
                     severity="ERROR",
                     code="G-037",
                     message=f"Annotation text uses light color {fill}: '{text_content}...' - use #374151 or darker",
-                    line=line_num
+                    line=element.line
                 ))
 
     def _check_footer_nav_corners(self):
@@ -1613,40 +1928,1070 @@ class WireframeValidator:
         # Find desktop footer rects (within desktop mockup, y near bottom ~640-720 relative to desktop group)
         # Desktop group is at transform="translate(40, 60)" so absolute y would be 700-780
         # Look for rects with large width (footer-like) in the y=640-780 range
-        desktop_footer_pattern = r'<rect[^>]*\by=["\']?(6[4-9]\d|7[0-7]\d)["\']?[^>]*width=["\']?(1[0-2]\d\d)["\']?[^>]*'
-        for match in re.finditer(desktop_footer_pattern, self.svg_content):
+        for element, match in self._tag_matches(_DESKTOP_FOOTER_RECT_RE, 'rect'):
             rect_element = match.group(0)
             # Check if rx attribute is present
             if 'rx=' not in rect_element:
-                line_num = self._get_line_number(match.start())
                 self.issues.append(Issue(
                     severity="ERROR",
                     code="G-044",
                     message="Desktop footer missing rounded corners - add rx=\"4\" or rx=\"8\"",
-                    line=line_num
+                    line=element.line
                 ))
 
         # Find mobile bottom nav rects (within mobile mockup area x >= 1360)
         # Mobile nav is at bottom of 720px viewport, so y ~= 664-720
         # Look for nav bar pattern: rect at bottom of mobile with width ~360
-        mobile_nav_pattern = r'<rect[^>]*\by=["\']?(66[4-9]|6[7-9]\d|7[0-1]\d)["\']?[^>]*width=["\']?(3[4-6]\d)["\']?[^>]*'
-        for match in re.finditer(mobile_nav_pattern, self.svg_content):
+        for element, match in self._tag_matches(_MOBILE_NAV_RECT_RE, 'rect'):
             rect_element = match.group(0)
             # Check if rx attribute is present
             if 'rx=' not in rect_element:
-                line_num = self._get_line_number(match.start())
                 self.issues.append(Issue(
                     severity="ERROR",
                     code="G-044",
                     message="Mobile bottom nav missing rounded corners - add rx=\"4\" or rx=\"8\"",
-                    line=line_num
+                    line=element.line
                 ))
 
 
+# ============================================================
+# RULE REGISTRY - What validate() runs, in order
+# ============================================================
+
+@dataclass(frozen=True)
+class Rule:
+    """One validator check and the issue codes it can report."""
+    name: str
+    codes: Tuple[str, ...]
+    description: str
+
+    @property
+    def method(self) -> str:
+        return f"_check_{self.name}"
+
+
+# Order matters: issues are reported in the order their rules run.
+RULES: List[Rule] = [
+    # Common XML/SVG issues that cause browser errors
+    Rule('xml_syntax', ('XML-001', 'XML-002', 'XML-003', 'XML-004'), "Unescaped &/<, mismatched or missing attribute quotes"),
+    # Original checks
+    Rule('svg_root', ('SVG-001', 'SVG-002', 'SVG-003'), "Root viewBox/width/height are 1920x1080"),
+    Rule('colors', ('G-001',), "No forbidden panel colors on rects"),
+    Rule('toggle_colors', ('G-015',), "Toggles are #6b7280 (off) or #22c55e (on)"),
+    Rule('boundaries', ('G-018',), "Rects stay inside the canvas"),
+    # v2 checks
+    Rule('header_templates', ('HDR-001',), "Header/footer include references present"),
+    Rule('mobile_frame', ('MOB-001',), "Mobile phone frame is not dark"),
+    Rule('font_sizes', ('FONT-001',), "Text is at least 14px (11px in badges)"),
+    Rule('clickable_badges', ('LINK-001',), "FR/SC/US badges are wrapped in <a>"),
+    Rule('layout_usage', ('LAYOUT-001',), "No large unused space on the right"),
+    # v2.1 checks
+    Rule('callout_collisions', ('COLL-001',), "Callouts don't overlap footers"),
+    Rule('annotation_structure', ('ANN-001', 'ANN-002'), "Annotation panel has required structure"),
+    # v3 checks
+    Rule('title_format', ('TITLE-001', 'TITLE-002', 'TITLE-003'), "Title is human-readable and centered"),
+    Rule('section_labels', ('SECTION-001', 'SECTION-002'), "DESKTOP and MOBILE section labels"),
+    Rule('clutter', ('CLUTTER-001', 'CLUTTER-002', 'CLUTTER-003'), "No Legend/Coverage/Integration rows"),
+    Rule('callout_coverage', ('CALLOUT-002',), "Every annotation callout appears on a mockup"),
+    Rule('button_fills', ('BTN-001',), "Buttons have solid, not faded, fills"),
+    Rule('signature', ('SIGNATURE-001', 'SIGNATURE-002', 'SIGNATURE-003', 'SIGNATURE-004'), "Signature is 18px+, bold, left-aligned, well-formed"),
+    Rule('annotation_spacing', ('LAYOUT-002',), "Annotation panel clears the signature"),
+    # v4 checks
+    Rule('user_story_coverage', ('US-001', 'US-002'), "Annotations anchored by 3+ User Stories"),
+    # v5 checks
+    Rule('modal_overlay', ('MODAL-001',), "Modals have a dark dimmed overlay"),
+    Rule('callout_positioning', ('CALLOUT-003',), "Callouts sit after elements, not on top"),
+    Rule('annotation_columns', ('ANN-003',), "Annotation text stays within its column"),
+    Rule('annotation_containment', ('ANN-004',), "Annotation content fits the panel"),
+    Rule('section_separation', ('ANN-005',), "Summary sections sit below the callout rows"),
+    # v6 checks
+    Rule('annotation_group_spacing', ('G-020',), "Annotation groups are spaced apart"),
+    Rule('footer_paint_order', ('G-021',), "Footer <use> comes after modal content"),
+    # v7 checks
+    Rule('background_gradient', ('G-022',), "Blue gradient background is defined and used"),
+    Rule('title_exists', ('G-024',), "Centered title at y < 40"),
+    Rule('signature_exists', ('G-025',), "Signature present at y > 1040"),
+    Rule('callouts_on_mockups', ('G-026',), "Numbered callouts appear on the mockups"),
+    # v8 checks
+    Rule('mobile_content_position', ('MOBILE-001',), "Mobile content starts below the header"),
+    # v9 checks
+    Rule('badge_containment', ('G-036',), "Badges don't overflow their containers"),
+    Rule('annotation_text_readability', ('G-037',), "Annotation titles bold, text high-contrast"),
+    # v10 checks
+    Rule('footer_nav_corners', ('G-044',), "Footer and mobile nav have rounded corners"),
+]
+
+# Pseudo-rule under which --profile reports reading, parsing and tokenizing.
+PARSE_STEP = "(parse)"
+
+
+def select_rules(only: Optional[List[str]] = None, skip: Optional[List[str]] = None) -> List[Rule]:
+    """RULES filtered by --rules/--skip-rules, keeping registry order.
+
+    Entries may be rule names (`modal_overlay`) or issue codes (`MODAL-001`);
+    a code selects every rule that reports it. Raises ValueError for an
+    entry that matches nothing, so a typo can't silently disable a check.
+    """
+    def matching(selectors: List[str]) -> Set[str]:
+        names: Set[str] = set()
+        for selector in selectors:
+            hits = {rule.name for rule in RULES
+                    if selector.lower() == rule.name or selector.upper() in rule.codes}
+            if not hits:
+                raise ValueError(f"Unknown rule or issue code '{selector}'")
+            names |= hits
+        return names
+
+    selected = RULES
+    if only:
+        wanted = matching(only)
+        selected = [rule for rule in selected if rule.name in wanted]
+    if skip:
+        unwanted = matching(skip)
+        selected = [rule for rule in selected if rule.name not in unwanted]
+    return selected
+
+
+class RuleProfile:
+    """Cumulative wall time and issue counts per rule over a run (--profile).
+
+    Worker processes each fill their own profile, which is pickled back with
+    the file's issues and merged into the parent's.
+    """
+
+    def __init__(self):
+        self.files = 0
+        self.seconds: Dict[str, float] = {}
+        self.hits: Dict[str, int] = {}
+
+    def record(self, name: str, seconds: float, hits: int) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.hits[name] = self.hits.get(name, 0) + hits
+        if name == PARSE_STEP:
+            self.files += 1
+
+    def merge(self, other: 'RuleProfile') -> None:
+        self.files += other.files
+        for name, seconds in other.seconds.items():
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+            self.hits[name] = self.hits.get(name, 0) + other.hits[name]
+
+    def report(self, total_files: int, out=sys.stderr) -> None:
+        """Print rules slowest first. Goes to stderr so --json stays parseable."""
+        total = sum(self.seconds.values())
+        cached = total_files - self.files
+        print(f"\n{'='*60}", file=out)
+        print(f"RULE PROFILE: {self.files} files validated"
+              + (f", {cached} answered from cache" if cached else ""), file=out)
+        print('='*60, file=out)
+        print(f"  {'rule':<28} {'time (ms)':>10} {'share':>7} {'hits':>6}", file=out)
+        for name, seconds in sorted(self.seconds.items(), key=lambda kv: kv[1], reverse=True):
+            share = seconds / total * 100 if total else 0.0
+            print(f"  {name:<28} {seconds * 1000:>10.1f} {share:>6.1f}% {self.hits[name]:>6}", file=out)
+        print(f"  {'TOTAL':<28} {total * 1000:>10.1f}", file=out)
+
+
+# ============================================================
+# BATCH VALIDATION - Fan files out to a process pool
+# ============================================================
+
+def _validate_file(svg_path: Path, rules: Optional[List[Rule]] = None,
+                   profile: bool = False, model_cache: Optional[DocumentCache] = None,
+                   document: Optional[SVGDocument] = None,
+                   stream: bool = False) -> Tuple[List[Issue], Optional[RuleProfile]]:
+    """Validate a single SVG. Module-level so worker processes can pickle it.
+
+    With a model cache, the landmarks and conventions inspect-wireframes.py
+    needs are extracted from the same read and stored for it.
+    """
+    file_profile = RuleProfile() if profile else None
+    validator = WireframeValidator(svg_path, rules, document, stream)
+    issues = validator.validate(file_profile)
+    if model_cache is not None:
+        model_cache.load(validator.document)
+    return issues, file_profile
+
+
+def _run_validators(svg_files: List[Path], jobs: int, rules: Optional[List[Rule]] = None,
+                    profile: Optional[RuleProfile] = None,
+                    model_cache: Optional[DocumentCache] = None,
+                    stream: bool = False) -> Iterator[Tuple[Path, List[Issue]]]:
+    """Validate every file, serially or in a process pool, in input order."""
+    validate_one = partial(_validate_file, rules=rules, profile=profile is not None,
+                           model_cache=model_cache, stream=stream)
+    if jobs <= 1 or len(svg_files) <= 1:
+        results = map(validate_one, svg_files)
+        executor = None
+    else:
+        workers = min(jobs, len(svg_files))
+        # Small chunks keep results streaming; one file per task is too chatty.
+        chunksize = max(1, len(svg_files) // (workers * 4))
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(validate_one, svg_files, chunksize=chunksize)
+    try:
+        for svg_path, (issues, file_profile) in zip(svg_files, results, strict=True):
+            if profile is not None:
+                profile.merge(file_profile)
+            yield svg_path, issues
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def validate_files(svg_files: List[Path], jobs: int = 1,
+                   cache: Optional['ResultCache'] = None,
+                   rules: Optional[List[Rule]] = None,
+                   profile: Optional[RuleProfile] = None,
+                   model_cache: Optional[DocumentCache] = None,
+                   stream: bool = False) -> Iterator[Tuple[Path, List[Issue]]]:
+    """Yield (svg_path, issues) for every file, in input order.
+
+    Each file is independent CPU-bound work, so with jobs > 1 the files are
+    spread over a process pool. Executor.map() hands results back in
+    submission order as soon as each one (and every earlier one) is done, so
+    callers can print, log and aggregate exactly as in a serial run.
+
+    With a cache, files whose content hash is already known are answered
+    from it and only the misses are validated. `rules` restricts the checks
+    run (default: all of RULES); `profile` collects per-rule timings for
+    the files actually validated; `model_cache` is filled with the landmarks
+    and conventions of every file validated; `stream` selects the iterparse backend (same
+    issues, no tree held in memory).
+
+    Serially, one read of each file serves both the cache lookup and the
+    validator. Worker processes read their files themselves rather than
+    have every miss's bytes queued up for them.
+    """
+    if cache is None:
+        yield from _run_validators(svg_files, jobs, rules, profile, model_cache, stream)
+        return
+
+    if jobs <= 1 or len(svg_files) <= 1:
+        for svg_path in svg_files:
+            document = SVGDocument.read(svg_path)
+            issues = cache.get(svg_path, document.sha256)
+            if issues is None:
+                issues, file_profile = _validate_file(svg_path, rules, profile is not None,
+                                                      model_cache, document, stream)
+                if profile is not None:
+                    profile.merge(file_profile)
+                cache.put(svg_path, document.sha256, issues)
+            yield svg_path, issues
+        return
+
+    digests = {svg_path: ResultCache.digest(svg_path) for svg_path in svg_files}
+    hits: Dict[Path, List[Issue]] = {}
+    for svg_path in svg_files:
+        cached = cache.get(svg_path, digests[svg_path])
+        if cached is not None:
+            hits[svg_path] = cached
+
+    fresh = _run_validators([p for p in svg_files if p not in hits], jobs, rules, profile,
+                            model_cache, stream)
+    for svg_path in svg_files:
+        if svg_path in hits:
+            yield svg_path, hits[svg_path]
+            continue
+        _, issues = next(fresh)
+        cache.put(svg_path, digests[svg_path], issues)
+        yield svg_path, issues
+
+
+def discover_svgs(roots: List[Path]) -> List[Path]:
+    """Every wireframe SVG under `roots` (what --all validates), deduplicated.
+
+    Walks every configured root so consolidation-in-progress trees
+    (wireframes in both features/ and docs/design/wireframes/) are all
+    checked. includes/ (reusable components) and templates/ are skipped.
+    """
+    svg_files: List[Path] = []
+    seen_svg_paths: Set[Path] = set()
+    for root in roots:
+        if not root.exists():
+            continue
+        for svg in root.glob('**/*.svg'):
+            if svg in seen_svg_paths:
+                continue
+            seen_svg_paths.add(svg)
+            # Exclude includes/ (reusable components) and templates/
+            if 'includes' in str(svg) or 'templates' in str(svg):
+                continue
+            svg_files.append(svg)
+    return svg_files
+
+
+# ============================================================
+# CHANGED FILES - Narrow a run to what git says changed
+# ============================================================
+
+# <use href="includes/header-desktop.svg#desktop-header"/>, relative to the SVG
+_INCLUDE_HREF_RE = re.compile(r'href=["\']([^"\'#]*includes/[^"\'#]+\.svg)')
+
+
+def git_changed_files(ref: str, cwd: Path) -> List[Path]:
+    """Absolute paths git reports as changed since `ref`.
+
+    Covers committed, staged and unstaged changes (`git diff <ref>` against
+    the working tree) plus untracked files, so a new wireframe counts too.
+    Deleted paths are included: a deleted include still affects its users.
+    Raises RuntimeError if git fails (bad ref, not a repository, no git).
+    """
+    def git(*args: str) -> str:
+        try:
+            result = subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True)
+        except OSError as e:
+            raise RuntimeError(f"could not run git: {e}") from e
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip() or f"git {args[0]} failed")
+        return result.stdout
+
+    top = Path(git('rev-parse', '--show-toplevel').strip())
+    # Both commands print paths relative to the top level when run there
+    names = git('-C', str(top), 'diff', '--name-only', '-z', ref, '--').split('\0')
+    names += git('-C', str(top), 'ls-files', '--others', '--exclude-standard', '-z').split('\0')
+    return [top / name for name in names if name]
+
+
+def include_dependencies(svg_path: Path) -> Set[Path]:
+    """Resolved paths of the includes/*.svg files an SVG <use>s."""
+    try:
+        content = svg_path.read_text()
+    except OSError:
+        return set()
+    return {(svg_path.parent / href).resolve() for href in _INCLUDE_HREF_RE.findall(content)}
+
+
+def select_changed(svg_files: List[Path], changed: Iterable[Path]) -> List[Path]:
+    """The SVGs in `svg_files` that changed or use a changed include, in order."""
+    changed_svgs = {p.resolve() for p in changed if p.suffix == '.svg'}
+    changed_includes = {p for p in changed_svgs if 'includes' in p.parts}
+    selected = []
+    for svg_path in svg_files:
+        if svg_path.resolve() in changed_svgs:
+            selected.append(svg_path)
+        elif changed_includes and include_dependencies(svg_path) & changed_includes:
+            selected.append(svg_path)
+    return selected
+
+
+# ============================================================
+# WATCH MODE - Keep a warm process and revalidate on save
+# ============================================================
+
+WATCH_DEBOUNCE_SECONDS = 0.15  # Editors write in bursts; wait for quiet
+WATCH_POLL_SECONDS = 0.5       # Rescan interval when inotify is unavailable
+
+
+class _InotifyWatcher:
+    """Linux inotify via ctypes, one watch per directory under the roots."""
+
+    backend = "inotify"
+
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE_SELF = 0x400
+    IN_IGNORED = 0x8000
+    IN_ISDIR = 0x40000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF
+    _EVENT = struct.Struct('iIII')  # wd, mask, cookie, len; then the name
+
+    def __init__(self, roots: List[Path]):
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify needs Linux")
+        import ctypes
+        import ctypes.util
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, Path] = {}
+        for root in roots:
+            if root.is_dir():
+                self._watch_tree(root)
+
+    def _watch_tree(self, top: Path) -> None:
+        import ctypes
+        for dirpath, _, _ in os.walk(top):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), self.MASK)
+            if wd < 0:
+                # Typically ENOSPC: fs.inotify.max_user_watches exhausted
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {dirpath}")
+            self._dirs[wd] = Path(dirpath)
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        """Paths written within `timeout` seconds (None: block until one is)."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed: Set[Path] = set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self._EVENT.unpack_from(data, offset)
+            offset += self._EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            if mask & (self.IN_DELETE_SELF | self.IN_IGNORED):
+                self._dirs.pop(wd, None)
+            elif mask & self.IN_ISDIR:
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    # A new feature folder: watch it and pick up what's already in it
+                    new_dir = directory / name
+                    self._watch_tree(new_dir)
+                    changed.update(new_dir.glob('**/*.svg'))
+            elif mask & (self.IN_CLOSE_WRITE | self.IN_MOVED_TO):
+                changed.add(directory / name)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class _PollingWatcher:
+    """Fallback: rescan the roots and compare (mtime, size) per SVG."""
+
+    backend = "polling"
+
+    def __init__(self, roots: List[Path]):
+        self._roots = roots
+        self._stamps = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        stamps = {}
+        for root in self._roots:
+            if not root.is_dir():
+                continue
+            for svg in root.glob('**/*.svg'):
+                try:
+                    st = svg.stat()
+                except OSError:
+                    continue
+                stamps[svg] = (st.st_mtime_ns, st.st_size)
+        return stamps
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            pause = WATCH_POLL_SECONDS
+            if deadline is not None:
+                pause = min(pause, max(0.0, deadline - time.monotonic()))
+            time.sleep(pause)
+            stamps = self._scan()
+            changed = {p for p, stamp in stamps.items() if self._stamps.get(p) != stamp}
+            self._stamps = stamps
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+
+def _open_watcher(roots: List[Path]):
+    try:
+        return _InotifyWatcher(roots)
+    except (OSError, AttributeError) as e:
+        print(f"Warning: inotify unavailable ({e}); polling every {WATCH_POLL_SECONDS}s",
+              file=sys.stderr)
+        return _PollingWatcher(roots)
+
+
+def watch(roots: List[Path], logger: 'IssueLogger', display: Callable[[Path], str],
+          rules: Optional[List[Rule]] = None, log: bool = True) -> None:
+    """Revalidate wireframes as they are saved, until interrupted.
+
+    Runs in one warm process, so each save costs a parse and the checks
+    rather than interpreter startup and root detection. Changes arriving
+    within WATCH_DEBOUNCE_SECONDS of each other are handled as one batch;
+    a changed include revalidates the wireframes that use it. Each batch
+    rewrites the affected .issues.md files (unless `log` is off) and prints
+    one JSON object per file on stdout:
+
+        {"event": "validated", "file": ..., "passed": ..., "issues": [...], "ms": ...}
+    """
+    watcher = _open_watcher(roots)
+    print(json.dumps({"event": "watching", "backend": watcher.backend,
+                      "roots": [str(r) for r in roots]}), flush=True)
+    try:
+        while True:
+            changed = watcher.wait(None)
+            while True:
+                more = watcher.wait(WATCH_DEBOUNCE_SECONDS)
+                if not more:
+                    break
+                changed |= more
+            changed = {p for p in changed if p.suffix == '.svg' and p.is_file()}
+            if not changed:
+                continue
+            targets = [p for p in sorted(changed)
+                       if 'includes' not in str(p) and 'templates' not in str(p)]
+            if len(targets) < len(changed):
+                targets = select_changed(discover_svgs(roots), changed)
+            for svg_path in targets:
+                started = time.perf_counter()
+                try:
+                    issues = WireframeValidator(svg_path, rules).validate()
+                except (OSError, UnicodeDecodeError) as e:
+                    # Usually the editor replaced or removed it mid-batch
+                    print(json.dumps({"event": "error", "file": display(svg_path),
+                                      "message": str(e)}), flush=True)
+                    continue
+                if log:
+                    logger.log_issues(svg_path, issues, quiet=True)
+                print(json.dumps({
+                    "event": "validated",
+                    "file": display(svg_path),
+                    "passed": not issues,
+                    "issues": [asdict(issue) for issue in issues],
+                    "ms": round((time.perf_counter() - started) * 1000, 1),
+                }), flush=True)
+            if logger.index is not None:
+                logger.index.save()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+# ============================================================
+# DAEMON - One warm validator shared by every terminal
+# ============================================================
+
+DAEMON_SOCKET_NAME = "daemon.sock"
+DAEMON_MAX_REQUEST_BYTES = 64 * 1024 * 1024  # Inline SVGs are base64; refuse anything silly
+DAEMON_CLIENT_TIMEOUT = 30.0  # A stuck client must not hold up the others
+
+
+def _daemon_request(socket_path: Path, request: Dict, timeout: Optional[float] = None) -> Dict:
+    """Send one request to the daemon at `socket_path` and return its reply.
+
+    Raises OSError when nothing is listening there and ValueError when the
+    reply isn't JSON (e.g. the daemon went away mid-request).
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b"".join(chunks))
+
+
+class ValidatorDaemon:
+    """Answers validation requests on a Unix socket from one warm process.
+
+    Started with --serve; `validate.py --client ...` is the thin client.
+    Every caller shares this process's imports, root detection, rule
+    registry, result cache and issue logger instead of paying for them on
+    each spawn. Requests are handled one at a time, so none of that state
+    needs locking.
+
+    Protocol: the client sends one JSON object and closes its write side;
+    the daemon answers with one JSON object and closes the connection.
+
+        {"op": "validate", "files": ["/abs/a.svg", ...],
+         "documents": [{"name": "a.svg", "svg": "<base64>"}, ...]}
+        -> {"results": [{"file": ..., "passed": ..., "issues": [...], "ms": ...}, ...]}
+        {"op": "status"}   -> {"version": ..., "pid": ..., "requests": ..., ...}
+        {"op": "shutdown"} -> {"stopping": true}
+
+    Results come back in request order, files first. Files go through the
+    result cache and, like a normal run, update their .issues.md (unless
+    the daemon runs a subset of the rules); inline documents are validated
+    in memory under their name (MODAL-001 reads it) and never logged. A
+    request that fails gets {"error": ...} instead, per file or overall.
+
+    When validate.py or svg_document.py changes on disk the daemon refuses
+    further validation and exits, so nobody gets results from stale rules.
+    """
+
+    def __init__(self, socket_path: Path, logger: 'IssueLogger', display: Callable[[Path], str],
+                 cache: Optional['ResultCache'], model_cache: Optional[DocumentCache],
+                 rules: Optional[List[Rule]] = None, log: bool = True, stream: bool = False):
+        self.socket_path = socket_path
+        self.logger = logger
+        self.display = display
+        self.cache = cache
+        self.model_cache = model_cache
+        self.rules = rules
+        self.log = log
+        self.stream = stream
+        self.ruleset = _ruleset_hash()
+        self.started = time.time()
+        self.requests = 0
+        self.running = True
+
+    def serve(self) -> None:
+        """Listen until a shutdown request, a source change or an interrupt.
+
+        Raises RuntimeError when another daemon already owns the socket.
+        """
+        if self.socket_path.exists():
+            try:
+                _daemon_request(self.socket_path, {"op": "status"}, timeout=2.0)
+            except (OSError, ValueError):
+                self.socket_path.unlink()  # Left behind by a daemon that died
+            else:
+                raise RuntimeError(f"a daemon is already listening on {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(str(self.socket_path))
+            # Requests name arbitrary paths; only this user may send them
+            os.chmod(self.socket_path, 0o600)
+            server.listen(16)
+            print(json.dumps({"event": "serving", "socket": str(self.socket_path),
+                              "pid": os.getpid(), "version": VALIDATOR_VERSION}), flush=True)
+            while self.running:
+                conn, _ = server.accept()
+                with conn:
+                    self._answer(conn)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+            self.socket_path.unlink(missing_ok=True)
+            self._flush()
+
+    def _answer(self, conn: socket.socket) -> None:
+        conn.settimeout(DAEMON_CLIENT_TIMEOUT)
+        try:
+            chunks = []
+            size = 0
+            while True:
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > DAEMON_MAX_REQUEST_BYTES:
+                    raise ValueError(f"request larger than {DAEMON_MAX_REQUEST_BYTES} bytes")
+                chunks.append(chunk)
+            request = json.loads(b"".join(chunks))
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            reply = self.handle(request)
+        except (ValueError, UnicodeDecodeError) as e:
+            reply = {"error": f"bad request: {e}"}
+        except OSError:
+            return  # Client timed out or hung up; nobody to answer
+        except Exception as e:
+            # A bug tripped by one request must not take the daemon down
+            # for every other terminal; report it and keep serving.
+            traceback.print_exc(file=sys.stderr)
+            reply = {"error": f"internal error: {type(e).__name__}: {e}"}
+        try:
+            conn.sendall(json.dumps(reply).encode() + b"\n")
+        except OSError:
+            pass
+
+    def handle(self, request: Dict) -> Dict:
+        """Reply to one decoded request."""
+        self.requests += 1
+        op = request.get("op", "validate")
+        if op == "status":
+            return {
+                "version": VALIDATOR_VERSION,
+                "pid": os.getpid(),
+                "uptime_s": round(time.time() - self.started, 1),
+                "requests": self.requests,
+                "cached_results": len(self.cache.entries) if self.cache is not None else None,
+                "rules": len(self.rules) if self.rules is not None else len(RULES),
+            }
+        if op == "shutdown":
+            self.running = False
+            return {"stopping": True}
+        if op != "validate":
+            return {"error": f"unknown op '{op}'"}
+        if _ruleset_hash() != self.ruleset:
+            self.running = False
+            return {"error": "validator source changed since the daemon started; "
+                             "it has exited, start it again with --serve"}
+
+        files = request.get("files", [])
+        documents = request.get("documents", [])
+        if not isinstance(files, list) or not all(isinstance(raw, str) for raw in files):
+            return {"error": "bad request: 'files' must be a list of path strings"}
+        if not isinstance(documents, list) or not all(isinstance(doc, dict) for doc in documents):
+            return {"error": "bad request: 'documents' must be a list of objects"}
+
+        results = [self._validate_path(raw) for raw in files]
+        results.extend(self._validate_document(doc) for doc in documents)
+        self._flush()
+        return {"results": results}
+
+    def _validate_path(self, raw: str) -> Dict:
+        svg_path = Path(raw)
+        if not svg_path.is_absolute():
+            return {"file": raw, "error": "paths must be absolute (the daemon has its own cwd)"}
+        if not svg_path.is_file():
+            return {"file": raw, "error": "not a file"}
+        started = time.perf_counter()
+        try:
+            _, issues = next(validate_files([svg_path], 1, self.cache, self.rules,
+                                            model_cache=self.model_cache, stream=self.stream))
+            if self.log:
+                self.logger.log_issues(svg_path, issues, quiet=True)
+        except (OSError, UnicodeDecodeError) as e:
+            return {"file": self.display(svg_path), "error": str(e)}
+        except Exception as e:  # A failing check costs this file, not the daemon
+            traceback.print_exc(file=sys.stderr)
+            return {"file": self.display(svg_path), "error": f"internal error: {type(e).__name__}: {e}"}
+        return self._result(self.display(svg_path), issues, started)
+
+    def _validate_document(self, doc: Dict) -> Dict:
+        name = Path(str(doc.get("name") or "stdin.svg")).name
+        started = time.perf_counter()
+        try:
+            data = base64.b64decode(doc.get("svg", ""), validate=True)
+            svg_path = Path(name)
+            issues = WireframeValidator(svg_path, self.rules, SVGDocument(svg_path, data),
+                                        self.stream).validate()
+        except (ValueError, TypeError, UnicodeDecodeError) as e:
+            return {"file": name, "error": str(e)}
+        except Exception as e:  # A failing check costs this document, not the daemon
+            traceback.print_exc(file=sys.stderr)
+            return {"file": name, "error": f"internal error: {type(e).__name__}: {e}"}
+        return self._result(name, issues, started)
+
+    @staticmethod
+    def _result(display: str, issues: List[Issue], started: float) -> Dict:
+        return {
+            "file": display,
+            "passed": not issues,
+            "issues": [asdict(issue) for issue in issues],
+            "ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def _flush(self) -> None:
+        if self.cache is not None:
+            self.cache.save()
+        if self.logger.index is not None:
+            self.logger.index.save()
+
+
+def run_client(socket_path: Path, targets: List[str]) -> int:
+    """The --client side: ask the daemon, print its JSON reply, return the exit code.
+
+    `targets` are SVG paths (resolved here, against this process's cwd),
+    "-" for SVG bytes on stdin, or one of --status / --stop.
+    """
+    if targets == ['--status']:
+        request: Dict = {"op": "status"}
+    elif targets == ['--stop']:
+        request = {"op": "shutdown"}
+    else:
+        files = []
+        documents = []
+        for target in targets:
+            if target == '-':
+                documents.append({"name": "stdin.svg",
+                                  "svg": base64.b64encode(sys.stdin.buffer.read()).decode()})
+            else:
+                files.append(str(Path(target).resolve()))
+        request = {"op": "validate", "files": files, "documents": documents}
+
+    try:
+        reply = _daemon_request(socket_path, request)
+    except OSError as e:
+        print(f"ERROR: No validator daemon on {socket_path} ({e}); start one with --serve")
+        return 1
+    except ValueError:
+        print(f"ERROR: The validator daemon on {socket_path} closed the connection without a reply")
+        return 1
+
+    print(json.dumps(reply, indent=2))
+    if "error" in reply:
+        return 1
+    results = reply.get("results", [])
+    failed = any("error" in r or any(i["severity"] == "ERROR" for i in r["issues"]) for r in results)
+    return 1 if failed else 0
+
+
+# ============================================================
+# RESULT CACHE - Skip re-validating unchanged SVGs
+# ============================================================
+
+def _ruleset_hash() -> str:
+    """Fingerprint of the rules in force: validator version + validator source.
+
+    Any edit to a check - or to the shared modules it relies on - changes
+    the source bytes, which invalidates every cached result without anyone
+    having to remember to bump a version.
+    """
+    h = hashlib.sha256(VALIDATOR_VERSION.encode())
+    for source in (__file__, svg_document.__file__):
+        h.update(Path(source).resolve().read_bytes())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Persistent per-SVG cache of validation results.
+
+    Entries are keyed by resolved SVG path and hold the content hash the
+    issues were computed from. A lookup only hits when the current content
+    hash matches - the path is part of the key because some checks (e.g.
+    MODAL-001 page detection) look at the filename. The whole cache is
+    discarded when the rule-set hash changes.
+    """
+
+    FILENAME = "results.json"
+
+    def __init__(self, cache_dir: Path, ruleset: str):
+        self.cache_path = cache_dir / self.FILENAME
+        self.ruleset = ruleset
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        self._load()
+
+    @staticmethod
+    def digest(svg_path: Path) -> str:
+        return hashlib.sha256(svg_path.read_bytes()).hexdigest()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("ruleset") != self.ruleset:
+            # Stale rule set: every entry is invalid. Rewrite on save.
+            self.dirty = True
+            return
+        self.entries = data.get("entries", {})
+
+    def get(self, svg_path: Path, digest: str) -> Optional[List[Issue]]:
+        entry = self.entries.get(str(svg_path.resolve()))
+        if entry is None or entry.get("sha256") != digest:
+            return None
+        return [Issue(**raw) for raw in entry["issues"]]
+
+    def put(self, svg_path: Path, digest: str, issues: List[Issue]) -> None:
+        self.entries[str(svg_path.resolve())] = {
+            "sha256": digest,
+            "issues": [asdict(issue) for issue in issues],
+        }
+        self.dirty = True
+
+    def prune(self, keep: List[Path], roots: List[Path]) -> int:
+        """Evict entries under `roots` for SVGs that weren't part of this run.
+
+        Entries outside the scanned roots are left alone so alternating runs
+        over different --root trees don't evict each other.
+        """
+        keep_keys = {str(p.resolve()) for p in keep}
+        root_prefixes = tuple(str(r.resolve()) + os.sep for r in roots)
+        stale = [key for key in self.entries
+                 if key.startswith(root_prefixes) and key not in keep_keys]
+        for key in stale:
+            del self.entries[key]
+        if stale:
+            self.dirty = True
+        return len(stale)
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        payload = {"ruleset": self.ruleset, "entries": self.entries}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent validator runs never read a torn file.
+            tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(payload))
+            os.replace(tmp_path, self.cache_path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: Could not write result cache: {e}", file=sys.stderr)
+
+    @staticmethod
+    def clear(cache_dir: Path) -> int:
+        """Delete the cache file. Returns the number of entries dropped."""
+        cache_path = cache_dir / ResultCache.FILENAME
+        if not cache_path.exists():
+            return 0
+        try:
+            count = len(json.loads(cache_path.read_text()).get("entries", {}))
+        except (OSError, ValueError, AttributeError):
+            count = 0
+        cache_path.unlink()
+        return count
+
+
 # ============================================================
 # ISSUE LOGGER - Auto-logs to feature-specific .issues.md files
 # ============================================================
 
+_ISSUE_CODE_RE = re.compile(r'\| ([A-Z]+-\d{3}) \|')
+_LAST_REVIEW_RE = re.compile(r'^\*\*Last Review:\*\* (\S+)$', re.MULTILINE)
+# Section inspect-wireframes.py appends to the same file (its pattern)
+_INSPECTOR_SECTION_RE = re.compile(r'## Inspector Issues \([^)]+\).*?(?=\n## |\Z)', re.DOTALL)
+
+
+class EscalationIndex:
+    """Issue code -> features listing it, maintained as .issues.md files change.
+
+    check_escalation() used to glob every root and read and regex-scan every
+    .issues.md on every call. The index keeps each file's codes (with its
+    mtime and size) plus a running code -> feature -> file-count map, so:
+
+    - log_issues() records the file it writes from the text it just wrote
+      (--no-cache included, so the tool's own writes are never missed);
+    - a query stats the known files, re-reads only those that changed,
+      drops deleted ones, and answers from the map - no directory walk;
+    - the first query for a set of roots (or --rebuild-index) walks the
+      roots once and rebuilds everything.
+
+    .issues.md files that appear without passing through log_issues (a
+    teammate's pull, hand-written ones) are picked up by --rebuild-index.
+    The index is per set of roots, so runs over different --root trees
+    keep separate files. The GENERAL_ISSUES.md codes are cached here too,
+    keyed by that file's mtime and size.
+    """
+
+    VERSION = 2
+    PREFIX = "escalation"
+
+    def __init__(self, cache_dir: Path, roots: List[Path]):
+        self.roots = [root.resolve() for root in roots]
+        key = hashlib.sha256("\0".join(sorted(map(str, self.roots))).encode()).hexdigest()[:12]
+        self.index_path = cache_dir / f"{self.PREFIX}-{key}.json"
+        self.files: Dict[str, Dict] = {}
+        self.codes: Dict[str, Dict[str, int]] = {}
+        self.documented: Optional[Dict] = None
+        self.scanned = False  # Whether the roots have been walked into the index
+        self.dirty = False
+        try:
+            data = json.loads(self.index_path.read_text())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            self.files = data["files"]
+            self.codes = data["codes"]
+            self.documented = data.get("documented")
+            self.scanned = True
+
+    @staticmethod
+    def clear(cache_dir: Path) -> None:
+        """Delete every escalation index (all root sets)."""
+        for index_path in cache_dir.glob(f"{EscalationIndex.PREFIX}*.json"):
+            index_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _stamp(path: Path) -> Optional[List[int]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return [st.st_mtime_ns, st.st_size]
+
+    def _count(self, entry: Dict, delta: int) -> None:
+        feature = entry["feature"]
+        for code in entry["codes"]:
+            features = self.codes.setdefault(code, {})
+            features[feature] = features.get(feature, 0) + delta
+            if features[feature] <= 0:
+                del features[feature]
+                if not features:
+                    del self.codes[code]
+
+    def _forget(self, key: str) -> None:
+        entry = self.files.pop(key, None)
+        if entry is not None:
+            self._count(entry, -1)
+            self.dirty = True
+
+    def record(self, issues_file: Path, content: str) -> None:
+        """Note the codes in an .issues.md that was just written with `content`."""
+        resolved = issues_file.resolve()
+        if not any(root in resolved.parents for root in self.roots):
+            return  # Outside the trees this index covers
+        key = str(resolved)
+        self._forget(key)
+        stamp = self._stamp(issues_file)
+        if stamp is None:
+            return
+        entry = {
+            "stamp": stamp,
+            "feature": issues_file.parent.name,
+            "codes": sorted(set(_ISSUE_CODE_RE.findall(content))),
+        }
+        self.files[key] = entry
+        self._count(entry, 1)
+        self.dirty = True
+
+    def rebuild(self, issues_files: Iterable[Path]) -> int:
+        """Replace the index with the codes of `issues_files` (every one under the roots)."""
+        self.files = {}
+        self.codes = {}
+        count = 0
+        for issues_file in issues_files:
+            try:
+                self.record(issues_file, issues_file.read_text())
+            except OSError:
+                continue
+            count += 1
+        self.scanned = True
+        self.dirty = True
+        return count
+
+    def refresh(self) -> None:
+        """Re-read known files whose mtime/size changed; drop the ones that are gone."""
+        for key, entry in list(self.files.items()):
+            issues_file = Path(key)
+            stamp = self._stamp(issues_file)
+            if stamp == entry["stamp"]:
+                continue
+            if stamp is None:
+                self._forget(key)
+                continue
+            try:
+                self.record(issues_file, issues_file.read_text())
+            except OSError:
+                self._forget(key)
+
+    def occurrences(self) -> Dict[str, Set[str]]:
+        """Issue code -> features whose .issues.md files list it."""
+        return {code: set(features) for code, features in self.codes.items()}
+
+    def documented_codes(self, general_issues_path: Path,
+                         parse: Callable[[str], Set[str]]) -> Set[str]:
+        """parse(GENERAL_ISSUES.md text), re-run only when the file changed."""
+        stamp = self._stamp(general_issues_path)
+        if stamp is None:
+            return set()
+        cached = self.documented
+        if cached is not None and cached["path"] == str(general_issues_path) and cached["stamp"] == stamp:
+            return set(cached["codes"])
+        codes = parse(general_issues_path.read_text())
+        self.documented = {"path": str(general_issues_path), "stamp": stamp, "codes": sorted(codes)}
+        self.dirty = True
+        return codes
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        payload = {"version": self.VERSION, "files": self.files, "codes": self.codes,
+                   "documented": self.documented}
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload))
+            os.replace(tmp_path, self.index_path)
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: could not write escalation index: {e}", file=sys.stderr)
+
+
 class IssueLogger:
     """Logs validation issues to feature-specific .issues.md files.
 
@@ -1654,8 +2999,14 @@ class IssueLogger:
     when the same issue code appears in 2+ different features.
     """
 
-    def __init__(self, wireframes_dir: Path, extra_issue_roots: List[Path] = None):
+    def __init__(self, wireframes_dir: Path, extra_issue_roots: List[Path] = None,
+                 index: Optional[EscalationIndex] = None):
         self.wireframes_dir = wireframes_dir
+        # Optional persisted index of codes per .issues.md (see EscalationIndex)
+        self.index = index
+        # .issues.md files log_issues() rewrote vs found already up to date
+        self.written = 0
+        self.unchanged = 0
         # Extra roots to scan when looking for sibling *.issues.md files during
         # escalation checks. Used when wireframes live under multiple trees
         # (e.g. features/<cat>/<feat>/wireframes/ + the legacy docs tree).
@@ -1675,10 +3026,20 @@ class IssueLogger:
         svg_name = svg_path.stem  # e.g., "01-consent-modal-flow"
         return svg_path.parent / f"{svg_name}.issues.md"
 
-    def log_issues(self, svg_path: Path, issues: List[Issue]) -> None:
-        """Log issues to the feature-specific .issues.md file."""
+    def log_issues(self, svg_path: Path, issues: List[Issue], quiet: bool = False) -> bool:
+        """Log issues to the feature-specific .issues.md file.
+
+        The file is only rewritten when its issues changed: a re-run that
+        finds the same issues (on any day) leaves it, and its mtime, alone.
+        An Inspector Issues section from inspect-wireframes.py is carried
+        over, so the validate + inspect pair doesn't rewrite it either.
+        Returns whether the file was written.
+
+        `quiet` suppresses the "Issues logged to" line, for callers whose
+        stdout is machine-readable (--watch).
+        """
         if not issues:
-            return
+            return False
 
         issues_file = self.get_issues_file_path(svg_path)
         feature_name = svg_path.parent.name  # e.g., "002-cookie-consent"
@@ -1783,8 +3144,33 @@ class IssueLogger:
             "",
         ])
 
-        # Write file
-        issues_file.write_text("\n".join(lines))
+        content = "\n".join(lines)
+
+        try:
+            existing = issues_file.read_text()
+        except OSError:
+            existing = None
+        if existing is not None:
+            inspector = _INSPECTOR_SECTION_RE.search(existing)
+            if inspector:
+                content = content.rstrip() + "\n\n" + inspector.group()
+            # Same issues as at the last review: keep that review's date
+            review = _LAST_REVIEW_RE.search(existing)
+            if review and review.group(1) != today:
+                reviewed = review.group(1)
+                as_reviewed = (content
+                               .replace(f"**Last Review:** {today}", f"**Last Review:** {reviewed}")
+                               .replace(f"## Open Issues ({today} Review)", f"## Open Issues ({reviewed} Review)"))
+                if as_reviewed == existing:
+                    content = as_reviewed
+
+        written = write_if_changed(issues_file, content)
+        if self.index is not None:
+            self.index.record(issues_file, content)
+        if not written:
+            self.unchanged += 1
+            return False
+        self.written += 1
         # Best-effort relative path for display; fall back to absolute if the
         # issues file isn't under wireframes_dir (e.g. when validating SVGs
         # under features/<cat>/<feat>/wireframes/ with wireframes_dir pointing
@@ -1793,7 +3179,31 @@ class IssueLogger:
             display = issues_file.relative_to(self.wireframes_dir)
         except ValueError:
             display = issues_file
-        print(f"  Issues logged to: {display}")
+        if not quiet:
+            print(f"  Issues logged to: {display}")
+        return True
+
+    def _find_issues_files(self) -> List[Path]:
+        """Every feature .issues.md under the configured roots."""
+        seen_paths: Set[Path] = set()
+        issues_files: List[Path] = []
+        for root in [self.wireframes_dir, *self.extra_issue_roots]:
+            if not root.exists():
+                continue
+            for issues_file in root.glob("**/*.issues.md"):
+                if issues_file in seen_paths:
+                    continue
+                seen_paths.add(issues_file)
+                if issues_file.name == "GENERAL_ISSUES.md":
+                    continue
+                issues_files.append(issues_file)
+        return issues_files
+
+    def rebuild_index(self) -> int:
+        """Walk every root and rebuild the escalation index; returns files indexed."""
+        count = self.index.rebuild(self._find_issues_files())
+        self.index.save()
+        return count
 
     def check_escalation(self) -> Dict[str, List[str]]:
         """Check all .issues.md files for patterns that should escalate.
@@ -1806,25 +3216,23 @@ class IssueLogger:
         # Load already-documented codes from GENERAL_ISSUES.md
         documented_codes = self._get_documented_codes()
 
-        # Find all .issues.md files across every configured root
-        seen_paths: Set[Path] = set()
-        roots = [self.wireframes_dir, *self.extra_issue_roots]
-        for root in roots:
-            if not root.exists():
-                continue
-            for issues_file in root.glob("**/*.issues.md"):
-                if issues_file in seen_paths:
-                    continue
-                seen_paths.add(issues_file)
-                if issues_file.name == "GENERAL_ISSUES.md":
-                    continue
+        if self.index is not None:
+            # Answered from the index; only the first query walks the roots
+            if self.index.scanned:
+                self.index.refresh()
+            else:
+                self.index.rebuild(self._find_issues_files())
+            self.index.save()
+            pattern_occurrences = self.index.occurrences()
+        else:
+            for issues_file in self._find_issues_files():
                 feature = issues_file.parent.name
                 content = issues_file.read_text()
 
                 # Extract validator codes from the Code column (4th column)
                 # Codes look like: FONT-001, G-022, ANN-001, HDR-001, MODAL-001
                 # Using \d{3} to match 3-digit codes and avoid matching auto-generated IDs (F-01, S-01)
-                codes = re.findall(r'\| ([A-Z]+-\d{3}) \|', content)
+                codes = _ISSUE_CODE_RE.findall(content)
                 for code in codes:
                     if code not in pattern_occurrences:
                         pattern_occurrences[code] = set()
@@ -1842,15 +3250,24 @@ class IssueLogger:
     def _get_documented_codes(self) -> Set[str]:
         """Extract validator codes already documented in GENERAL_ISSUES.md.
 
-        Parses the history table for entries like "FONT-001 → G-010" and the
-        Validator Trigger sections for codes like "BTN-001 fires when...".
+        With an index, the parse is cached until GENERAL_ISSUES.md changes.
         """
-        documented = set()
+        if self.index is not None:
+            return self.index.documented_codes(self.general_issues_path, self._parse_documented_codes)
 
         if not self.general_issues_path.exists():
-            return documented
+            return set()
+
+        return self._parse_documented_codes(self.general_issues_path.read_text())
 
-        content = self.general_issues_path.read_text()
+    @staticmethod
+    def _parse_documented_codes(content: str) -> Set[str]:
+        """Codes named in GENERAL_ISSUES.md text.
+
+        Parses the history table for entries like "FONT-001 → G-010" and the
+        Validator Trigger sections for codes like "BTN-001 fires when...".
+        """
+        documented = set()
 
         # Pattern 1: History entries like "FONT-001 → G-010" or "validator: FONT-001"
         escalated = re.findall(r'([A-Z]+-\d{3})\s*[→→]', content)
@@ -1876,6 +3293,17 @@ class IssueLogger:
 # THEME ANALYSIS - Classify User Stories as Light (UX) or Dark (Backend)
 # ============================================================
 
+# Every keyword any theme rule looks for, deduplicated: each text is scanned
+# for the whole vocabulary once and the rules below test set membership.
+_THEME_VOCABULARY = tuple(dict.fromkeys(
+    STRONG_UX_KEYWORDS + STRONG_BACKEND_KEYWORDS + UX_KEYWORDS + BACKEND_KEYWORDS))
+
+
+def _theme_keywords_in(text: str) -> Set[str]:
+    """The theme keywords occurring in `text` (lowercased), as substrings."""
+    return {kw for kw in _THEME_VOCABULARY if kw in text}
+
+
 def classify_story(title: str, content: str) -> tuple:
     """Classify a user story as 'light' (UX) or 'dark' (backend).
 
@@ -1887,34 +3315,31 @@ def classify_story(title: str, content: str) -> tuple:
     3. Title keywords weighted 3x (title is authoritative)
     4. UX wins ties (if there's any UI, show it)
     """
-    title_lower = title.lower()
-    content_lower = content.lower()
+    in_title = _theme_keywords_in(title.lower())
+    in_body = _theme_keywords_in(content.lower())
 
     # Strong UX indicators - if in body, force light (these mean visible UI exists)
-    STRONG_UX = ['modal', 'toggle', 'warning', 'indicator', 'strength', 'meter',
-                 'feedback', 'i see', 'then i see', 'is warned', 'remember me']
-    for kw in STRONG_UX:
-        if kw in content_lower:
+    for kw in STRONG_UX_KEYWORDS:
+        if kw in in_body:
             return ('light', [kw])
 
     # Strong backend indicators - if in title AND no strong UX, force dark
-    STRONG_BACKEND = ['rls', 'isolation', 'csrf', 'oauth', 'pre-commit', 'secret detection', 'injection', 'sanitiz']
-    for kw in STRONG_BACKEND:
-        if kw in title_lower:
+    for kw in STRONG_BACKEND_KEYWORDS:
+        if kw in in_title:
             return ('dark', [kw])
 
     # Count matches with title weighting (3x for title)
-    ux_title = [kw for kw in UX_KEYWORDS if kw in title_lower]
-    ux_body = [kw for kw in UX_KEYWORDS if kw in content_lower]
-    backend_title = [kw for kw in BACKEND_KEYWORDS if kw in title_lower]
-    backend_body = [kw for kw in BACKEND_KEYWORDS if kw in content_lower]
+    ux_title = [kw for kw in UX_KEYWORDS if kw in in_title]
+    ux_body = [kw for kw in UX_KEYWORDS if kw in in_body]
+    backend_title = [kw for kw in BACKEND_KEYWORDS if kw in in_title]
+    backend_body = [kw for kw in BACKEND_KEYWORDS if kw in in_body]
 
     ux_score = len(ux_title) * 3 + len(ux_body)
     backend_score = len(backend_title) * 3 + len(backend_body)
 
-    # Collect matched keywords for reporting
-    ux_matches = list(set(ux_title + ux_body[:2]))[:3]
-    backend_matches = list(set(backend_title + backend_body[:2]))[:3]
+    # Collect matched keywords for reporting (deduplicated, first seen first)
+    ux_matches = list(dict.fromkeys(ux_title + ux_body[:2]))[:3]
+    backend_matches = list(dict.fromkeys(backend_title + backend_body[:2]))[:3]
 
     # UX wins ties (if there's any visible UI, show it)
     if ux_score >= backend_score:
@@ -2031,6 +3456,51 @@ def analyze_themes(spec_path: Path) -> dict:
     }
 
 
+def discover_specs(roots: List[Path]) -> List[Path]:
+    """Every feature spec.md under `roots` (what --analyze-themes --all reads), deduplicated."""
+    specs: Set[Path] = set()
+    for root in roots:
+        if root.exists():
+            specs.update(p for p in root.glob('**/spec.md') if 'templates' not in p.parts)
+    return sorted(specs)
+
+
+def analyze_all_themes(spec_paths: List[Path], jobs: int = 1,
+                       display: Callable[[Path], str] = str) -> dict:
+    """analyze_themes() for every spec in one run, as one report.
+
+    Specs are independent, so with jobs > 1 they are spread over a process
+    pool like validate_files() spreads SVGs; the report lists them in input
+    order either way, each tagged with its spec path.
+    """
+    if jobs <= 1 or len(spec_paths) <= 1:
+        results = list(map(analyze_themes, spec_paths))
+    else:
+        workers = min(jobs, len(spec_paths))
+        chunksize = max(1, len(spec_paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(analyze_themes, spec_paths, chunksize=chunksize))
+
+    features = [{"spec": display(spec_path), **result}
+                for spec_path, result in zip(spec_paths, results, strict=True)]
+    summaries = [f["summary"] for f in features if "summary" in f]
+    return {
+        "features": features,
+        "summary": {
+            "specs": len(features),
+            "errors": sum(1 for f in features if "error" in f),
+            "total": sum(s["total"] for s in summaries),
+            "light": sum(s["light"] for s in summaries),
+            "dark": sum(s["dark"] for s in summaries),
+        }
+    }
+
+
+def _emit_jsonl(record: Dict) -> None:
+    """Write one JSON-lines record and flush, so consumers see it immediately."""
+    print(json.dumps(record), flush=True)
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python validate-wireframe.py <svg-file-or-dir>")
@@ -2039,23 +3509,84 @@ def main():
         print("       python validate-wireframe.py --all --summary")
         print("       python validate-wireframe.py --check-escalation")
         print("       python validate-wireframe.py --analyze-themes <spec.md>")
+        print("       python validate-wireframe.py --analyze-themes --all")
         print("")
         print("Options:")
         print("  --json      Output validation results as JSON (for CI parsing)")
         print("  --summary   Output one-line pass/fail summary (for PR comments)")
+        print("  --jsonl     Stream JSON lines: one per issue, one per file, then totals")
+        print("  --jobs N    Validate files in N worker processes (default: CPU count)")
+        print("  --no-cache  Re-validate every file, ignoring cached results")
+        print("  --clear-cache  Delete cached results before running")
+        print("  --rebuild-index  Rebuild the escalation index from every .issues.md")
+        print("  --rules A,B       Only run these rules (names or codes, e.g. colors,MODAL-001)")
+        print("  --skip-rules A,B  Run every rule except these")
+        print("  --list-rules      List rule names and the codes they report")
+        print("  --profile         Report time and hits per rule (on stderr)")
+        print("  --stream          Read element geometry with iterparse instead of building the tree")
+        print("  --watch           Revalidate SVGs as they are saved; JSON line per file")
+        print("  --changed-since REF  Only validate SVGs changed since git REF (and users of changed includes)")
+        print("  --serve           Run a warm validator daemon on a Unix socket until stopped")
+        print("  --client FILE...  Validate through the daemon ('-' reads an SVG from stdin; --status, --stop)")
+        print("  --socket PATH     Daemon socket (default: <project>/.cache/wireframe-validate/daemon.sock)")
         sys.exit(1)
 
     # Parse output format flags
     output_json = '--json' in sys.argv
     output_summary = '--summary' in sys.argv
+    output_jsonl = '--jsonl' in sys.argv
+    # Human-readable progress only when stdout isn't meant for a parser
+    verbose = not (output_json or output_summary or output_jsonl)
+    use_cache = '--no-cache' not in sys.argv
+    clear_cache = '--clear-cache' in sys.argv
+    rebuild_index = '--rebuild-index' in sys.argv
+    profile = RuleProfile() if '--profile' in sys.argv else None
+    stream = '--stream' in sys.argv
+
+    if '--list-rules' in sys.argv:
+        for rule in RULES:
+            print(f"  {rule.name:<28} {', '.join(rule.codes):<40} {rule.description}")
+        sys.exit(0)
 
-    # Collect --root overrides (repeatable) before stripping flags
+    # Collect --root overrides (repeatable), --jobs and rule selection
+    # before stripping flags
     explicit_roots: List[Path] = []
+    jobs = os.cpu_count() or 1
+    only_rules: List[str] = []
+    skip_rules: List[str] = []
+    changed_since: Optional[str] = None
+    socket_path: Optional[Path] = None
     raw_argv = sys.argv[1:]
     i = 0
     filtered_argv: List[str] = []
     while i < len(raw_argv):
         a = raw_argv[i]
+        flag, has_value, value = a.partition('=')
+        if flag in ('--jobs', '--rules', '--skip-rules', '--changed-since', '--socket'):
+            if not has_value:
+                if i + 1 >= len(raw_argv):
+                    print(f"ERROR: {flag} requires a value")
+                    sys.exit(1)
+                value = raw_argv[i + 1]
+                i += 1
+            i += 1
+            if flag == '--jobs':
+                try:
+                    jobs = int(value)
+                except ValueError:
+                    print(f"ERROR: --jobs expects an integer, got '{value}'")
+                    sys.exit(1)
+                if jobs < 1:
+                    print("ERROR: --jobs must be at least 1")
+                    sys.exit(1)
+            elif flag == '--changed-since':
+                changed_since = value
+            elif flag == '--socket':
+                socket_path = Path(value).resolve()
+            else:
+                names = [n.strip() for n in value.split(',') if n.strip()]
+                (only_rules if flag == '--rules' else skip_rules).extend(names)
+            continue
         if a == '--root':
             if i + 1 < len(raw_argv):
                 explicit_roots.append(Path(raw_argv[i + 1]).resolve())
@@ -2070,7 +3601,20 @@ def main():
         filtered_argv.append(a)
         i += 1
 
-    args = [a for a in filtered_argv if a not in ('--json', '--summary')]
+    args = [a for a in filtered_argv
+            if a not in ('--json', '--jsonl', '--summary', '--no-cache', '--clear-cache', '--profile',
+                         '--rebuild-index', '--stream')]
+
+    try:
+        rules = select_rules(only_rules, skip_rules)
+    except ValueError as e:
+        print(f"ERROR: {e} (see --list-rules)")
+        sys.exit(1)
+    # A partial run says nothing about the skipped rules, so its results
+    # must not land in the cache or overwrite a file's .issues.md.
+    partial_run = len(rules) < len(RULES)
+    if partial_run:
+        use_cache = False
 
     # Auto-detect project root by walking up from the validator's own dir
     # until we find a wireframes-bearing tree. Two canonical locations are
@@ -2110,21 +3654,97 @@ def main():
         primary_root = script_dir
         extra_roots = []
 
+    # Result cache and escalation index live with the other tool caches
+    # under <project>/.cache/
+    cache_dir = project_root / '.cache' / 'wireframe-validate'
+    if socket_path is None:
+        socket_path = cache_dir / DAEMON_SOCKET_NAME
+    if args and args[0] in ('--serve', '--client') and not hasattr(socket, 'AF_UNIX'):
+        print(f"ERROR: {args[0]} needs Unix domain sockets, which this platform lacks")
+        sys.exit(1)
+
+    # The client needs nothing below: the daemon already holds it all
+    if args and args[0] == '--client':
+        if len(args) < 2:
+            print("ERROR: --client requires SVG paths, '-' for stdin, --status or --stop")
+            sys.exit(1)
+        sys.exit(run_client(socket_path, args[1:]))
+
+    # Parsed-SVG landmarks and conventions shared with inspect-wireframes.py
+    model_cache = DocumentCache(project_root / '.cache' / 'svg-model')
+    if clear_cache:
+        cleared = ResultCache.clear(cache_dir)
+        EscalationIndex.clear(cache_dir)
+        model_cache.clear()
+        if not args:
+            print(f"Cleared {cleared} cached validation results")
+            sys.exit(0)
+
     wireframes_dir = primary_root
-    logger = IssueLogger(wireframes_dir, extra_issue_roots=extra_roots)
+    # Built even with --no-cache: it only stays complete if every .issues.md
+    # this tool writes is recorded in it. --no-cache skips the result and
+    # model caches only.
+    index = EscalationIndex(cache_dir, [wireframes_dir, *extra_roots])
+    logger = IssueLogger(wireframes_dir, extra_issue_roots=extra_roots, index=index)
+
+    if rebuild_index:
+        count = logger.rebuild_index()
+        if not args:
+            print(f"Rebuilt escalation index from {count} .issues.md files")
+            sys.exit(0)
+
+    # --changed-since narrows an --all run, so it implies one
+    if changed_since is not None:
+        if args and args[0] != '--all':
+            print("ERROR: --changed-since selects files itself; combine it with --all or nothing")
+            sys.exit(1)
+        args = args or ['--all']
 
     # Ensure we have at least one argument after flag removal
     if not args:
         print("ERROR: No input specified. Use --all or provide an SVG path.")
         sys.exit(1)
 
+    def _display_path(p: Path) -> str:
+        """Prefer project-root-relative display; fall back to absolute path."""
+        for root in (project_root, wireframes_dir, *extra_roots):
+            try:
+                return str(p.relative_to(root))
+            except ValueError:
+                continue
+        return str(p)
+
+    # Handle watch mode: stays up until interrupted
+    if args[0] == '--watch':
+        watch([wireframes_dir, *extra_roots], logger, _display_path,
+              rules=rules, log=not partial_run)
+        sys.exit(0)
+
+    # Handle daemon mode: serves --client requests until stopped
+    if args[0] == '--serve':
+        daemon = ValidatorDaemon(socket_path, logger, _display_path,
+                                 ResultCache(cache_dir, _ruleset_hash()) if use_cache else None,
+                                 model_cache if use_cache else None,
+                                 rules=rules, log=not partial_run, stream=stream)
+        try:
+            daemon.serve()
+        except (RuntimeError, OSError) as e:
+            print(f"ERROR: --serve: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
     # Handle theme analysis mode
     if args[0] == '--analyze-themes':
         if len(args) < 2:
-            print("ERROR: --analyze-themes requires a spec.md path")
+            print("ERROR: --analyze-themes requires a spec.md path (or --all)")
             print("Usage: python validate-wireframe.py --analyze-themes features/.../spec.md")
             sys.exit(1)
 
+        if args[1] == '--all':
+            specs = discover_specs([wireframes_dir, *extra_roots])
+            print(json.dumps(analyze_all_themes(specs, jobs, _display_path), indent=2))
+            sys.exit(0)
+
         spec_path = Path(args[1])
         if not spec_path.is_absolute():
             # Try relative to wireframes dir, then cwd
@@ -2168,19 +3788,18 @@ def main():
         # checked. `wireframes_dir` is the primary; extras come from Phase 2
         # auto-detect or explicit --root flags.
         all_roots = [wireframes_dir, *extra_roots]
-        svg_files: List[Path] = []
-        seen_svg_paths: Set[Path] = set()
-        for root in all_roots:
-            if not root.exists():
-                continue
-            for svg in root.glob('**/*.svg'):
-                if svg in seen_svg_paths:
-                    continue
-                seen_svg_paths.add(svg)
-                # Exclude includes/ (reusable components) and templates/
-                if 'includes' in str(svg) or 'templates' in str(svg):
-                    continue
-                svg_files.append(svg)
+        svg_files = discover_svgs(all_roots)
+        if changed_since is not None:
+            try:
+                changed = git_changed_files(changed_since, wireframes_dir)
+            except RuntimeError as e:
+                print(f"ERROR: --changed-since {changed_since}: {e}")
+                sys.exit(1)
+            candidates = len(svg_files)
+            svg_files = select_changed(svg_files, changed)
+            if verbose:
+                print(f"{len(svg_files)} of {candidates} wireframes changed since {changed_since} "
+                      f"(including users of changed includes)")
     else:
         # Accept (in order): absolute path, cwd-relative path, then fall back
         # to the legacy `wireframes_dir / arg` pattern for backward compat.
@@ -2205,41 +3824,36 @@ def main():
     failed_files = 0
     all_issues: List[Dict] = []  # For JSON output
 
-    def _display_path(p: Path) -> str:
-        """Prefer project-root-relative display; fall back to absolute path."""
-        for root in (project_root, wireframes_dir, *extra_roots):
-            try:
-                return str(p.relative_to(root))
-            except ValueError:
-                continue
-        return str(p)
+    cache = ResultCache(cache_dir, _ruleset_hash()) if use_cache else None
+    if cache is not None and args[0] == '--all' and changed_since is None:
+        # A full run sees every SVG, so anything else in the cache is stale.
+        cache.prune(svg_files, all_roots)
 
-    for svg_file in svg_files:
-        if not output_json and not output_summary:
+    for svg_file, issues in validate_files(svg_files, jobs, cache, rules, profile,
+                                           model_cache if use_cache else None, stream):
+        if verbose:
             print(f"\n{'='*60}")
             print(f"Validating: {_display_path(svg_file)}")
             print('='*60)
 
-        validator = WireframeValidator(svg_file)
-        issues = validator.validate()
-
         errors = [i for i in issues if i.severity == "ERROR"]
 
         if not issues:
             passed_files += 1
-            if not output_json and not output_summary:
+            if verbose:
                 print("PASS - No issues found")
         else:
             failed_files += 1
-            if not output_json and not output_summary:
+            if verbose:
                 for issue in issues:
                     line_info = f" (line {issue.line})" if issue.line else ""
                     print(f"  ERROR [{issue.code}]{line_info}: {issue.message}")
 
                 print(f"\n  {len(errors)} errors")
 
-            # Auto-log issues to feature-specific file (unless JSON/summary mode)
-            if not output_json and not output_summary:
+            # Auto-log issues to feature-specific file (unless JSON/summary
+            # output, or only some rules ran)
+            if verbose and not partial_run:
                 logger.log_issues(svg_file, issues)
 
             # Collect issues for JSON output
@@ -2253,8 +3867,28 @@ def main():
                         "line": issue.line
                     })
 
+        # Stream records as each file completes
+        if output_jsonl:
+            display = _display_path(svg_file)
+            for issue in issues:
+                _emit_jsonl({"event": "issue", "file": display, "severity": issue.severity,
+                             "code": issue.code, "message": issue.message, "line": issue.line})
+            _emit_jsonl({"event": "file", "file": display, "passed": not issues,
+                         "issues": len(issues), "errors": len(errors)})
+
         total_errors += len(errors)
 
+    if cache is not None:
+        cache.save()
+        if args[0] == '--all' and changed_since is None:
+            # Landmarks are keyed by content alone; keep those of any SVG the
+            # result cache still knows (other --root trees included).
+            model_cache.prune(entry["sha256"] for entry in cache.entries.values())
+    if index is not None:
+        index.save()
+    if profile is not None:
+        profile.report(len(svg_files))
+
     # Output results based on format
     if output_json:
         # JSON output for CI parsing
@@ -2266,6 +3900,16 @@ def main():
             "issues": all_issues
         }
         print(json.dumps(result, indent=2))
+    elif output_jsonl:
+        # Closing record carries the numbers --summary reports
+        _emit_jsonl({
+            "event": "totals",
+            "status": "PASS" if total_errors == 0 else "FAIL",
+            "passed": passed_files,
+            "failed": failed_files,
+            "total_files": len(svg_files),
+            "total_issues": total_errors,
+        })
     elif output_summary:
         # One-line summary for PR comments
         status = "PASS" if total_errors == 0 else "FAIL"
@@ -2274,6 +3918,8 @@ def main():
         # Standard verbose output
         print(f"\n{'='*60}")
         print(f"TOTAL: {total_errors} errors across {len(svg_files)} files")
+        if logger.written or logger.unchanged:
+            print(f"Issues files: {logger.written} written, {logger.unchanged} already up to date")
 
         if total_errors > 0:
             print("STATUS: FAIL")
@@ -0,0 +1,135 @@
+"""
+Review status of wireframes, shared by the manifest and anything reporting on it.
+
+generate-manifest.py can't be imported (hyphenated name), so the status
+rules live here for any tool that needs them:
+
+read_mockup_block / detect_status: one wireframe's status from its
+    feature's spec.md sign-off and its sibling .issues.md.
+status_from_issues: the .issues.md half of that, for content already read.
+status_index: counts per status overall, per category and per feature,
+    from a manifest's `features` list. generate-manifest.py embeds it in
+    every manifest as `status_index`, so dashboards read one small object
+    instead of re-scanning the issue files.
+"""
+
+import io
+import re
+from pathlib import Path
+
+# Every status detect_status() returns, strongest signal first.
+STATUSES = ("approved", "needs-regen", "needs-patch", "clean", "draft")
+
+_UI_MOCKUP_RE = re.compile(r'(?ms)^##\s+UI\s+Mockup\s*\n(.*?)(?=^##\s|\Z)')
+_STATUS_HEADER_RE = re.compile(r'^\*\*Status:\*\*\s*(\w+)', re.MULTILINE)
+_CLASSIFICATION_RE = re.compile(r'\|\s*(PATCH|REGEN(?:ERATE)?)\s*\|')
+_OPEN_COUNT_RE = re.compile(r'\|\s*Open\s*\|\s*(\d+)\s*\|')
+_HEADER_STATUSES = {
+    "PASS": "clean",
+    "PATCH": "needs-patch",
+    "REGENERATE": "needs-regen",
+    "REGEN": "needs-regen",
+}
+
+
+def read_mockup_block(feature_dir: Path, data: bytes | None = None) -> str:
+    """The `## UI Mockup` section of the feature's spec.md ("" if none).
+
+    Taken from `data` (spec.md's bytes) when the caller already read it.
+    """
+    try:
+        if data is not None:
+            spec_content = io.TextIOWrapper(io.BytesIO(data), errors="ignore").read()
+        else:
+            spec_content = (feature_dir / "spec.md").read_text(errors="ignore")
+    except OSError:
+        return ""
+    # Capture the ## UI Mockup section up to the next ## heading.
+    mockup_match = _UI_MOCKUP_RE.search(spec_content)
+    return mockup_match.group(1) if mockup_match else ""
+
+
+def status_from_issues(content: str) -> str:
+    """Review status recorded in the text of an .issues.md file."""
+    # Two formats coexist:
+    #
+    # New (extension): single `**Status:** PASS|PATCH|REGENERATE` header line.
+    new_fmt = _STATUS_HEADER_RE.search(content)
+    if new_fmt:
+        return _HEADER_STATUSES.get(new_fmt.group(1).upper(), "draft")
+
+    # Legacy (homegrown): markdown table with a Classification column whose
+    # values are PATCH / REGENERATE per row. Plus an Open count summary.
+    classifications = _CLASSIFICATION_RE.findall(content)
+    if classifications:
+        if any("REGEN" in c for c in classifications):
+            return "needs-regen"
+        return "needs-patch"
+
+    # No classification rows. Look for explicit open-count signal.
+    open_match = _OPEN_COUNT_RE.search(content)
+    if open_match and open_match.group(1) == "0":
+        return "clean"
+
+    # File exists but format unrecognized — treat as draft (not yet reviewed).
+    return "draft"
+
+
+def detect_status(svg_path: Path, feature_dir: Path | None = None,
+                  mockup_block: str | None = None) -> str:
+    """Derive review status from spec.md sign-off + sibling .issues.md file.
+
+    `mockup_block` is the feature's read_mockup_block(), so a caller going
+    through a whole feature reads its spec.md once rather than per SVG.
+
+    Returns one of:
+      approved     - feature's spec.md ## UI Mockup block lists this SVG
+      needs-regen  - .issues.md has at least one REGENERATE classification
+      needs-patch  - .issues.md has only PATCH-class issues (cosmetic)
+      clean        - .issues.md exists, says zero open issues (validator clean)
+      draft        - never validated/reviewed (no .issues.md, no sign-off)
+    """
+    # 1. Spec sign-off — strongest signal. Searches for `## UI Mockup` block
+    #    in the feature's spec.md and checks whether the SVG basename appears.
+    if mockup_block is None and feature_dir is not None:
+        mockup_block = read_mockup_block(feature_dir)
+    if mockup_block and svg_path.name in mockup_block:
+        return "approved"
+
+    # 2. Sibling .issues.md — historical review record.
+    try:
+        content = svg_path.with_suffix(".issues.md").read_text(errors="ignore")
+    except OSError:  # Usually not there: never validated/reviewed
+        return "draft"
+    return status_from_issues(content)
+
+
+def _empty_counts() -> dict[str, int]:
+    return dict.fromkeys(STATUSES, 0)
+
+
+def status_index(features: list[dict]) -> dict:
+    """Counts of each status overall, per category and per feature.
+
+    `features` is a manifest's `features` list (each with id, category and
+    wireframes[].status). Every count map lists all of STATUSES, zeros
+    included, so readers can index it without checking for missing keys.
+    Categories and features keep manifest order.
+    """
+    counts = _empty_counts()
+    by_category: dict[str, dict[str, int]] = {}
+    by_feature: dict[str, dict[str, int]] = {}
+    for feature in features:
+        category_counts = by_category.setdefault(feature.get("category", ""), _empty_counts())
+        feature_counts = by_feature[feature["id"]] = _empty_counts()
+        for wireframe in feature["wireframes"]:
+            status = wireframe["status"]
+            counts[status] = counts.get(status, 0) + 1
+            category_counts[status] = category_counts.get(status, 0) + 1
+            feature_counts[status] = feature_counts.get(status, 0) + 1
+    return {
+        "statuses": list(STATUSES),
+        "counts": counts,
+        "by_category": by_category,
+        "by_feature": by_feature,
+    }